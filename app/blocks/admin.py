@@ -1,7 +1,9 @@
-from django.contrib import admin
-from django.utils.html import mark_safe
+from django.contrib import admin, messages
+from django.utils.html import format_html_join, mark_safe
 import json
-from .models import Block
+from .models import Block, BuildOrder
+from .recipe_graph import get_recipe_graph
+from .validators import validate_components_many
 
 
 @admin.register(Block)
@@ -21,6 +23,7 @@ class BlockAdmin(admin.ModelAdmin):
     )
     search_fields = ('name', 'description', 'consumer_type', 'producer_type')
     list_filter = ('consumer_type', 'producer_type', 'created_at', 'updated_at')
+    actions = ['validate_selected']
     readonly_fields = (
         'block_id',
         'created_at',
@@ -94,21 +97,18 @@ class BlockAdmin(admin.ModelAdmin):
     
     def component_objects(self, obj):
         """Display component names referenced in components."""
-        components = obj.get_component_objects()
-        if not components:
+        graph = get_recipe_graph()
+        rows = [
+            (graph.component_name(comp_id), quantity)
+            for comp_id, quantity in (obj.components or {}).items()
+            if graph.component_name(comp_id) is not None
+        ]
+        if not rows:
             return mark_safe('<em>No components referenced</em>')
         
-        # Create lookup dict for quantities
-        quantity_map = {item['component_id']: item['quantity'] for item in obj.components}
-        
-        component_list = '<br>'.join([
-            '<strong>{}</strong>: {} units'.format(
-                comp.name,
-                quantity_map.get(str(comp.component_id), 0)
-            )
-            for comp in components
-        ])
-        return mark_safe(component_list)
+        return format_html_join(
+            mark_safe('<br>'), '<strong>{}</strong>: {} units', rows
+        )
     component_objects.short_description = 'Referenced Components'
     
     def consumer_info(self, obj):
@@ -168,4 +168,49 @@ class BlockAdmin(admin.ModelAdmin):
                 '<span style="color: red; font-weight: bold;">✗ Invalid</span><br>' +
                 error_text
             )
-    validation_status.short_description = 'Validation Status'
\ No newline at end of file
+    validation_status.short_description = 'Validation Status'
+    
+    @admin.action(description='Validate selected blocks')
+    def validate_selected(self, request, queryset):
+        """Validate every selected block with one Component query in total."""
+        blocks = list(queryset)
+        results = validate_components_many(block.components for block in blocks)
+        invalid = []
+        for block, (components_valid, _) in zip(blocks, results):
+            if not (components_valid and block.validate_consumer()[0] and block.validate_producer()[0]):
+                invalid.append(block.name)
+        if invalid:
+            self.message_user(
+                request,
+                f"{len(invalid)} of {len(blocks)} blocks failed validation: {', '.join(invalid)}",
+                messages.ERROR,
+            )
+        else:
+            self.message_user(request, f"All {len(blocks)} blocks are valid.")
+
+
+@admin.register(BuildOrder)
+class BuildOrderAdmin(admin.ModelAdmin):
+    """
+    Admin interface configuration for BuildOrder model.
+    """
+    list_display = ('name', 'line_count', 'created_at', 'updated_at')
+    search_fields = ('name',)
+    list_filter = ('created_at', 'updated_at')
+    readonly_fields = ('order_id', 'created_at', 'updated_at')
+    
+    fieldsets = (
+        ('Basic Information', {
+            'fields': ('name', 'blocks'),
+            'description': 'Define blocks as JSON: [{"block_id": "uuid", "quantity": int}, ...]'
+        }),
+        ('System Information', {
+            'fields': ('order_id', 'created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    )
+    
+    def line_count(self, obj):
+        """Display number of block lines in list view."""
+        return len(obj.blocks or [])
+    line_count.short_description = 'Lines'
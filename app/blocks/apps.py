@@ -1,5 +1,11 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class BlocksConfig(AppConfig):
     name = 'blocks'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .search import build_search_indexes
+        post_migrate.connect(build_search_indexes, sender=self)
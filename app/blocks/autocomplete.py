@@ -0,0 +1,117 @@
+"""
+In-process typeahead index over catalog names.
+
+One ``NameIndex`` per catalog table (ore, component, block) hangs off the
+compiled recipe graph (``RecipeGraph.name_index``), so it is built once per
+catalog version from names already in memory and never queries the database.
+
+Matches are ranked in three tiers:
+
+1. the name starts with the query ("steel p" → "Steel Plate");
+2. a later word of the name starts with the query ("plate" → "Steel Plate");
+3. typo-tolerant trigram similarity ("platw" → "Steel Plate").
+
+Prefix tiers are binary searches over sorted keys; the trigram tier only
+runs when the first two leave fewer than ``limit`` results.
+"""
+from bisect import bisect_left
+from collections import defaultdict
+
+from .search import MIN_WORD_SIMILARITY, trigrams, word_similarity
+
+# Default and maximum number of suggestions per request
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+KINDS = ('ore', 'component', 'block')
+
+
+class NameIndex:
+    """
+    Prefix and trigram index over one table's names.
+
+    Args:
+        ids: Primary key strings, parallel to ``names``
+        names: Display names
+    """
+
+    def __init__(self, ids, names):
+        self.ids = ids
+        self.names = names
+
+        # Sorted (lower-cased text from each word start to the end of the
+        # name, is-later-word flag, position); whole names sort as tier 1
+        suffixes = []
+        self._grams = defaultdict(list)
+        for position, name in enumerate(names):
+            lowered = name.lower()
+            start = 0
+            for word in lowered.split():
+                start = lowered.index(word, start)
+                suffixes.append((lowered[start:], start > 0, position))
+                start += len(word)
+            for gram in trigrams(lowered):
+                self._grams[gram].append(position)
+        suffixes.sort()
+        self._keys = [key for key, _, _ in suffixes]
+        self._entries = [(later_word, position) for _, later_word, position in suffixes]
+
+    def __len__(self):
+        return len(self.names)
+
+    def _prefix_matches(self, prefix, limit):
+        """
+        Positions whose name (tier 1) or a later word (tier 2) starts with
+        ``prefix``, each in name order; stops once tier 1 alone fills ``limit``.
+        """
+        whole, words = [], []
+        start = bisect_left(self._keys, prefix)
+        for key, (later_word, position) in zip(self._keys[start:], self._entries[start:]):
+            if not key.startswith(prefix) or len(whole) >= limit:
+                break
+            if later_word:
+                if len(words) < limit:
+                    words.append(position)
+            else:
+                whole.append(position)
+        words.sort(key=self.names.__getitem__)
+        return whole, words
+
+    def _fuzzy_matches(self, text):
+        """Positions sharing trigrams with ``text``, by mean word similarity."""
+        query_words = text.split()
+        candidates = set()
+        for gram in trigrams(text):
+            candidates.update(self._grams.get(gram, ()))
+        scored = []
+        for position in candidates:
+            name_words = set(self.names[position].lower().split())
+            score = sum(word_similarity(word, name_words) for word in query_words) / len(query_words)
+            if score >= MIN_WORD_SIMILARITY:
+                # Ties go to the shorter (closer) name
+                scored.append((-score, len(self.names[position]), self.names[position], position))
+        scored.sort()
+        return [entry[-1] for entry in scored]
+
+    def search(self, text, limit=DEFAULT_LIMIT):
+        """
+        Top matches for a partial name.
+
+        Args:
+            text: What the user has typed so far
+            limit: Maximum number of results
+
+        Returns:
+            list: [{'id': pk string, 'name': str}] best match first
+        """
+        text = ' '.join(text.lower().split())
+        if not text or limit <= 0:
+            return []
+
+        whole, words = self._prefix_matches(text, limit)
+        ranked = list(dict.fromkeys(whole + words))
+        if len(ranked) < limit:
+            seen = set(ranked)
+            ranked += [p for p in self._fuzzy_matches(text) if p not in seen]
+
+        return [{'id': self.ids[p], 'name': self.names[p]} for p in ranked[:limit]]
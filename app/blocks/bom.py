@@ -0,0 +1,165 @@
+"""
+Bill-of-materials matrices for batch Block → Component → Ore expansion.
+
+Built from the compiled recipe graph (``blocks.recipe_graph``):
+
+- ``block_components``: sparse blocks × components quantity matrix
+  (from ``Block.components``)
+- ``component_ores``: sparse components × ores quantity matrix
+  (from ``Component.materials``)
+
+For a vector ``q`` of block quantities, component totals are ``q @ B`` and ore
+totals are ``(q @ B) @ M``, each a single vectorised NumPy pass regardless of
+how many block lines the build order has.
+"""
+import threading
+
+import numpy as np
+
+from .recipe_graph import get_recipe_graph
+
+_bom = None
+_bom_lock = threading.Lock()
+
+
+class SparseMatrix:
+    """
+    Minimal compressed-sparse-row matrix.
+
+    Only supports left multiplication by a dense row vector, which is the one
+    product the bill of materials needs.
+    """
+
+    def __init__(self, rows, n_cols):
+        """
+        Args:
+            rows: Sequence of rows, each a sequence of (column, value) pairs
+            n_cols: Number of columns
+        """
+        counts = [len(row) for row in rows]
+        self.shape = (len(rows), n_cols)
+        self.indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.indptr[1:])
+        self.indices = np.fromiter(
+            (col for row in rows for col, _ in row), dtype=np.int64, count=self.indptr[-1]
+        )
+        self.data = np.fromiter(
+            (value for row in rows for _, value in row), dtype=np.float64, count=self.indptr[-1]
+        )
+        self._row_lengths = np.diff(self.indptr)
+
+    @property
+    def nnz(self):
+        """Number of stored entries."""
+        return len(self.data)
+
+    def rmatvec(self, vector):
+        """Return ``vector @ self`` as a dense array of length ``n_cols``."""
+        weights = self.data * np.repeat(vector, self._row_lengths)
+        return np.bincount(self.indices, weights=weights, minlength=self.shape[1])
+
+
+class BillOfMaterials:
+    """
+    Dense per-item attributes plus the two sparse recipe matrices.
+
+    Row/column positions match the indices of the RecipeGraph it was built
+    from, so ``graph.block_index`` etc. translate UUIDs to vector positions.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.version = graph.version
+
+        self.block_components = SparseMatrix(graph.block_components, len(graph.component_ids))
+        self.component_ores = SparseMatrix(graph.component_materials, len(graph.ore_ids))
+
+        self.block_masses = np.asarray(graph.block_masses, dtype=np.float64)
+        self.component_masses = np.asarray(graph.component_masses, dtype=np.float64)
+        self.component_crafting_times = np.asarray(graph.component_crafting_times, dtype=np.float64)
+        self.ore_masses = np.asarray(graph.ore_masses, dtype=np.float64)
+
+        self.fabricator_types = sorted(set(graph.component_fabricators))
+        fabricator_codes = {name: code for code, name in enumerate(self.fabricator_types)}
+        self.component_fabricator_codes = np.fromiter(
+            (fabricator_codes[name] for name in graph.component_fabricators),
+            dtype=np.int64,
+            count=len(graph.component_fabricators),
+        )
+
+    # ---- Vector construction ----
+
+    def block_vector(self, blocks_list):
+        """
+        Build a dense block-quantity vector from build-order lines.
+
+        Args:
+            blocks_list: Iterable of {"block_id": uuid, "quantity": number}.
+                Lines for blocks missing from the catalog are ignored.
+
+        Returns:
+            numpy.ndarray: Quantity per block position
+        """
+        index = self.graph.block_index
+        positions = []
+        quantities = []
+        for line in blocks_list:
+            position = index.get(str(line.get('block_id')))
+            if position is not None:
+                positions.append(position)
+                quantities.append(line.get('quantity', 0))
+        vector = np.zeros(len(self.graph.block_ids), dtype=np.float64)
+        np.add.at(vector, np.asarray(positions, dtype=np.int64), np.asarray(quantities, dtype=np.float64))
+        return vector
+
+    def component_vector(self, components):
+        """Build a dense component-quantity vector from a {component_id: quantity} map."""
+        index = self.graph.component_index
+        vector = np.zeros(len(self.graph.component_ids), dtype=np.float64)
+        for comp_id, quantity in (components or {}).items():
+            position = index.get(str(comp_id))
+            if position is not None:
+                vector[position] += quantity
+        return vector
+
+    # ---- Products ----
+
+    def component_totals(self, block_vector):
+        """Component quantities required by a block-quantity vector."""
+        return self.block_components.rmatvec(block_vector)
+
+    def ore_totals(self, component_vector):
+        """Ore quantities required by a component-quantity vector."""
+        return self.component_ores.rmatvec(component_vector)
+
+    def fabricator_times(self, component_vector):
+        """Total crafting seconds per fabricator type, aligned with ``fabricator_types``."""
+        return np.bincount(
+            self.component_fabricator_codes,
+            weights=component_vector * self.component_crafting_times,
+            minlength=len(self.fabricator_types),
+        )
+
+    # ---- Vector → dict ----
+
+    @staticmethod
+    def to_dict(vector, ids):
+        """Map non-zero vector entries back to {uuid: quantity}."""
+        return {ids[position]: float(vector[position]) for position in np.flatnonzero(vector)}
+
+
+def get_bill_of_materials():
+    """Return the bill of materials for the current recipe graph, rebuilding if it moved."""
+    global _bom
+
+    graph = get_recipe_graph()
+    bom = _bom
+    if bom is not None and bom.graph is graph:
+        return bom
+
+    with _bom_lock:
+        bom = _bom
+        if bom is None or bom.graph is not graph:
+            bom = BillOfMaterials(graph)
+            _bom = bom
+    return bom
@@ -0,0 +1,420 @@
+"""
+Build order calculation helpers (Phase 3).
+
+Implements the calculation functions listed in
+``docs/projectPlan/phase3_buildorder.md``:
+
+- ``calculate_*`` functions run as sparse matrix products against the bill of
+  materials (``blocks.bom``), so cost is independent of how the totals are
+  split across build-order lines.
+- ``BuildOrderCalculator`` reads straight from the database and resolves a
+  whole order in one batched ``__in`` query per table, whatever its size.
+- ``calculate_*_sql`` functions aggregate in the database with a single
+  JOIN + GROUP BY over the BlockComponent/ComponentMaterial link tables.
+- ``calculate_plan`` resolves lines by block ID or name and returns the same
+  totals as ``BuildOrderCalculator`` from the bill of materials (no queries
+  while the recipe graph is current); it backs the batch calculation API.
+
+``blocks_list`` arguments use the BuildOrder format:
+    [{"block_id": "uuid", "quantity": int}, ...]
+"""
+import logging
+import math
+import uuid
+from collections import defaultdict
+
+import numpy as np
+from django.db import connection
+from django.db.models import F, Sum
+
+from components.models import Component
+from ores.models import Ore
+from .bom import get_bill_of_materials
+from .models import Block, BlockComponent
+
+logger = logging.getLogger(__name__)
+
+
+def calculate_total_mass(blocks_list):
+    """
+    Total mass of all blocks in the list.
+
+    Returns:
+        float: Sum of block mass × quantity in kg
+    """
+    bom = get_bill_of_materials()
+    return float(bom.block_vector(blocks_list) @ bom.block_masses)
+
+
+def calculate_required_components(blocks_list):
+    """
+    Aggregate component quantities across all blocks in the list.
+
+    Returns:
+        dict: {component_id: quantity}
+    """
+    bom = get_bill_of_materials()
+    totals = bom.component_totals(bom.block_vector(blocks_list))
+    return bom.to_dict(totals, bom.graph.component_ids)
+
+
+def calculate_required_ores(components_list):
+    """
+    Aggregate ore quantities for a set of components.
+
+    Args:
+        components_list: {component_id: quantity}, e.g. the output of
+            calculate_required_components()
+
+    Returns:
+        dict: {ore_id: quantity}
+    """
+    bom = get_bill_of_materials()
+    totals = bom.ore_totals(bom.component_vector(components_list))
+    return bom.to_dict(totals, bom.graph.ore_ids)
+
+
+def calculate_fabricator_times(components_list):
+    """
+    Total crafting time per fabricator type for a set of components.
+
+    Args:
+        components_list: {component_id: quantity}
+
+    Returns:
+        dict: {fabricator_type: seconds}, omitting fabricators with no work
+    """
+    bom = get_bill_of_materials()
+    times = bom.fabricator_times(bom.component_vector(components_list))
+    return {
+        fabricator: float(seconds)
+        for fabricator, seconds in zip(bom.fabricator_types, times)
+        if seconds
+    }
+
+
+def calculate_required_components_sql(blocks_list):
+    """
+    Aggregate component quantities in one query over BlockComponent.
+
+    Returns:
+        dict: {component_id: quantity}
+    """
+    block_quantities = collapse_order_lines(blocks_list)
+    totals = defaultdict(float)
+    rows = BlockComponent.objects.filter(block_id__in=list(block_quantities)).values_list(
+        'block_id', 'component_id', 'quantity'
+    )
+    for block_id, comp_id, quantity in rows:
+        totals[str(comp_id)] += quantity * block_quantities[str(block_id)]
+    return dict(totals)
+
+
+def calculate_required_ores_sql(blocks_list):
+    """
+    Aggregate ore quantities with one JOIN + GROUP BY.
+
+    Joins BlockComponent → ComponentMaterial and sums
+    ``component quantity × ore quantity`` per (block, ore) in the database;
+    only the per-block order multiplier is applied in Python.
+
+    Returns:
+        dict: {ore_id: quantity}
+    """
+    block_quantities = collapse_order_lines(blocks_list)
+    totals = defaultdict(float)
+    rows = (
+        BlockComponent.objects
+        .filter(block_id__in=list(block_quantities), component__material_links__isnull=False)
+        .values('block_id', ore_id=F('component__material_links__ore_id'))
+        .annotate(total=Sum(F('quantity') * F('component__material_links__quantity')))
+        .order_by()
+    )
+    for row in rows:
+        totals[str(row['ore_id'])] += row['total'] * block_quantities[str(row['block_id'])]
+    return dict(totals)
+
+
+def canonical_uuid(value):
+    """Return ``value`` as a canonical UUID string, or None if it is not a UUID."""
+    try:
+        return str(uuid.UUID(str(value)))
+    except ValueError:
+        return None
+
+
+def collapse_order_lines(blocks_list):
+    """
+    Collapse build-order lines into {block_id: total quantity}.
+
+    Lines with a missing/invalid block_id or a non-positive quantity are skipped.
+    """
+    quantities = defaultdict(int)
+    for line in blocks_list or []:
+        try:
+            block_id = canonical_uuid(line['block_id'])
+            quantity = line.get('quantity', 0)
+        except (KeyError, TypeError, AttributeError):
+            block_id = None
+        if block_id is None:
+            logger.warning(f"Skipping invalid build order line: {line}")
+            continue
+        if not isinstance(quantity, (int, float)) or quantity <= 0:
+            continue
+        quantities[block_id] += quantity
+    return quantities
+
+
+def fetch_in_batches(queryset, field, ids, *fields):
+    """
+    Run ``queryset.filter(<field>__in=ids).values_list(*fields)`` in as few
+    queries as the database backend allows.
+
+    PostgreSQL takes any number of parameters in one query; SQLite is capped
+    at ``max_query_params`` per statement, so large ID sets are split.
+    The query count depends on the number of distinct IDs, never on how many
+    build-order lines reference them.
+    """
+    ids = list(ids)
+    if not ids:
+        return []
+    batch_size = connection.features.max_query_params or len(ids)
+    rows = []
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start:start + batch_size]
+        rows.extend(queryset.filter(**{f'{field}__in': batch}).values_list(*fields))
+    return rows
+
+
+class BuildOrderCalculator:
+    """
+    Aggregate a build order's blocks, components, ores and fabricator time.
+
+    Resolves every referenced Block, then Component, then Ore with one batched
+    ``__in`` query each (three queries for any order that fits the backend's
+    parameter limit), then aggregates in memory.
+
+    Usage:
+        totals = BuildOrderCalculator(build_order.blocks).calculate()
+    """
+
+    def __init__(self, blocks_list):
+        """
+        Args:
+            blocks_list: [{"block_id": uuid, "quantity": int}, ...]
+        """
+        self.blocks_list = blocks_list or []
+
+    def calculate(self):
+        """
+        Calculate totals for the whole order.
+
+        Returns:
+            dict: {
+                'total_mass': float,
+                'blocks': [{'id', 'name', 'quantity', 'mass', 'total_mass'}],
+                'components': {component_id: {'name', 'quantity', 'mass',
+                               'fabricator_type', 'crafting_time'}},
+                'ores': {ore_id: {'name', 'quantity', 'mass'}},
+                'fabricators': {fabricator_type: total seconds},
+                'missing_blocks': [block_id, ...],
+            }
+        """
+        block_quantities = collapse_order_lines(self.blocks_list)
+
+        # Query 1: every block in the order
+        block_rows = fetch_in_batches(
+            Block.objects.order_by(), 'block_id', block_quantities.keys(),
+            'block_id', 'name', 'mass', 'components',
+        )
+
+        blocks = []
+        total_mass = 0.0
+        component_quantities = defaultdict(float)
+        for block_id, name, mass, block_components in block_rows:
+            quantity = block_quantities[str(block_id)]
+            blocks.append({
+                'id': str(block_id),
+                'name': name,
+                'quantity': quantity,
+                'mass': mass,
+                'total_mass': mass * quantity,
+            })
+            total_mass += mass * quantity
+            for comp_id, comp_qty in (block_components or {}).items():
+                comp_id = canonical_uuid(comp_id)
+                if comp_id is not None:
+                    component_quantities[comp_id] += comp_qty * quantity
+
+        found_blocks = {block['id'] for block in blocks}
+        missing_blocks = sorted(set(block_quantities) - found_blocks)
+        for block_id in missing_blocks:
+            logger.warning(f"Block {block_id} in build order not found in database")
+
+        # Query 2: every component used by those blocks
+        component_rows = fetch_in_batches(
+            Component.objects.order_by(), 'component_id', component_quantities.keys(),
+            'component_id', 'name', 'mass', 'materials', 'fabricator_type', 'crafting_time',
+        )
+
+        components = {}
+        fabricators = defaultdict(float)
+        ore_quantities = defaultdict(float)
+        for comp_id, name, mass, materials, fabricator_type, crafting_time in component_rows:
+            quantity = component_quantities[str(comp_id)]
+            components[str(comp_id)] = {
+                'name': name,
+                'quantity': quantity,
+                'mass': mass,
+                'fabricator_type': fabricator_type,
+                'crafting_time': crafting_time,
+            }
+            fabricators[fabricator_type or 'Unspecified'] += crafting_time * quantity
+            for ore_id, ore_qty in (materials or {}).items():
+                ore_id = canonical_uuid(ore_id)
+                if ore_id is not None:
+                    ore_quantities[ore_id] += ore_qty * quantity
+
+        # Query 3: every ore used by those components
+        ore_rows = fetch_in_batches(
+            Ore.objects.order_by(), 'ore_id', ore_quantities.keys(),
+            'ore_id', 'name', 'mass',
+        )
+
+        ores = {
+            str(ore_id): {
+                'name': name,
+                'quantity': ore_quantities[str(ore_id)],
+                'mass': mass,
+            }
+            for ore_id, name, mass in ore_rows
+        }
+
+        blocks.sort(key=lambda block: block['name'])
+
+        return {
+            'total_mass': total_mass,
+            'blocks': blocks,
+            'components': components,
+            'ores': ores,
+            'fabricators': dict(fabricators),
+            'missing_blocks': missing_blocks,
+        }
+
+
+def resolve_plan_lines(lines, graph):
+    """
+    Resolve plan lines given by ``block_id`` or ``name`` against the graph.
+
+    Args:
+        lines: [{"block_id": uuid, "quantity": n} or {"name": str, "quantity": n}]
+        graph: RecipeGraph used for name lookups
+
+    Returns:
+        tuple: (resolved lines [{"block_id", "quantity"}], missing [id or name],
+                errors [str]) — errors describe malformed lines
+    """
+    resolved = []
+    missing = []
+    errors = []
+    for number, line in enumerate(lines, start=1):
+        if not isinstance(line, dict):
+            errors.append(f"Line {number}: expected an object")
+            continue
+
+        quantity = line.get('quantity', 1)
+        if (
+            isinstance(quantity, bool) or not isinstance(quantity, (int, float))
+            or not math.isfinite(quantity) or quantity <= 0
+        ):
+            errors.append(f"Line {number}: quantity must be a positive number, got {quantity!r}")
+            continue
+
+        if 'block_id' in line:
+            block_id = canonical_uuid(line['block_id'])
+            if block_id is None:
+                errors.append(f"Line {number}: invalid block_id {line['block_id']!r}")
+            elif block_id in graph.block_index:
+                resolved.append({'block_id': block_id, 'quantity': quantity})
+            else:
+                missing.append(block_id)
+        elif 'name' in line:
+            if not isinstance(line['name'], str):
+                errors.append(f"Line {number}: name must be a string, got {line['name']!r}")
+                continue
+            position = graph.block_name_index.get(line['name'])
+            if position is None:
+                missing.append(line['name'])
+            else:
+                resolved.append({'block_id': graph.block_ids[position], 'quantity': quantity})
+        else:
+            errors.append(f"Line {number}: block_id or name is required")
+
+    return resolved, missing, errors
+
+
+def calculate_plan(blocks_list, bom=None):
+    """
+    Aggregate a plan of already-resolved lines with the bill of materials.
+
+    Same result shape as ``BuildOrderCalculator.calculate()``, computed as
+    vector products over the compiled recipe graph instead of SQL.
+
+    Args:
+        blocks_list: [{"block_id": uuid, "quantity": n}, ...] with blocks
+            known to the current graph (see ``resolve_plan_lines``)
+        bom: BillOfMaterials the lines were resolved against; defaults to
+            the current one
+    """
+    bom = bom or get_bill_of_materials()
+    graph = bom.graph
+
+    block_vector = bom.block_vector(blocks_list)
+    component_vector = bom.component_totals(block_vector)
+    ore_vector = bom.ore_totals(component_vector)
+    fabricator_times = bom.fabricator_times(component_vector)
+
+    blocks = [
+        {
+            'id': graph.block_ids[pos],
+            'name': graph.block_names[pos],
+            'quantity': float(block_vector[pos]),
+            'mass': graph.block_masses[pos],
+            'total_mass': float(block_vector[pos]) * graph.block_masses[pos],
+        }
+        for pos in np.flatnonzero(block_vector)
+    ]
+    blocks.sort(key=lambda block: block['name'])
+
+    components = {
+        graph.component_ids[pos]: {
+            'name': graph.component_names[pos],
+            'quantity': float(component_vector[pos]),
+            'mass': graph.component_masses[pos],
+            'fabricator_type': graph.component_fabricators[pos],
+            'crafting_time': graph.component_crafting_times[pos],
+        }
+        for pos in np.flatnonzero(component_vector)
+    }
+
+    ores = {
+        graph.ore_ids[pos]: {
+            'name': graph.ore_names[pos],
+            'quantity': float(ore_vector[pos]),
+            'mass': graph.ore_masses[pos],
+        }
+        for pos in np.flatnonzero(ore_vector)
+    }
+
+    return {
+        'total_mass': float(block_vector @ bom.block_masses),
+        'blocks': blocks,
+        'components': components,
+        'ores': ores,
+        'fabricators': {
+            fabricator or 'Unspecified': float(seconds)
+            for fabricator, seconds in zip(bom.fabricator_types, fabricator_times)
+            if seconds
+        },
+        'missing_blocks': [],
+    }
@@ -0,0 +1,131 @@
+"""
+Catalog-wide version stamp.
+
+One integer (the ``CatalogVersion`` row) versions the whole Ore/Component/
+Block catalog. Every write bumps it in the writer's transaction (see
+``blocks.signals`` and ``blocks.importer``), so a rolled-back write leaves it
+untouched. Derived data puts the version in its cache key instead of being
+evicted key by key:
+
+- the compiled recipe graph is tagged with it and rebuilt when it moves;
+- resource chains are cached as ``resource_chain_<version>_<block>``;
+- list totals (``se2CalcProject.pagination.approximate_count``) include it;
+- cached pages and HTTP validators (``se2CalcProject.page_cache``) derive
+  from it and from the row's ``updated_at`` (``get_catalog_last_modified``).
+
+Invalidation is therefore one ``UPDATE``; entries under older versions are
+never read again and age out of the cache.
+
+Reads go to the shared cache (``CATALOG_VERSION_KEY``, never held in a
+worker's L1) and fall back to the row on a miss; inside a request the value
+is memoized by the identity map, so it costs one lookup per request. When the
+"shared" cache is per-process (locmem), other workers never see the writer's
+update, so the value expires after ``settings.CATALOG_VERSION_TIMEOUT``
+seconds and is re-read from the row.
+
+Other connections cannot see a write until it commits, but a process may
+read the bumped version from the cache before then and tag data built from
+the old rows with it. The version is therefore bumped again once the write
+commits, so anything derived during the transaction is abandoned too.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .identity_map import current_identity_map
+from .models import CatalogVersion
+
+CATALOG_VERSION_KEY = 'catalog_version'
+# Per version, so entries never go stale and may live in L1
+CATALOG_MODIFIED_KEY = 'catalog_modified_{version}'
+CATALOG_MODIFIED_TIMEOUT = 60 * 60 * 24
+
+
+def _cache_last_modified(version, modified):
+    cache.set(CATALOG_MODIFIED_KEY.format(version=version), modified, CATALOG_MODIFIED_TIMEOUT)
+
+
+def _version_timeout():
+    # None: kept until the next bump (the L2 is shared by every process)
+    return getattr(settings, 'CATALOG_VERSION_TIMEOUT', None)
+
+
+def _read_version(using=DEFAULT_DB_ALIAS):
+    row, _ = CatalogVersion.objects.using(using).get_or_create(pk=1)
+    _cache_last_modified(row.version, row.updated_at)
+    return row.version
+
+
+def get_catalog_version():
+    """
+    Return the current catalog version.
+
+    Memoized for the rest of the request; otherwise one shared-cache read,
+    plus one query when the cache has lost the value.
+    """
+    identity_map = current_identity_map()
+    if identity_map is not None and identity_map.catalog_version is not None:
+        return identity_map.catalog_version
+
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        version = _read_version()
+        # add, not set: never overwrite a newer value a writer just published
+        cache.add(CATALOG_VERSION_KEY, version, _version_timeout())
+
+    if identity_map is not None:
+        identity_map.catalog_version = version
+    return version
+
+
+def get_catalog_last_modified():
+    """
+    Return when the catalog last changed (an aware datetime).
+
+    Cached per catalog version whenever the row is read or bumped; otherwise
+    one query. The row may already be past that version, which only makes
+    the timestamp later, never older than the data it describes.
+    """
+    version = get_catalog_version()
+    modified = cache.get(CATALOG_MODIFIED_KEY.format(version=version))
+    if modified is None:
+        modified = CatalogVersion.objects.values_list('updated_at', flat=True).filter(pk=1).first()
+        if modified is not None:
+            _cache_last_modified(version, modified)
+    return modified
+
+
+def _bump(using):
+    """Increment the row and publish the new version to the shared cache."""
+    versions = CatalogVersion.objects.using(using).filter(pk=1)
+    if not versions.update(version=F('version') + 1, updated_at=timezone.now()):
+        CatalogVersion.objects.using(using).get_or_create(pk=1)
+        versions.update(version=F('version') + 1, updated_at=timezone.now())
+    version, modified = versions.values_list('version', 'updated_at').get()
+    _cache_last_modified(version, modified)
+    cache.set(CATALOG_VERSION_KEY, version, _version_timeout())
+
+    # The current request wrote to the catalog: stop serving its pinned snapshot
+    identity_map = current_identity_map()
+    if identity_map is not None:
+        identity_map.clear()
+    return version
+
+
+def bump_catalog_version(using=DEFAULT_DB_ALIAS):
+    """
+    Bump the catalog version in the current transaction.
+
+    Call from inside the transaction that writes the catalog. Inside an
+    atomic block the version is bumped once more after it commits (see the
+    module docstring); in autocommit mode the write is already visible.
+
+    Returns:
+        int: the new version
+    """
+    version = _bump(using)
+    if transaction.get_connection(using).in_atomic_block:
+        transaction.on_commit(lambda: _bump(using), using=using)
+    return version
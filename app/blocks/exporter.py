@@ -0,0 +1,148 @@
+"""
+Streaming CSV/NDJSON export of the catalog.
+
+Rows are read with ``QuerySet.iterator(chunk_size=...)`` (a server-side
+cursor on PostgreSQL, chunked fetches on SQLite) and encoded one at a time,
+so memory stays flat however large the catalog is. Blocks can optionally
+carry their flattened ore totals, resolved from the compiled recipe graph
+without extra queries.
+
+Used by the ``/<app>/export/`` views and the ``export_catalog`` command.
+"""
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponseBadRequest, StreamingHttpResponse
+
+from components.models import Component
+from ores.models import Ore
+from .models import Block
+from .recipe_graph import get_recipe_graph
+
+DEFAULT_CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+EXPORT_MODELS = {
+    'ores': (Ore, (
+        'ore_id', 'name', 'description', 'mass', 'created_at', 'updated_at',
+    )),
+    'components': (Component, (
+        'component_id', 'name', 'description', 'materials', 'fabricator_type',
+        'crafting_time', 'mass', 'created_at', 'updated_at',
+    )),
+    'blocks': (Block, (
+        'block_id', 'name', 'description', 'mass', 'components', 'health', 'pcu',
+        'snap_size', 'input_mass', 'output_mass', 'consumer_type', 'consumer_rate',
+        'producer_type', 'producer_rate', 'storage_capacity', 'created_at', 'updated_at',
+    )),
+}
+
+# Prefix of the per-ore CSV columns added by ``ore_totals``
+ORE_COLUMN_PREFIX = 'ore:'
+
+
+def iter_export_records(kind, ore_totals=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield one dict per row of the requested model, ordered by name.
+
+    Args:
+        kind: 'ores', 'components' or 'blocks'
+        ore_totals: Add ``ore_totals`` ({ore name: quantity}) to each block
+        chunk_size: Rows fetched per database round-trip
+    """
+    model, fields = EXPORT_MODELS[kind]
+    rows = model.objects.order_by('name').values(*fields).iterator(chunk_size=chunk_size)
+
+    if not (ore_totals and kind == 'blocks'):
+        yield from rows
+        return
+
+    graph = get_recipe_graph()
+    for row in rows:
+        row['ore_totals'] = {
+            graph.ore_name(ore_id): quantity
+            for ore_id, quantity in graph.ore_totals(row['components']).items()
+        }
+        yield row
+
+
+def iter_ndjson(records):
+    """Encode records as newline-delimited JSON."""
+    encoder = DjangoJSONEncoder()
+    for record in records:
+        yield encoder.encode(record) + '\n'
+
+
+class _Echo:
+    """File-like object whose ``write`` returns the value, for streaming csv."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(records, columns, ore_names=None):
+    """
+    Encode records as CSV, header first.
+
+    JSON fields are written as JSON strings. With ``ore_names``, each block's
+    ``ore_totals`` is flattened into one ``ore:<name>`` column per ore.
+    """
+    writer = csv.writer(_Echo())
+    ore_names = ore_names or []
+    yield writer.writerow([*columns, *(f'{ORE_COLUMN_PREFIX}{name}' for name in ore_names)])
+
+    for record in records:
+        row = [
+            json.dumps(value) if isinstance(value, (dict, list)) else value
+            for value in (record[column] for column in columns)
+        ]
+        if ore_names:
+            totals = record.get('ore_totals', {})
+            row.extend(totals.get(name, 0) for name in ore_names)
+        yield writer.writerow(row)
+
+
+def iter_export(kind, fmt, ore_totals=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield encoded lines of a full export.
+
+    Args:
+        kind: 'ores', 'components' or 'blocks'
+        fmt: 'csv' or 'ndjson'
+        ore_totals: Include flattened ore totals (blocks only)
+        chunk_size: Rows fetched per database round-trip
+    """
+    ore_totals = ore_totals and kind == 'blocks'
+    records = iter_export_records(kind, ore_totals=ore_totals, chunk_size=chunk_size)
+    if fmt == 'ndjson':
+        return iter_ndjson(records)
+
+    _, columns = EXPORT_MODELS[kind]
+    ore_names = sorted(get_recipe_graph().ore_names) if ore_totals else None
+    return iter_csv(records, columns, ore_names)
+
+
+def export_response(request, kind):
+    """
+    Stream an export as an attachment.
+
+    Query Parameters:
+    - format: 'csv' (default) or 'ndjson'
+    - ore_totals: '1' to add flattened ore totals (blocks only)
+    """
+    fmt = request.GET.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        return HttpResponseBadRequest(f"Unsupported format '{fmt}'; use csv or ndjson")
+    ore_totals = request.GET.get('ore_totals') in ('1', 'true', 'yes')
+
+    response = StreamingHttpResponse(
+        iter_export(kind, fmt, ore_totals=ore_totals),
+        content_type=EXPORT_FORMATS[fmt],
+    )
+    response['Content-Disposition'] = f'attachment; filename="{kind}.{fmt}"'
+    return response
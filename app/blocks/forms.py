@@ -3,9 +3,9 @@ Forms for Blocks app.
 
 Handles JSONField components with custom form processing:
 - Converts between form data (component_id[], quantity[]) and JSON storage
-- Validates component UUIDs against database
+- Validates component UUIDs against database (one batched query)
 - Validates quantities (positive integers)
-- Reuses Phase 1 Block.validate_components() helper
+- Reuses the shared blocks.validators helper
 
 Pattern adapted from ENH-0000006 ComponentForm.
 """
@@ -13,7 +13,7 @@ from django import forms
 from django.core.exceptions import ValidationError
 from django.db.models import Q
 from .models import Block
-from components.models import Component
+from .validators import validate_components
 import uuid
 import json
 
@@ -193,7 +193,7 @@ class BlockForm(forms.ModelForm):
         Cross-field validation and component processing.
         
         Converts components_json from client into proper JSONField format
-        and validates using Block.validate_components() helper from Phase 1.
+        and validates references with the shared blocks.validators helper.
         
         Returns:
             dict: Cleaned form data with processed components
@@ -246,25 +246,13 @@ class BlockForm(forms.ModelForm):
                     'components_json': f'Invalid quantity for component {comp_id_str}: {quantity}. Must be positive integer.'
                 })
             
-            # Verify component exists in database
-            if not Component.objects.filter(component_id=comp_uuid).exists():
-                raise ValidationError({
-                    'components_json': f'Component {comp_id_str} does not exist in database.'
-                })
-            
             validated_components[str(comp_uuid)] = qty
         
         # Store validated components for save
         cleaned_data['components'] = validated_components
         
-        # Use Phase 1 validation helper (create temporary instance)
-        temp_block = Block(
-            name=cleaned_data.get('name', 'temp'),
-            mass=cleaned_data.get('mass', 1.0),
-            components=validated_components
-        )
-        
-        is_valid, validation_errors = temp_block.validate_components()
+        # Verify every referenced component exists with one batched query
+        is_valid, validation_errors = validate_components(validated_components)
         
         if not is_valid:
             raise ValidationError({
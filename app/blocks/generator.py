@@ -0,0 +1,197 @@
+"""
+Deterministic synthetic catalogs for load and benchmark testing.
+
+``CatalogGenerator`` yields ore, component and block records (the flat
+shape ``blocks.importer`` accepts) for any catalog size. The same seed and
+options always produce the same rows, primary keys included, so a 1k, 10k
+or 100k-block catalog can be rebuilt identically on any machine.
+
+Primary keys are UUIDv7 (``uuid_utils.UUID``). ``uuid_utils.uuid7()`` cannot
+be seeded, so the 74 random bits come from the generator's own RNG and the
+48-bit timestamp counts up one millisecond per row from ``EPOCH_MS``; keys
+stay time-ordered like the ones ``generate_uuid`` assigns.
+
+Fan-out (materials per component, components per block) is drawn uniformly
+from an inclusive range. Which ores/components get referenced follows a Zipf
+distribution with exponent ``skew``: a few, like Steel Plate in the real
+game, are used almost everywhere and most are rare. ``skew=0`` is uniform.
+"""
+import random
+from bisect import bisect_left
+from itertools import accumulate
+
+import uuid_utils
+
+# First synthetic timestamp: 2026-01-01T00:00:00Z in milliseconds
+EPOCH_MS = 1767225600000
+
+# Gap between the ore, component and block key ranges (milliseconds, i.e. rows)
+TABLE_SPACING_MS = 10 ** 9
+
+ORE_WORDS = (
+    'Iron', 'Nickel', 'Cobalt', 'Silicon', 'Silver', 'Gold', 'Platinum',
+    'Uranium', 'Magnesium', 'Ice', 'Stone', 'Scrap',
+)
+QUALIFIERS = (
+    'Dense', 'Refined', 'Heavy', 'Light', 'Reinforced', 'Compact', 'Large',
+    'Small', 'Advanced', 'Basic', 'Industrial', 'Prototype',
+)
+COMPONENT_WORDS = (
+    'Plate', 'Tube', 'Girder', 'Motor', 'Panel', 'Grid', 'Computer',
+    'Construction Kit', 'Thruster Part', 'Reactor Core', 'Glass', 'Cell',
+)
+BLOCK_WORDS = (
+    'Armor Block', 'Reactor', 'Thruster', 'Cargo Container', 'Refinery',
+    'Assembler', 'Battery', 'Catwalk', 'Conveyor', 'Gyroscope', 'Turret',
+    'Cockpit', 'Antenna', 'Solar Panel', 'Landing Gear',
+)
+# Zipf draws per requested reference before falling back to a uniform sample
+MAX_DRAWS_PER_PICK = 50
+
+FABRICATORS = ('Assembler', 'Refinery', 'Survival Kit', 'Basic Assembler')
+SNAP_SIZES = (0.5, 2.5)
+
+
+def parse_range(value):
+    """
+    Parse an inclusive ``'min:max'`` (or single ``'n'``) fan-out range.
+
+    Raises:
+        ValueError: if the bounds are not integers with 0 <= min <= max
+    """
+    low, _, high = str(value).partition(':')
+    low = int(low)
+    high = int(high) if high else low
+    if low < 0 or high < low:
+        raise ValueError(f"Invalid range {value!r}: expected min:max with 0 <= min <= max")
+    return low, high
+
+
+class CatalogGenerator:
+    """
+    Seeded generator of ore, component and block records.
+
+    Args:
+        ores, components, blocks: Rows to generate per table
+        seed: RNG seed; equal seeds and options give identical catalogs
+        materials_per_component: (min, max) ores per component
+        components_per_block: (min, max) components per block
+        skew: Zipf exponent for how references are spread (0 = uniform)
+        prefix: Name prefix, keeping synthetic rows apart from real ones
+    """
+
+    def __init__(self, ores, components, blocks, seed=42,
+                 materials_per_component=(1, 4), components_per_block=(2, 12),
+                 skew=1.0, prefix='Synthetic'):
+        if min(ores, components, blocks) < 0:
+            raise ValueError("Row counts cannot be negative")
+        if components and materials_per_component[1] and not ores:
+            raise ValueError("Components need materials but no ores are generated")
+        if blocks and components_per_block[1] and not components:
+            raise ValueError("Blocks need components but no components are generated")
+        if skew < 0:
+            raise ValueError("skew cannot be negative")
+        self.counts = {'ore': ores, 'component': components, 'block': blocks}
+        self.seed = seed
+        self.materials_per_component = materials_per_component
+        self.components_per_block = components_per_block
+        self.skew = skew
+        self.prefix = prefix
+
+        # Keys for every table up front, so references can be drawn before
+        # the referenced rows are written. Tables get disjoint time ranges.
+        self.ids = {}
+        for position, (kind, count) in enumerate(self.counts.items()):
+            rng = self._rng(f'{kind}-keys')
+            start = EPOCH_MS + position * TABLE_SPACING_MS
+            self.ids[kind] = [self._uuid7(rng, start + i) for i in range(count)]
+
+    def _rng(self, stream):
+        """Independent RNG per stage, so changing one table's size leaves the others alone."""
+        return random.Random(f'{self.seed}:{stream}')
+
+    @staticmethod
+    def _uuid7(rng, millis):
+        """UUIDv7 string for a millisecond timestamp with seeded random bits."""
+        value = (
+            (millis & ((1 << 48) - 1)) << 80
+            | 0x7 << 76
+            | rng.getrandbits(12) << 64
+            | 0b10 << 62
+            | rng.getrandbits(62)
+        )
+        return str(uuid_utils.UUID(int=value))
+
+    def _picker(self, ids):
+        """Function drawing ``k`` distinct IDs, popular ones first-ranked (Zipf)."""
+        if not self.skew:
+            return lambda rng, k: rng.sample(ids, min(k, len(ids)))
+
+        cumulative = list(accumulate(1 / (rank ** self.skew) for rank in range(1, len(ids) + 1)))
+        total = cumulative[-1]
+
+        def pick(rng, k):
+            k = min(k, len(ids))
+            chosen = {}
+            for _ in range(k * MAX_DRAWS_PER_PICK):
+                if len(chosen) >= k:
+                    break
+                position = bisect_left(cumulative, rng.random() * total)
+                chosen.setdefault(ids[min(position, len(ids) - 1)], None)
+            else:
+                # Heavy skew over a small table: fill up from the rare tail
+                rest = [pk for pk in ids if pk not in chosen]
+                chosen.update(dict.fromkeys(rng.sample(rest, k - len(chosen))))
+            return list(chosen)
+        return pick
+
+    def _name(self, rng, words, index):
+        return f'{self.prefix} {rng.choice(QUALIFIERS)} {rng.choice(words)} {index:06d}'
+
+    # ---- Records ----
+
+    def ores(self):
+        """Yield ore records."""
+        rng = self._rng('ore')
+        for index, pk in enumerate(self.ids['ore']):
+            yield {
+                'ore_id': pk,
+                'name': self._name(rng, ORE_WORDS, index),
+                'description': 'Synthetic ore for load testing',
+                'mass': round(rng.uniform(0.5, 5.0), 2),
+            }
+
+    def components(self):
+        """Yield component records with ``materials`` drawn from the ores."""
+        rng = self._rng('component')
+        pick = self._picker(self.ids['ore'])
+        low, high = self.materials_per_component
+        for index, pk in enumerate(self.ids['component']):
+            ore_ids = pick(rng, rng.randint(low, high))
+            yield {
+                'component_id': pk,
+                'name': self._name(rng, COMPONENT_WORDS, index),
+                'description': 'Synthetic component for load testing',
+                'materials': {ore_id: round(rng.uniform(0.5, 50.0), 2) for ore_id in ore_ids},
+                'fabricator_type': rng.choice(FABRICATORS),
+                'crafting_time': round(rng.uniform(0.5, 30.0), 2),
+                'mass': round(rng.uniform(0.5, 100.0), 2),
+            }
+
+    def blocks(self):
+        """Yield block records with ``components`` drawn from the components."""
+        rng = self._rng('block')
+        pick = self._picker(self.ids['component'])
+        low, high = self.components_per_block
+        for index, pk in enumerate(self.ids['block']):
+            component_ids = pick(rng, rng.randint(low, high))
+            yield {
+                'block_id': pk,
+                'name': self._name(rng, BLOCK_WORDS, index),
+                'description': 'Synthetic block for load testing',
+                'components': {comp_id: rng.randint(1, 200) for comp_id in component_ids},
+                'mass': round(rng.uniform(10.0, 50000.0), 1),
+                'health': round(rng.uniform(100.0, 20000.0), 1),
+                'pcu': rng.randint(1, 500),
+                'snap_size': rng.choice(SNAP_SIZES),
+            }
@@ -0,0 +1,115 @@
+"""
+Request-scoped identity map for catalog lookups.
+
+While a request is being handled (see ``blocks.middleware``) one
+``CatalogIdentityMap`` is active. It:
+
+- memoizes the catalog version and pins the compiled recipe graph on first
+  use, so template filters and views resolve names/masses for the rest of
+  the request without another version check against the shared cache;
+- keeps one instance per Ore/Component/Block primary key, loading any IDs it
+  has not seen yet with a single ``in_bulk`` query per call.
+
+Outside a request (management commands, shell) the helpers fall back to the
+process-wide graph and plain batched queries.
+"""
+import contextvars
+import uuid
+from contextlib import contextmanager
+
+_current = contextvars.ContextVar('catalog_identity_map', default=None)
+
+
+def _canonical_ids(ids):
+    canonical = []
+    for value in ids:
+        try:
+            canonical.append(str(uuid.UUID(str(value))))
+        except (ValueError, TypeError, AttributeError):
+            continue
+    return canonical
+
+
+class CatalogIdentityMap:
+    """Pinned catalog version and recipe graph plus an instance cache keyed by (model, pk)."""
+
+    def __init__(self):
+        self.catalog_version = None
+        self._graph = None
+        self._objects = {}
+
+    @property
+    def graph(self):
+        """The recipe graph for this request, resolved once."""
+        if self._graph is None:
+            from .recipe_graph import load_recipe_graph
+            self._graph = load_recipe_graph()
+        return self._graph
+
+    def clear(self):
+        """Drop the pinned version, graph and cached instances (after a catalog write)."""
+        self.catalog_version = None
+        self._graph = None
+        self._objects.clear()
+
+    def prefetch(self, model, ids):
+        """Load every not-yet-seen ID of ``model`` with one query."""
+        cache = self._objects.setdefault(model, {})
+        missing = [pk for pk in dict.fromkeys(_canonical_ids(ids)) if pk not in cache]
+        if not missing:
+            return
+        found = {str(pk): obj for pk, obj in model.objects.in_bulk(missing).items()}
+        for pk in missing:
+            # Remember misses too, so unknown IDs are not queried again
+            cache[pk] = found.get(pk)
+
+    def get_many(self, model, ids):
+        """
+        Return ``{pk string: instance}`` for the IDs that exist.
+
+        At most one query, and none for IDs already seen in this request.
+        """
+        ids = _canonical_ids(ids)
+        self.prefetch(model, ids)
+        cache = self._objects[model]
+        return {pk: cache[pk] for pk in ids if cache.get(pk) is not None}
+
+    def get(self, model, pk):
+        """Return the instance for ``pk`` or None."""
+        ids = _canonical_ids([pk])
+        if not ids:
+            return None
+        return self.get_many(model, ids).get(ids[0])
+
+
+def current_identity_map():
+    """Return the active identity map, or None outside a catalog scope."""
+    return _current.get()
+
+
+@contextmanager
+def catalog_scope():
+    """Activate a fresh identity map for the duration of the block."""
+    token = _current.set(CatalogIdentityMap())
+    try:
+        yield _current.get()
+    finally:
+        _current.reset(token)
+
+
+def get_many(model, ids):
+    """
+    Resolve IDs to instances through the active identity map.
+
+    Outside a catalog scope this is a single ``in_bulk`` query.
+
+    Returns:
+        dict: {pk string: instance} for the IDs that exist
+    """
+    identity_map = current_identity_map()
+    if identity_map is not None:
+        return identity_map.get_many(model, ids)
+    ids = _canonical_ids(ids)
+    if not ids:
+        return {}
+    return {str(pk): obj for pk, obj in model.objects.in_bulk(ids).items()}
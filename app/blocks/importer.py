@@ -0,0 +1,401 @@
+"""
+Streaming bulk import of catalog data (ores → components → blocks).
+
+Records are read one at a time from JSON arrays or NDJSON files, validated in
+chunks against in-memory ID sets (see ``components.validators``) and written
+with ``bulk_create``/``bulk_update`` inside a transaction per chunk. Model
+``save()``/``clean()`` are bypassed, so the work this module does instead:
+
+- field validation with ``clean_fields()`` (no queries)
+- reference validation against the set of ore/component IDs in the database
+  (game data is imported as-is otherwise; consumer/producer consistency is
+  left to ``Block.clean()`` on interactive edits, as with ``loaddata``)
+- BlockComponent/ComponentMaterial link rows rewritten per chunk
+- search index entries (SQLite FTS5, see ``blocks.search``) refreshed per chunk
+- the catalog version bumped in each chunk's transaction
+  (see ``blocks.catalog_version``)
+
+Accepted record shapes (per line in NDJSON, per element in a JSON array):
+    {"model": "ores.ore", "pk": "uuid", "fields": {...}}   # Django fixture
+    {"ore_id": "uuid", "name": "Iron", "mass": 1.0, ...}      # flat
+Rows are matched to existing rows by primary key, or by unique name when no
+primary key is given; unmatched rows are created.
+"""
+import json
+import logging
+import time
+from contextlib import nullcontext
+from itertools import chain
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from components.models import Component, ComponentMaterial
+from components.validators import canonical_reference_id, validate_materials_many
+from ores.models import Ore
+from .catalog_version import bump_catalog_version
+from .models import Block, BlockComponent
+from .search import index_instances
+from .validators import validate_components_many
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Bytes read from JSON array files per refill of the decode buffer.
+READ_SIZE = 1 << 16
+
+# Fields the importer never takes from input; timestamps are set here.
+SYSTEM_FIELDS = ('created_at', 'updated_at')
+
+
+class CatalogImportError(Exception):
+    """Raised for malformed input, or for invalid records in strict mode."""
+
+
+def iter_records(stream):
+    """
+    Yield records from a JSON array or NDJSON text stream.
+
+    The format is detected from the first non-whitespace character: ``[``
+    starts a JSON array, anything else is treated as one JSON value per line.
+    Neither format is loaded into memory as a whole.
+    """
+    first = stream.read(1)
+    while first and first.isspace():
+        first = stream.read(1)
+    if not first:
+        return
+    if first == '[':
+        yield from _iter_json_array(stream)
+    else:
+        yield from _iter_ndjson(chain([first + stream.readline()], stream))
+
+
+def _iter_ndjson(lines):
+    """Yield one decoded value per non-blank line."""
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise CatalogImportError(f"Invalid JSON on line {line_number}: {e}")
+
+
+def _iter_json_array(stream):
+    """Yield the elements of a JSON array whose opening ``[`` was consumed."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+
+    while True:
+        # Skip whitespace and separators, refilling the buffer as needed
+        while True:
+            while pos < len(buffer) and (buffer[pos].isspace() or buffer[pos] == ','):
+                pos += 1
+            if pos < len(buffer):
+                break
+            chunk = stream.read(READ_SIZE)
+            if not chunk:
+                raise CatalogImportError("Unexpected end of input: JSON array is not closed")
+            buffer, pos = chunk, 0
+
+        if buffer[pos] == ']':
+            return
+
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            chunk = stream.read(READ_SIZE)
+            if not chunk:
+                raise CatalogImportError(f"Invalid JSON in array: {e}")
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+
+        yield value
+        pos = end
+        if pos >= READ_SIZE:
+            buffer, pos = buffer[pos:], 0
+
+
+class ImportStats:
+    """Row counters and timing for one model's import stage."""
+
+    def __init__(self, label):
+        self.label = label
+        self.created = 0
+        self.updated = 0
+        self.skipped = 0
+        self.errors = []
+        self.elapsed = 0.0
+
+    @property
+    def written(self):
+        return self.created + self.updated
+
+    @property
+    def rows_per_second(self):
+        total = self.written + self.skipped
+        return total / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        return (
+            f"{self.label}: {self.created} created, {self.updated} updated, "
+            f"{self.skipped} skipped in {self.elapsed:.2f}s "
+            f"({self.rows_per_second:,.0f} rows/sec)"
+        )
+
+
+class CatalogImporter:
+    """
+    Import ores, components and blocks in dependency order.
+
+    Usage:
+        importer = CatalogImporter(chunk_size=2000)
+        with open('ores.ndjson') as ores, open('blocks.json') as blocks:
+            stats = importer.run(ores=ores, blocks=blocks)
+    """
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE, strict=False, atomic=False):
+        """
+        Args:
+            chunk_size: Records validated and written per transaction
+            strict: Raise CatalogImportError on the first invalid record
+                instead of skipping it
+            atomic: Run the whole import in a single transaction
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.chunk_size = chunk_size
+        self.strict = strict
+        self.atomic = atomic
+
+    def run(self, ores=None, components=None, blocks=None):
+        """
+        Import each given stream in order ores → components → blocks.
+
+        Args:
+            ores, components, blocks: Text streams (JSON array or NDJSON),
+                iterables of record dicts (e.g. ``blocks.generator``), or
+                None to skip that model
+
+        Returns:
+            list: ImportStats for each stage that ran
+        """
+        stages = [
+            (Ore, ores, self._validate_ores),
+            (Component, components, self._validate_components),
+            (Block, blocks, self._validate_blocks),
+        ]
+
+        results = []
+        with transaction.atomic() if self.atomic else nullcontext():
+            for model, stream, validate in stages:
+                if stream is None:
+                    continue
+                results.append(self._import_model(model, stream, validate))
+        return results
+
+    # ---- Stage driver ----
+
+    def _import_model(self, model, stream, validate):
+        stats = ImportStats(model._meta.verbose_name_plural)
+        started = time.perf_counter()
+        known_ids = self._known_reference_ids(model)
+
+        records = iter_records(stream) if hasattr(stream, 'read') else stream
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= self.chunk_size:
+                self._write_chunk(model, chunk, validate, known_ids, stats)
+                chunk = []
+        if chunk:
+            self._write_chunk(model, chunk, validate, known_ids, stats)
+
+        stats.elapsed = time.perf_counter() - started
+        logger.info(stats.summary())
+        return stats
+
+    def _known_reference_ids(self, model):
+        """Load the ID set the stage's references are validated against."""
+        if model is Component:
+            return {str(pk) for pk in Ore.objects.values_list('ore_id', flat=True).iterator()}
+        if model is Block:
+            return {
+                str(pk) for pk in
+                Component.objects.values_list('component_id', flat=True).iterator()
+            }
+        return None
+
+    def _write_chunk(self, model, records, validate, known_ids, stats):
+        pk_name = model._meta.pk.name
+        rows = []
+        for record in records:
+            try:
+                rows.append(self._normalize(model, record))
+            except CatalogImportError as e:
+                self._reject(stats, str(e))
+
+        # Last occurrence of a name or primary key within the chunk wins
+        seen_names, seen_pks, unique = set(), set(), []
+        for pk, fields in reversed(rows):
+            if fields['name'] in seen_names or pk in seen_pks:
+                continue
+            seen_names.add(fields['name'])
+            if pk is not None:
+                seen_pks.add(pk)
+            unique.append((pk, fields))
+        rows = unique[::-1]
+
+        pks = [pk for pk, _ in rows if pk is not None]
+        existing_pks = {
+            str(pk) for pk in model.objects.filter(pk__in=pks).values_list(pk_name, flat=True)
+        }
+        pk_by_name = {
+            name: str(pk) for name, pk in
+            model.objects.filter(name__in=[fields['name'] for _, fields in rows])
+            .values_list('name', pk_name)
+        }
+
+        known_pks = existing_pks | set(pk_by_name.values())
+        candidates = []
+        for pk, fields in rows:
+            name_owner = pk_by_name.get(fields['name'])
+            if pk is None:
+                pk = name_owner
+            elif name_owner is not None and name_owner != pk:
+                self._reject(stats, f"{fields['name']}: name already used by {name_owner}")
+                continue
+
+            instance = model(**fields)
+            try:
+                instance.clean_fields(exclude=[pk_name, *SYSTEM_FIELDS])
+            except ValidationError as e:
+                self._reject(stats, f"{fields['name']}: {'; '.join(e.messages)}")
+                continue
+
+            is_update = pk in known_pks
+            setattr(instance, pk_name, pk if pk is not None else model._meta.pk.get_default())
+            candidates.append((instance, is_update, tuple(sorted(fields))))
+
+        now = timezone.now()
+        to_create = []
+        to_update = {}
+        reference_errors = validate([instance for instance, _, _ in candidates], known_ids)
+        for (instance, is_update, field_names), errors in zip(candidates, reference_errors):
+            if errors:
+                self._reject(stats, f"{instance.name}: {'; '.join(errors)}")
+            elif is_update:
+                # bulk_update() skips auto_now, so stamp it here
+                instance.updated_at = now
+                to_update.setdefault(field_names, []).append(instance)
+            else:
+                to_create.append(instance)
+
+        with transaction.atomic():
+            model.objects.bulk_create(to_create, batch_size=self.chunk_size)
+            for field_names, objs in to_update.items():
+                model.objects.bulk_update(
+                    objs, [*field_names, 'updated_at'], batch_size=self.chunk_size
+                )
+            written = to_create + [obj for objs in to_update.values() for obj in objs]
+            self._sync_links(model, written, known_ids)
+            self._backfill_links(model, to_create)
+            index_instances(model, written)
+            if written:
+                bump_catalog_version()
+
+        stats.created += len(to_create)
+        stats.updated += len(written) - len(to_create)
+
+    def _normalize(self, model, record):
+        """
+        Turn a fixture-style or flat record into ``(pk or None, fields)``.
+
+        Unknown keys and system timestamps are dropped.
+        """
+        if not isinstance(record, dict):
+            raise CatalogImportError(f"Expected an object, got {type(record).__name__}")
+
+        pk_name = model._meta.pk.name
+        if 'fields' in record:
+            label = record.get('model')
+            if label and label.lower() != model._meta.label_lower:
+                raise CatalogImportError(f"Expected {model._meta.label_lower} record, got {label}")
+            pk = record.get('pk')
+            data = record['fields']
+        else:
+            data = record
+            pk = record.get(pk_name, record.get('pk'))
+
+        allowed = {
+            field.name for field in model._meta.concrete_fields
+            if field.name != pk_name and field.name not in SYSTEM_FIELDS
+        }
+        fields = {key: value for key, value in data.items() if key in allowed}
+        if not fields.get('name'):
+            raise CatalogImportError(f"Record without a name: {record}")
+
+        if pk is not None:
+            canonical = canonical_reference_id(pk)
+            if canonical is None:
+                raise CatalogImportError(f"{fields['name']}: invalid primary key {pk}")
+            pk = canonical
+        return pk, fields
+
+    def _reject(self, stats, message):
+        if self.strict:
+            raise CatalogImportError(f"{stats.label}: {message}")
+        stats.skipped += 1
+        stats.errors.append(message)
+        logger.warning(f"Skipping {stats.label} record: {message}")
+
+    # ---- Reference validation (per model) ----
+
+    @staticmethod
+    def _validate_ores(instances, known_ids):
+        return [[] for _ in instances]
+
+    @staticmethod
+    def _validate_components(instances, known_ids):
+        results = validate_materials_many((c.materials for c in instances), known_ids=known_ids)
+        return [errors for _, errors in results]
+
+    @staticmethod
+    def _validate_blocks(instances, known_ids):
+        results = validate_components_many((b.components for b in instances), known_ids=known_ids)
+        return [errors for _, errors in results]
+
+    # ---- Derived data ----
+
+    @staticmethod
+    def _backfill_links(model, created):
+        """Link rows that referenced newly created ores/components before they existed."""
+        if model is Ore:
+            ComponentMaterial.backfill([o.ore_id for o in created])
+        elif model is Component:
+            BlockComponent.backfill([c.component_id for c in created])
+
+    @staticmethod
+    def _sync_links(model, instances, known_ids):
+        """Rewrite link-table rows for a written chunk (signals do not fire)."""
+        if not instances:
+            return
+        if model is Component:
+            ids = [c.component_id for c in instances]
+            ComponentMaterial.objects.filter(component_id__in=ids).delete()
+            ComponentMaterial.objects.bulk_create([
+                row for c in instances
+                for row in ComponentMaterial.rows_for(c.component_id, c.materials, known_ids)
+            ])
+        elif model is Block:
+            ids = [b.block_id for b in instances]
+            BlockComponent.objects.filter(block_id__in=ids).delete()
+            BlockComponent.objects.bulk_create([
+                row for b in instances
+                for row in BlockComponent.rows_for(b.block_id, b.components, known_ids)
+            ])
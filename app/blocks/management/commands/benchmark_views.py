@@ -0,0 +1,88 @@
+"""
+Benchmark every ore, component and block page and write JSON/Markdown reports.
+
+Usage:
+    python manage.py generate_catalog --preset 10k
+    python manage.py benchmark_views --iterations 200 \
+        --json bench.json --markdown bench.md [--compare previous.json]
+
+    # Against a running server (includes gunicorn/nginx; no query counts)
+    python manage.py benchmark_views --base-url http://localhost:8000
+
+See ``se2CalcProject.benchmark`` for what is measured.
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from se2CalcProject.benchmark import ROUTES, BenchmarkRunner, to_json, to_markdown
+
+
+class Command(BaseCommand):
+    help = 'Measure p50/p95/p99 latency, queries and response size for every catalog page'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations', type=int, default=100,
+            help='Measured requests per route (default 100)',
+        )
+        parser.add_argument(
+            '--warmup', type=int, default=5, help='Unmeasured requests per route first (default 5)',
+        )
+        parser.add_argument('--base-url', help='Benchmark a live server instead of the test client')
+        parser.add_argument('--seed', type=int, default=42, help='Seed for row sampling')
+        parser.add_argument(
+            '--route', action='append', dest='routes', metavar='NAME',
+            help='Only routes whose name contains NAME (repeatable), e.g. --route "block detail"',
+        )
+        parser.add_argument('--json', dest='json_path', help='Write the JSON report here')
+        parser.add_argument('--markdown', dest='markdown_path', help='Write the Markdown report here')
+        parser.add_argument(
+            '--compare', dest='baseline_path',
+            help='Earlier JSON report; adds a p95 change column to the Markdown',
+        )
+
+    def handle(self, *args, **options):
+        routes = ROUTES
+        if options['routes']:
+            routes = [r for r in ROUTES if any(name in r.name for name in options['routes'])]
+            if not routes:
+                raise CommandError(f"No route matches {', '.join(options['routes'])}")
+
+        baseline = None
+        if options['baseline_path']:
+            try:
+                with open(options['baseline_path'], encoding='utf-8') as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as e:
+                raise CommandError(f'Cannot read baseline: {e}')
+
+        try:
+            runner = BenchmarkRunner(
+                iterations=options['iterations'],
+                warmup=options['warmup'],
+                base_url=options['base_url'],
+                seed=options['seed'],
+                routes=routes,
+            )
+            report = runner.run(progress=self._progress)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        markdown = to_markdown(report, baseline)
+        for path, content in ((options['json_path'], to_json(report)),
+                              (options['markdown_path'], markdown)):
+            if path:
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                self.stdout.write(self.style.SUCCESS(f'Wrote {path}'))
+        if not options['markdown_path']:
+            self.stdout.write(markdown)
+
+    def _progress(self, row):
+        style = self.style.SUCCESS if set(row['statuses']) == {'200'} else self.style.WARNING
+        queries = '' if row['queries_median'] is None else f", {row['queries_median']:g} queries"
+        self.stdout.write(style(
+            f"{row['route']}: p50 {row['p50_ms']:.1f}ms, p95 {row['p95_ms']:.1f}ms, "
+            f"p99 {row['p99_ms']:.1f}ms{queries}"
+        ))
@@ -0,0 +1,108 @@
+"""
+Generate a deterministic synthetic catalog for load and benchmark testing.
+
+Usage:
+    python manage.py generate_catalog --preset 10k [--seed 42]
+    python manage.py generate_catalog --ores 200 --components 3000 --blocks 10000 \
+        --materials-per-component 1:4 --components-per-block 2:12 --skew 1.0
+
+Rows are written through ``blocks.importer`` (``bulk_create`` per chunk, link
+tables and search index included). Keys and names depend only on the seed and
+options, so re-running the same command updates the same rows in place.
+See ``blocks.generator`` for the distributions.
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from blocks.generator import CatalogGenerator, parse_range
+from blocks.importer import CatalogImporter, CatalogImportError
+
+# (ores, components, blocks) per preset, keeping roughly the game's proportions
+PRESETS = {
+    '1k': (50, 500, 1000),
+    '10k': (200, 3000, 10000),
+    '100k': (1000, 20000, 100000),
+}
+
+DEFAULT_CHUNK_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = 'Bulk-insert a seeded synthetic catalog of ores, components and blocks'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--preset', choices=sorted(PRESETS),
+            help='Catalog size by block count (sets --ores/--components/--blocks defaults)',
+        )
+        parser.add_argument('--ores', type=int, help='Ores to generate')
+        parser.add_argument('--components', type=int, help='Components to generate')
+        parser.add_argument('--blocks', type=int, help='Blocks to generate')
+        parser.add_argument('--seed', type=int, default=42, help='RNG seed (default 42)')
+        parser.add_argument(
+            '--materials-per-component', default='1:4',
+            help='Inclusive min:max ores per component (default 1:4)',
+        )
+        parser.add_argument(
+            '--components-per-block', default='2:12',
+            help='Inclusive min:max components per block (default 2:12)',
+        )
+        parser.add_argument(
+            '--skew', type=float, default=1.0,
+            help='Zipf exponent for which ores/components are referenced; 0 = uniform (default 1.0)',
+        )
+        parser.add_argument(
+            '--prefix', default='Synthetic', help='Name prefix for generated rows',
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+            help=f'Rows per bulk insert transaction (default {DEFAULT_CHUNK_SIZE})',
+        )
+
+    def handle(self, *args, **options):
+        ores, components, blocks = PRESETS.get(options['preset'], PRESETS['1k'])
+        counts = {
+            'ores': ores if options['ores'] is None else options['ores'],
+            'components': components if options['components'] is None else options['components'],
+            'blocks': blocks if options['blocks'] is None else options['blocks'],
+        }
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be at least 1')
+
+        try:
+            generator = CatalogGenerator(
+                **counts,
+                seed=options['seed'],
+                materials_per_component=parse_range(options['materials_per_component']),
+                components_per_block=parse_range(options['components_per_block']),
+                skew=options['skew'],
+                prefix=options['prefix'],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(
+            f"Generating {counts['ores']} ores, {counts['components']} components and "
+            f"{counts['blocks']} blocks (seed {options['seed']})"
+        )
+        importer = CatalogImporter(chunk_size=options['chunk_size'], strict=True)
+        started = time.perf_counter()
+        try:
+            results = importer.run(
+                ores=generator.ores(),
+                components=generator.components(),
+                blocks=generator.blocks(),
+            )
+        except CatalogImportError as e:
+            raise CommandError(str(e))
+        elapsed = time.perf_counter() - started
+
+        total = 0
+        for stats in results:
+            self.stdout.write(self.style.SUCCESS(stats.summary()))
+            total += stats.written
+        rate = total / elapsed if elapsed else 0.0
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated {total} records in {elapsed:.2f}s ({rate:,.0f} rows/sec)'
+        ))
@@ -0,0 +1,85 @@
+"""
+Bulk-import ores, components and blocks from JSON or NDJSON files.
+
+Usage:
+    python manage.py import_catalog --ores ores.ndjson --components components.json \
+        --blocks blocks.json [--chunk-size 2000] [--strict] [--atomic]
+
+Each file may be a JSON array (e.g. a Django fixture) or newline-delimited
+JSON; pass ``-`` to read a file from stdin. See ``blocks.importer`` for the
+accepted record shapes.
+"""
+import sys
+import time
+from contextlib import ExitStack
+
+from django.core.management.base import BaseCommand, CommandError
+
+from blocks.importer import DEFAULT_CHUNK_SIZE, CatalogImporter, CatalogImportError
+
+
+class Command(BaseCommand):
+    help = 'Stream ores → components → blocks from JSON/NDJSON with batched validation and bulk writes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ores', help='Ore records (JSON array or NDJSON)')
+        parser.add_argument('--components', help='Component records (JSON array or NDJSON)')
+        parser.add_argument('--blocks', help='Block records (JSON array or NDJSON)')
+        parser.add_argument(
+            '--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+            help=f'Records validated and written per transaction (default {DEFAULT_CHUNK_SIZE})',
+        )
+        parser.add_argument(
+            '--strict', action='store_true',
+            help='Abort on the first invalid record instead of skipping it',
+        )
+        parser.add_argument(
+            '--atomic', action='store_true',
+            help='Run the whole import in one transaction (all or nothing)',
+        )
+
+    def handle(self, *args, **options):
+        paths = {key: options[key] for key in ('ores', 'components', 'blocks') if options[key]}
+        if not paths:
+            raise CommandError('Nothing to import: pass --ores, --components and/or --blocks')
+        if list(paths.values()).count('-') > 1:
+            raise CommandError('Only one file can be read from stdin')
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be at least 1')
+
+        importer = CatalogImporter(
+            chunk_size=options['chunk_size'],
+            strict=options['strict'],
+            atomic=options['atomic'],
+        )
+
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            try:
+                streams = {
+                    key: sys.stdin if path == '-' else stack.enter_context(open(path, encoding='utf-8'))
+                    for key, path in paths.items()
+                }
+            except OSError as e:
+                raise CommandError(f'Cannot open input: {e}')
+
+            try:
+                results = importer.run(**streams)
+            except CatalogImportError as e:
+                raise CommandError(str(e))
+        elapsed = time.perf_counter() - started
+
+        total = 0
+        for stats in results:
+            style = self.style.WARNING if stats.skipped else self.style.SUCCESS
+            self.stdout.write(style(stats.summary()))
+            for error in stats.errors[:10]:
+                self.stdout.write(f'  - {error}')
+            if len(stats.errors) > 10:
+                self.stdout.write(f'  ... and {len(stats.errors) - 10} more')
+            total += stats.written + stats.skipped
+
+        rate = total / elapsed if elapsed else 0.0
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {total} records in {elapsed:.2f}s ({rate:,.0f} rows/sec)'
+        ))
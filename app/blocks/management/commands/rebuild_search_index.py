@@ -0,0 +1,44 @@
+"""
+Rebuild the catalog search index.
+
+Usage:
+    python manage.py rebuild_search_index
+
+On SQLite the FTS5 shadow tables are dropped and refilled from the current
+rows (useful after restoring a database or loading fixtures with signals
+disabled). On PostgreSQL the GIN indexes are maintained by the database and
+there is nothing to do.
+"""
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from blocks.models import Block
+from blocks.search import drop_search_index, ensure_search_index, fts_table
+from components.models import Component
+from ores.models import Ore
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the SQLite FTS5 search tables for ores, components and blocks'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--database', default=DEFAULT_DB_ALIAS,
+            help='Database alias (default "default")',
+        )
+
+    def handle(self, *args, **options):
+        using = options['database']
+        if connections[using].vendor != 'sqlite':
+            self.stdout.write('Search indexes are maintained by PostgreSQL; nothing to rebuild.')
+            return
+
+        for model in (Ore, Component, Block):
+            drop_search_index(model, using)
+            if ensure_search_index(model, using):
+                count = model._default_manager.using(using).count()
+                self.stdout.write(self.style.SUCCESS(f'{fts_table(model)}: {count} rows indexed'))
+            else:
+                self.stdout.write(self.style.WARNING(
+                    f'{fts_table(model)}: FTS5 unavailable, list views use icontains'
+                ))
@@ -0,0 +1,21 @@
+"""
+Middleware for the Blocks app.
+"""
+from .identity_map import catalog_scope
+
+
+class CatalogIdentityMapMiddleware:
+    """
+    Give every request its own catalog identity map.
+
+    Views, template filters and model helpers then share one pinned recipe
+    graph and one batch of Ore/Component/Block instances per request (see
+    ``blocks.identity_map``). Template rendering happens inside this scope.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with catalog_scope():
+            return self.get_response(request)
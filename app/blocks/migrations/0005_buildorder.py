@@ -0,0 +1,30 @@
+# Generated by Django 6.0.1 on 2026-10-16 22:52
+
+import blocks.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blocks', '0004_make_input_output_mass_optional'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BuildOrder',
+            fields=[
+                ('order_id', models.UUIDField(default=blocks.models.generate_uuid, editable=False, help_text='UUIDv7 primary key', primary_key=True, serialize=False)),
+                ('name', models.CharField(help_text="Name of the build order (e.g., 'Mining Outpost')", max_length=100)),
+                ('blocks', models.JSONField(blank=True, default=list, help_text='JSON list of {"block_id": uuid, "quantity": int} entries')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp when the build order was created')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp when the build order was last updated')),
+            ],
+            options={
+                'verbose_name': 'Build Order',
+                'verbose_name_plural': 'Build Orders',
+                'db_table': 'blocks_buildorder',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.1 on 2026-10-16 22:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blocks', '0005_buildorder'),
+        ('components', '0002_componentmaterial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlockComponent',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('quantity', models.FloatField(help_text='Component quantity per block')),
+                ('block', models.ForeignKey(help_text='Block built from the component', on_delete=django.db.models.deletion.CASCADE, related_name='component_links', to='blocks.block')),
+                ('component', models.ForeignKey(help_text='Component used by the block', on_delete=django.db.models.deletion.CASCADE, related_name='block_links', to='components.component')),
+            ],
+            options={
+                'verbose_name': 'Block Component',
+                'verbose_name_plural': 'Block Components',
+                'db_table': 'blocks_blockcomponent',
+                'indexes': [models.Index(fields=['component', 'block'], name='blockcomponent_component_idx')],
+                'constraints': [models.UniqueConstraint(fields=('block', 'component'), name='unique_block_component')],
+            },
+        ),
+    ]
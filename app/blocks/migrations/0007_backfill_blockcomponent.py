@@ -0,0 +1,40 @@
+# Generated by Django 6.0.1 on 2026-10-16 22:55
+
+import uuid
+
+from django.db import migrations
+
+
+def backfill_component_links(apps, schema_editor):
+    """Create BlockComponent rows from every Block.components dict."""
+    Block = apps.get_model('blocks', 'Block')
+    BlockComponent = apps.get_model('blocks', 'BlockComponent')
+    Component = apps.get_model('components', 'Component')
+
+    component_ids = {str(pk) for pk in Component.objects.values_list('component_id', flat=True)}
+    rows = []
+    for block_id, components in Block.objects.values_list('block_id', 'components').iterator():
+        for comp_id, quantity in (components or {}).items():
+            try:
+                comp_id = str(uuid.UUID(str(comp_id)))
+            except ValueError:
+                continue
+            if comp_id in component_ids:
+                rows.append(BlockComponent(block_id=block_id, component_id=comp_id, quantity=quantity))
+    BlockComponent.objects.bulk_create(rows, batch_size=1000)
+
+
+def clear_component_links(apps, schema_editor):
+    """Remove all BlockComponent rows."""
+    apps.get_model('blocks', 'BlockComponent').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blocks', '0006_blockcomponent'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_component_links, clear_component_links),
+    ]
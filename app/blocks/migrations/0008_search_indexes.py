@@ -0,0 +1,54 @@
+# Generated by Django 6.0.1 on 2026-10-16 23:20
+
+from django.db import migrations
+
+SEARCH_TABLES = [('ores', 'Ore'), ('components', 'Component'), ('blocks', 'Block')]
+
+
+def index_name(model, suffix):
+    return f'{model._meta.model_name}_{suffix}'
+
+
+def create_search_indexes(apps, schema_editor):
+    """
+    PostgreSQL: GIN indexes for full-text and trigram search (blocks.search).
+
+    SQLite builds its FTS5 shadow tables from the post_migrate handler instead.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for app_label, model_name in SEARCH_TABLES:
+        model = apps.get_model(app_label, model_name)
+        schema_editor.add_index(model, GinIndex(
+            SearchVector('name', 'description', config='simple'),
+            name=index_name(model, 'search_vec'),
+        ))
+        schema_editor.add_index(model, GinIndex(
+            fields=['name'], opclasses=['gin_trgm_ops'], name=index_name(model, 'name_trgm'),
+        ))
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for app_label, model_name in SEARCH_TABLES:
+        model = apps.get_model(app_label, model_name)
+        for suffix in ('search_vec', 'name_trgm'):
+            schema_editor.execute(f'DROP INDEX IF EXISTS "{index_name(model, suffix)}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blocks', '0007_backfill_blockcomponent'),
+        ('components', '0003_backfill_componentmaterial'),
+        ('ores', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
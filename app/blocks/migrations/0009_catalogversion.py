@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-16 23:58
+
+import blocks.models
+from django.db import migrations, models
+
+
+def create_version_row(apps, schema_editor):
+    CatalogVersion = apps.get_model('blocks', 'CatalogVersion')
+    CatalogVersion.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blocks', '0008_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogVersion',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(default=1, primary_key=True, serialize=False)),
+                ('version', models.BigIntegerField(default=blocks.models.initial_catalog_version, help_text='Incremented on every catalog write')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp of the last catalog write')),
+            ],
+            options={
+                'verbose_name': 'Catalog Version',
+                'verbose_name_plural': 'Catalog Version',
+                'db_table': 'blocks_catalogversion',
+            },
+        ),
+        migrations.RunPython(create_version_row, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,10 @@
+import time
+import uuid
+
 from django.db import models
 from uuid_utils import uuid7
 from components.models import Component
+from .validators import validate_components
 
 
 def generate_uuid():
@@ -8,6 +12,16 @@ def generate_uuid():
     return str(uuid7())
 
 
+def initial_catalog_version():
+    """
+    Starting value for a new catalog version row.
+    
+    A timestamp rather than 0, so a recreated row (flushed or restored
+    database) never repeats a version some process still has cached.
+    """
+    return time.time_ns()
+
+
 class Block(models.Model):
     """
     Represents a buildable block in Space Engineers 2.
@@ -116,36 +130,16 @@ class Block(models.Model):
         """
         Validate that all component_ids in components JSON reference valid Components.
         
+        Resolves every referenced component with a single query
+        (see ``blocks.validators``).
+        
         Returns:
             tuple: (is_valid: bool, errors: list of error messages)
         """
         if not self.components:
             return True, []
         
-        errors = []
-        
-        # Components is now a dict mapping component_id -> quantity
-        for component_id, quantity in self.components.items():
-            try:
-                # Validate quantity
-                if not isinstance(quantity, (int, float)) or quantity <= 0:
-                    errors.append(
-                        f"Invalid quantity for component {component_id}: "
-                        f"must be positive number, got {quantity}"
-                    )
-                    continue
-                
-                # Validate component_id references existing Component
-                try:
-                    Component.objects.get(component_id=component_id)
-                except Component.DoesNotExist:
-                    errors.append(
-                        f"Component with ID {component_id} does not exist"
-                    )
-            except Exception as e:
-                errors.append(f"Error validating component {component_id}: {str(e)}")
-        
-        return len(errors) == 0, errors
+        return validate_components(self.components)
     
     def validate_consumer(self):
         """
@@ -201,12 +195,20 @@ class Block(models.Model):
         return Component.objects.filter(component_id__in=component_ids)
 
     def iter_component_requirements(self):
-        """Return component requirements with resolved Component objects when present."""
+        """
+        Return component requirements with resolved Component objects when present.
+        
+        All components are resolved in one batch through the request's
+        identity map (see ``blocks.identity_map``).
+        """
+        from .identity_map import get_many
+        
+        components = get_many(Component, (self.components or {}).keys())
         requirements = []
-
+        
         for comp_id, quantity in (self.components or {}).items():
-            comp = Component.objects.filter(component_id=comp_id).first() if comp_id else None
-
+            comp = components.get(str(comp_id)) if comp_id else None
+            
             requirements.append(
                 (
                     comp_id,
@@ -215,7 +217,7 @@ class Block(models.Model):
                     comp,
                 )
             )
-
+        
         return requirements
     
     def clean(self):
@@ -245,4 +247,268 @@ class Block(models.Model):
     def save(self, *args, **kwargs):
         """Override save to validate before saving."""
         self.clean()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        super().save(*args, **kwargs)
+    
+    def sync_component_links(self):
+        """
+        Rewrite this block's BlockComponent rows from the components JSON.
+        
+        Entries whose component does not exist are skipped until it is
+        created (``BlockComponent.backfill``). Called from post_save
+        (including raw fixture loads).
+        """
+        BlockComponent.objects.filter(block_id=self.block_id).delete()
+        BlockComponent.objects.bulk_create(
+            BlockComponent.rows_for(self.block_id, self.components)
+        )
+
+
+class BlockComponent(models.Model):
+    """
+    Relational mirror of one Block.components entry.
+    
+    Block.components stays the source of truth; these rows are dual-written
+    on save so "which blocks use this component" and resource totals become
+    indexed joins instead of JSON scans.
+    """
+    id = models.BigAutoField(primary_key=True)
+    
+    block = models.ForeignKey(
+        Block,
+        on_delete=models.CASCADE,
+        related_name='component_links',
+        help_text="Block built from the component"
+    )
+    
+    component = models.ForeignKey(
+        Component,
+        on_delete=models.CASCADE,
+        related_name='block_links',
+        help_text="Component used by the block"
+    )
+    
+    quantity = models.FloatField(
+        help_text="Component quantity per block"
+    )
+    
+    class Meta:
+        verbose_name = 'Block Component'
+        verbose_name_plural = 'Block Components'
+        db_table = 'blocks_blockcomponent'
+        constraints = [
+            models.UniqueConstraint(fields=['block', 'component'], name='unique_block_component'),
+        ]
+        indexes = [
+            models.Index(fields=['component', 'block'], name='blockcomponent_component_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.block_id} → {self.component_id} × {self.quantity}"
+    
+    @classmethod
+    def rows_for(cls, block_id, components, existing_component_ids=None):
+        """
+        Build (unsaved) rows for a components dict.
+        
+        Args:
+            block_id: Owning block's primary key
+            components: {component_id: quantity}
+            existing_component_ids: Optional set of component ID strings
+                known to exist; queried when not given
+        
+        Returns:
+            list: BlockComponent instances ready for bulk_create
+        """
+        component_ids = {}
+        for comp_id, quantity in (components or {}).items():
+            try:
+                component_ids[str(uuid.UUID(str(comp_id)))] = quantity
+            except ValueError:
+                continue
+        
+        if existing_component_ids is None:
+            existing_component_ids = {
+                str(pk) for pk in
+                Component.objects.filter(component_id__in=component_ids).values_list('component_id', flat=True)
+            }
+        
+        return [
+            cls(block_id=block_id, component_id=comp_id, quantity=quantity)
+            for comp_id, quantity in component_ids.items()
+            if comp_id in existing_component_ids
+        ]
+    
+    @classmethod
+    def backfill(cls, component_ids):
+        """
+        Add the rows ``rows_for`` skipped because these components did not exist yet.
+        
+        Blocks saved before one of their components (e.g. fixtures loaded in
+        the wrong order) get their missing link once the component is created.
+        
+        Args:
+            component_ids: Primary keys of newly created components
+        """
+        keys = {str(pk) for pk in component_ids}
+        if not keys:
+            return
+        rows = [
+            cls(block_id=block_id, component_id=key, quantity=components[key])
+            for block_id, components in
+            Block.objects.filter(components__has_any_keys=list(keys)).values_list('block_id', 'components')
+            for key in keys.intersection(components)
+        ]
+        cls.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+class BuildOrder(models.Model):
+    """
+    A saved list of blocks to build, with quantities (Phase 3).
+    
+    Totals are computed by blocks.calculators.BuildOrderCalculator, which
+    resolves the whole order in a fixed number of batched queries.
+    """
+    order_id = models.UUIDField(
+        primary_key=True,
+        default=generate_uuid,
+        editable=False,
+        help_text="UUIDv7 primary key"
+    )
+    
+    name = models.CharField(
+        max_length=100,
+        help_text="Name of the build order (e.g., 'Mining Outpost')"
+    )
+    
+    blocks = models.JSONField(
+        default=list,
+        blank=True,
+        help_text='JSON list of {"block_id": uuid, "quantity": int} entries'
+    )
+    
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Timestamp when the build order was created"
+    )
+    
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Timestamp when the build order was last updated"
+    )
+    
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Build Order'
+        verbose_name_plural = 'Build Orders'
+        db_table = 'blocks_buildorder'
+    
+    def __str__(self):
+        return self.name
+    
+    def validate_blocks(self):
+        """
+        Validate the blocks list structure and that every block_id exists.
+        
+        Block existence is checked with a single batched query.
+        
+        Returns:
+            tuple: (is_valid: bool, errors: list of error messages)
+        """
+        if not self.blocks:
+            return True, []
+        
+        if not isinstance(self.blocks, list):
+            return False, ["Blocks must be a list of {block_id, quantity} entries"]
+        
+        errors = []
+        block_ids = set()
+        
+        for line in self.blocks:
+            if not isinstance(line, dict) or 'block_id' not in line:
+                errors.append(f"Invalid build order line: {line}")
+                continue
+            
+            quantity = line.get('quantity')
+            if not isinstance(quantity, int) or isinstance(quantity, bool) or quantity <= 0:
+                errors.append(
+                    f"Invalid quantity for block {line['block_id']}: "
+                    f"must be positive integer, got {quantity}"
+                )
+                continue
+            
+            try:
+                block_ids.add(str(uuid.UUID(str(line['block_id']))))
+            except ValueError:
+                errors.append(f"Invalid block UUID: {line['block_id']}")
+        
+        if block_ids:
+            found = {
+                str(pk) for pk in Block.objects.filter(block_id__in=block_ids).values_list('block_id', flat=True)
+            }
+            for block_id in sorted(block_ids - found):
+                errors.append(f"Block with ID {block_id} does not exist")
+        
+        return len(errors) == 0, errors
+    
+    def calculate(self):
+        """
+        Calculate full totals for this build order.
+        
+        Returns:
+            dict: See BuildOrderCalculator.calculate()
+        """
+        from .calculators import BuildOrderCalculator
+        return BuildOrderCalculator(self.blocks).calculate()
+    
+    def total_mass(self):
+        """Total mass of all blocks in kg."""
+        return self.calculate()['total_mass']
+    
+    def required_components(self):
+        """Aggregated components: {component_id: {'name', 'quantity', ...}}."""
+        return self.calculate()['components']
+    
+    def required_ores(self):
+        """Aggregated ores: {ore_id: {'name', 'quantity', 'mass'}}."""
+        return self.calculate()['ores']
+    
+    def clean(self):
+        """Validate model before saving."""
+        from django.core.exceptions import ValidationError
+        
+        is_valid, errors = self.validate_blocks()
+        if not is_valid:
+            raise ValidationError(f"Validation failed: {', '.join(errors)}")
+    
+    def save(self, *args, **kwargs):
+        """Override save to validate before saving."""
+        self.clean()
+        super().save(*args, **kwargs)
+
+
+class CatalogVersion(models.Model):
+    """
+    Single-row, monotonically increasing version of the whole catalog.
+    
+    Bumped in the same transaction as every Ore, Component or Block write
+    (see ``blocks.catalog_version``); derived caches put it in their keys.
+    """
+    id = models.PositiveSmallIntegerField(primary_key=True, default=1)
+    
+    version = models.BigIntegerField(
+        default=initial_catalog_version,
+        help_text="Incremented on every catalog write"
+    )
+    
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Timestamp of the last catalog write"
+    )
+    
+    class Meta:
+        verbose_name = 'Catalog Version'
+        verbose_name_plural = 'Catalog Version'
+        db_table = 'blocks_catalogversion'
+    
+    def __str__(self):
+        return f"Catalog v{self.version}"
@@ -0,0 +1,364 @@
+"""
+Compiled recipe graph for the Block → Component → Ore resource chain.
+
+Loads every Ore, Component and Block once per process into integer-indexed
+arrays so any block (or any ``{component_id: quantity}`` map) can be expanded
+into component and ore totals without touching the database.
+
+The compiled graph is tagged with the catalog version (see
+``blocks.catalog_version``). Writes to Ore, Component or Block bump that
+version and the next reader rebuilds the graph.
+
+The graph also keeps name-order rank indexes for previous/next links on the
+detail pages, and typeahead name indexes for the form pickers.
+"""
+import logging
+import threading
+from typing import NamedTuple
+
+from components.models import Component
+from ores.models import Ore
+from .catalog_version import get_catalog_version
+from .identity_map import current_identity_map
+from .models import Block
+
+logger = logging.getLogger(__name__)
+
+# Chains are keyed by catalog version, so they never go stale; the timeout
+# only lets entries of superseded versions age out.
+RESOURCE_CHAIN_CACHE_TIMEOUT = 60 * 60 * 24
+
+_graph = None
+_graph_lock = threading.Lock()
+
+
+class CatalogRef(NamedTuple):
+    """Lightweight (pk, name) reference for navigation links."""
+    pk: str
+    name: str
+
+
+class RecipeGraph:
+    """
+    Immutable, integer-indexed snapshot of the recipe catalog.
+
+    Ores, components and blocks are stored as parallel lists; the ``*_index``
+    dicts map UUID strings (and ``block_name_index`` block names) to list
+    positions. Recipes are tuples of ``(index, quantity)`` pairs pointing
+    into the next level down.
+    """
+
+    def __init__(self, version, ores, components, blocks):
+        """
+        Compile the graph from raw value rows.
+
+        Args:
+            version: Catalog version this snapshot was built from
+            ores: Iterable of (ore_id, name, mass)
+            components: Iterable of (component_id, name, mass, materials,
+                fabricator_type, crafting_time)
+            blocks: Iterable of (block_id, name, mass, components)
+        """
+        self.version = version
+
+        self.ore_ids = []
+        self.ore_names = []
+        self.ore_masses = []
+        self.ore_index = {}
+        for ore_id, name, mass in ores:
+            self.ore_index[str(ore_id)] = len(self.ore_ids)
+            self.ore_ids.append(str(ore_id))
+            self.ore_names.append(name)
+            self.ore_masses.append(float(mass))
+
+        self.component_ids = []
+        self.component_names = []
+        self.component_masses = []
+        self.component_fabricators = []
+        self.component_crafting_times = []
+        self.component_materials = []
+        self.component_index = {}
+        for comp_id, name, mass, materials, fabricator, crafting_time in components:
+            self.component_index[str(comp_id)] = len(self.component_ids)
+            self.component_ids.append(str(comp_id))
+            self.component_names.append(name)
+            self.component_masses.append(float(mass))
+            self.component_fabricators.append(fabricator or '')
+            self.component_crafting_times.append(float(crafting_time or 0))
+            self.component_materials.append(self._link(materials, self.ore_index, name, 'Ore'))
+
+        self.block_ids = []
+        self.block_names = []
+        self.block_masses = []
+        self.block_components = []
+        self.block_index = {}
+        self.block_name_index = {}
+        for block_id, name, mass, block_components in blocks:
+            self.block_index[str(block_id)] = len(self.block_ids)
+            self.block_name_index[name] = len(self.block_ids)
+            self.block_ids.append(str(block_id))
+            self.block_names.append(name)
+            self.block_masses.append(float(mass))
+            self.block_components.append(
+                self._link(block_components, self.component_index, name, 'Component')
+            )
+
+        # Name-order rank indexes and typeahead indexes, built on first use
+        self._ranks = {}
+        self._name_indexes = {}
+
+    @classmethod
+    def build(cls, version):
+        """Load the whole catalog in three queries and compile it."""
+        ores = Ore.objects.order_by().values_list('ore_id', 'name', 'mass')
+        components = Component.objects.order_by().values_list(
+            'component_id', 'name', 'mass', 'materials', 'fabricator_type', 'crafting_time'
+        )
+        blocks = Block.objects.order_by().values_list('block_id', 'name', 'mass', 'components')
+        graph = cls(version, ores, components, blocks)
+        logger.debug(
+            f"Compiled recipe graph v{version}: {len(graph.ore_ids)} ores, "
+            f"{len(graph.component_ids)} components, {len(graph.block_ids)} blocks"
+        )
+        return graph
+
+    @staticmethod
+    def _link(recipe, index, owner_name, label):
+        """Resolve a ``{uuid: quantity}`` map to ``(index, quantity)`` pairs."""
+        links = []
+        for ref_id, quantity in (recipe or {}).items():
+            position = index.get(str(ref_id))
+            if position is None:
+                logger.warning(f"{label} {ref_id} not found for {owner_name}")
+                continue
+            links.append((position, quantity))
+        return tuple(links)
+
+    # ---- Lookups ----
+
+    def component_name(self, component_id):
+        """Return the component's name, or None if it is not in the catalog."""
+        position = self.component_index.get(str(component_id))
+        return None if position is None else self.component_names[position]
+
+    def component_mass(self, component_id):
+        """Return the component's mass in kg, or None if it is not in the catalog."""
+        position = self.component_index.get(str(component_id))
+        return None if position is None else self.component_masses[position]
+
+    def ore_name(self, ore_id):
+        """Return the ore's name, or None if it is not in the catalog."""
+        position = self.ore_index.get(str(ore_id))
+        return None if position is None else self.ore_names[position]
+
+    def ore_mass(self, ore_id):
+        """Return the ore's mass in kg, or None if it is not in the catalog."""
+        position = self.ore_index.get(str(ore_id))
+        return None if position is None else self.ore_masses[position]
+
+    # ---- Navigation ----
+
+    def _name_ranks(self, kind):
+        """
+        Name-sorted positions and each position's rank for one catalog table.
+
+        Computed once per graph (O(N log N)) and reused for every lookup.
+        """
+        ranks = self._ranks.get(kind)
+        if ranks is None:
+            names = getattr(self, f'{kind}_names')
+            order = sorted(range(len(names)), key=names.__getitem__)
+            rank = [0] * len(order)
+            for position, index in enumerate(order):
+                rank[index] = position
+            ranks = self._ranks[kind] = (order, rank)
+        return ranks
+
+    def neighbours(self, kind, pk):
+        """
+        Previous and next entries by name, in O(1) after the first call.
+
+        Args:
+            kind: 'ore', 'component' or 'block'
+            pk: Primary key of the current row
+
+        Returns:
+            tuple: (CatalogRef or None, CatalogRef or None)
+        """
+        index = getattr(self, f'{kind}_index').get(str(pk))
+        if index is None:
+            return None, None
+        order, rank = self._name_ranks(kind)
+        ids = getattr(self, f'{kind}_ids')
+        names = getattr(self, f'{kind}_names')
+        position = rank[index]
+        refs = []
+        for neighbour in (position - 1, position + 1):
+            if 0 <= neighbour < len(order):
+                refs.append(CatalogRef(ids[order[neighbour]], names[order[neighbour]]))
+            else:
+                refs.append(None)
+        return tuple(refs)
+
+    def name_index(self, kind):
+        """
+        Typeahead index over one table's names (see ``blocks.autocomplete``).
+
+        Args:
+            kind: 'ore', 'component' or 'block'
+        """
+        index = self._name_indexes.get(kind)
+        if index is None:
+            from .autocomplete import NameIndex
+            index = self._name_indexes[kind] = NameIndex(
+                getattr(self, f'{kind}_ids'), getattr(self, f'{kind}_names'),
+            )
+        return index
+
+    def names_for(self, kind, pks):
+        """
+        ``{pk: name}`` for the given primary keys, skipping unknown ones.
+
+        Lets forms label their selected rows without shipping the catalog.
+        """
+        index = getattr(self, f'{kind}_index')
+        names = getattr(self, f'{kind}_names')
+        positions = ((str(pk), index.get(str(pk))) for pk in pks)
+        return {pk: names[position] for pk, position in positions if position is not None}
+
+    # ---- Expansion ----
+
+    def expand(self, components):
+        """
+        Expand a ``{component_id: quantity}`` map into its full resource chain.
+
+        Args:
+            components: dict mapping component UUID strings to quantities
+
+        Returns:
+            dict: Same structure BlockDetailView renders:
+                {'components': [...], 'ores': {ore_id: {...}}, 'total_ore_mass': float}
+        """
+        components_data = []
+        ore_totals = {}
+
+        for comp_id, quantity in (components or {}).items():
+            comp_pos = self.component_index.get(str(comp_id))
+            if comp_pos is None:
+                logger.warning(f"Component {comp_id} not found in recipe graph")
+                continue
+
+            mass = self.component_masses[comp_pos]
+            comp_data = {
+                'id': self.component_ids[comp_pos],
+                'name': self.component_names[comp_pos],
+                'quantity': quantity,
+                'mass_per_unit': mass,
+                'total_mass': mass * quantity,
+                'materials': [],
+            }
+
+            for ore_pos, ore_quantity in self.component_materials[comp_pos]:
+                ore_id = self.ore_ids[ore_pos]
+                total_ore_qty = ore_quantity * quantity
+                comp_data['materials'].append({
+                    'id': ore_id,
+                    'name': self.ore_names[ore_pos],
+                    'quantity_per_component': ore_quantity,
+                    'total_quantity': total_ore_qty,
+                    'mass_per_unit': self.ore_masses[ore_pos],
+                })
+
+                if ore_id not in ore_totals:
+                    ore_totals[ore_id] = {
+                        'name': self.ore_names[ore_pos],
+                        'quantity': 0,
+                        'mass': self.ore_masses[ore_pos],
+                    }
+                ore_totals[ore_id]['quantity'] += total_ore_qty
+
+            components_data.append(comp_data)
+
+        total_ore_mass = sum(ore['quantity'] * ore['mass'] for ore in ore_totals.values())
+
+        return {
+            'components': components_data,
+            'ores': ore_totals,
+            'total_ore_mass': total_ore_mass,
+        }
+
+    def ore_totals(self, components):
+        """
+        Flattened ore quantities for a ``{component_id: quantity}`` map.
+
+        Cheaper than ``expand`` when only the totals are needed (exports,
+        batch calculations): no per-component detail dicts are built.
+
+        Returns:
+            dict: {ore_id: quantity}
+        """
+        totals = {}
+        for comp_id, quantity in (components or {}).items():
+            comp_pos = self.component_index.get(str(comp_id))
+            if comp_pos is None:
+                continue
+            for ore_pos, ore_quantity in self.component_materials[comp_pos]:
+                ore_id = self.ore_ids[ore_pos]
+                totals[ore_id] = totals.get(ore_id, 0) + ore_quantity * quantity
+        return totals
+
+    def expand_block(self, block_id):
+        """
+        Expand a block stored in the graph into its full resource chain.
+
+        Returns:
+            dict: Resource chain (see ``expand``), or None if the block is unknown
+        """
+        block_pos = self.block_index.get(str(block_id))
+        if block_pos is None:
+            return None
+        components = {
+            self.component_ids[comp_pos]: quantity
+            for comp_pos, quantity in self.block_components[block_pos]
+        }
+        return self.expand(components)
+
+
+def resource_chain_cache_key(block_id, version):
+    """Cache key for a block's expanded resource chain at a catalog version."""
+    return f'resource_chain_{version}_{block_id}'
+
+
+def get_recipe_graph():
+    """
+    Return the compiled recipe graph for the current catalog version.
+
+    Inside a request the graph is pinned by the identity map, so only the
+    first call per request checks the version (see ``blocks.identity_map``).
+    """
+    identity_map = current_identity_map()
+    if identity_map is not None:
+        return identity_map.graph
+    return load_recipe_graph()
+
+
+def load_recipe_graph():
+    """
+    Return the process-wide graph, rebuilding it if the version has moved.
+
+    Rebuilds (three queries) only when the version has moved since the
+    process-local graph was compiled.
+    """
+    global _graph
+
+    version = get_catalog_version()
+    graph = _graph
+    if graph is not None and graph.version == version:
+        return graph
+
+    with _graph_lock:
+        graph = _graph
+        if graph is None or graph.version != version:
+            graph = RecipeGraph.build(version)
+            _graph = graph
+    return graph
@@ -0,0 +1,302 @@
+"""
+Ranked, typo-tolerant search for the Ore, Component and Block list views.
+
+PostgreSQL
+    Full-text match on ``to_tsvector('simple', name || description)`` OR
+    ``pg_trgm`` similarity on the name, ranked by ``ts_rank`` plus trigram
+    similarity. Both are served by GIN indexes (``blocks`` migration 0008).
+
+SQLite
+    One FTS5 shadow table per model (``<table>_fts``, trigram tokenizer),
+    created and filled after ``migrate`` (``post_migrate``) and kept in sync
+    by the ``post_save``/``post_delete`` signals and the bulk importer. The
+    query's trigrams are OR-ed, so a misspelt word still hits some of them;
+    the best ``SEARCH_RESULT_LIMIT`` candidates come back in bm25 order and
+    each query word is scored with pg_trgm-style word similarity against the
+    name and description. When more rows share the query's trigrams, rows
+    past that ranked head still match if every query word appears in their
+    name or description; they sort after the ranked rows.
+
+Queries shorter than three characters cannot be split into trigrams and
+fall back to ``icontains``. ``apply_search`` annotates matches with
+``search_rank`` (higher is better) for the list views to sort on.
+"""
+import hashlib
+import logging
+from functools import lru_cache
+
+from django.db import DatabaseError, connections
+from django.db.models import Case, FloatField, Q, Value, When
+
+logger = logging.getLogger(__name__)
+
+# Candidates ranked from the FTS5 index per query (SQLite); further matches
+# are found by a plain filter and sort after them
+SEARCH_RESULT_LIMIT = 200
+
+# Mean word similarity a row needs to count as a match (SQLite; pg_trgm's default)
+MIN_WORD_SIMILARITY = 0.3
+
+TRIGRAM_SIZE = 3
+
+# Models whose FTS5 table could not be created (SQLite built without FTS5/trigram)
+_unavailable = set()
+
+# (database alias, table) pairs known to exist, so writes skip the lookup
+_ready = set()
+
+
+def fts_table(model):
+    """Name of the FTS5 shadow table for a model."""
+    return f'{model._meta.db_table}_fts'
+
+
+def _rowid(pk):
+    """Stable 63-bit rowid for a UUID primary key."""
+    digest = hashlib.blake2b(str(pk).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') >> 1
+
+
+def trigrams(text):
+    """Lower-cased trigrams inside each word of ``text`` (what FTS5 indexes)."""
+    grams = set()
+    for word in text.lower().split():
+        for start in range(len(word) - TRIGRAM_SIZE + 1):
+            grams.add(word[start:start + TRIGRAM_SIZE])
+    return grams
+
+
+@lru_cache(maxsize=4096)
+def _word_grams(word):
+    """Padded trigrams of one word, built the way pg_trgm does."""
+    padded = f'  {word} '
+    return frozenset(padded[i:i + TRIGRAM_SIZE] for i in range(len(padded) - TRIGRAM_SIZE + 1))
+
+
+def word_similarity(word, words):
+    """Best trigram similarity between ``word`` and any of ``words``."""
+    grams = _word_grams(word)
+    best = 0.0
+    for other in words:
+        other_grams = _word_grams(other)
+        best = max(best, len(grams & other_grams) / len(grams | other_grams))
+    return best
+
+
+def _uses_fts(model, using):
+    return connections[using].vendor == 'sqlite' and model not in _unavailable
+
+
+# ---- SQLite FTS5 shadow tables ----
+
+def ensure_search_index(model, using='default'):
+    """
+    Create and fill the model's FTS5 table if it does not exist yet.
+
+    The table is never created inside a transaction: SQLite cannot roll back
+    a virtual-table creation cleanly and later savepoints fail. Callers in a
+    transaction get False until ``post_migrate`` or ``rebuild_search_index``
+    has built it.
+
+    Returns:
+        bool: True if the table is usable
+    """
+    if not _uses_fts(model, using):
+        return False
+    table = fts_table(model)
+    if (using, table) in _ready:
+        return True
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [table])
+        if cursor.fetchone():
+            _ready.add((using, table))
+            return True
+        if connection.in_atomic_block:
+            return False
+        try:
+            cursor.execute(
+                f'CREATE VIRTUAL TABLE "{table}" USING fts5('
+                f"pk UNINDEXED, name, description, tokenize = 'trigram')"
+            )
+        except DatabaseError as e:
+            logger.warning(f"FTS5 search unavailable for {table}, using icontains: {e}")
+            _unavailable.add(model)
+            return False
+
+    pk_name = model._meta.pk.name
+    rows = model._default_manager.using(using).values_list(pk_name, 'name', 'description')
+    _write_rows(model, rows.iterator(), using)
+    _ready.add((using, table))
+    logger.info(f"Built search index {table}")
+    return True
+
+
+def drop_search_index(model, using='default'):
+    """Drop the model's FTS5 table (rebuilt on next use)."""
+    if connections[using].vendor != 'sqlite':
+        return
+    table = fts_table(model)
+    with connections[using].cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS "{table}"')
+    _ready.discard((using, table))
+    _unavailable.discard(model)
+
+
+def _write_rows(model, rows, using, chunk_size=1000):
+    table = fts_table(model)
+    with connections[using].cursor() as cursor:
+        batch = []
+        for pk, name, description in rows:
+            batch.append((_rowid(pk), str(pk), name, description or ''))
+            if len(batch) >= chunk_size:
+                _flush(cursor, table, batch)
+                batch = []
+        if batch:
+            _flush(cursor, table, batch)
+
+
+def _flush(cursor, table, batch):
+    cursor.executemany(f'DELETE FROM "{table}" WHERE rowid = %s', [(row[0],) for row in batch])
+    cursor.executemany(
+        f'INSERT INTO "{table}" (rowid, pk, name, description) VALUES (%s, %s, %s, %s)', batch
+    )
+
+
+def index_instances(model, instances, using='default'):
+    """Add or refresh search entries for saved instances."""
+    if not instances or not ensure_search_index(model, using):
+        return
+    _write_rows(model, ((obj.pk, obj.name, obj.description) for obj in instances), using)
+
+
+def remove_from_index(model, pks, using='default'):
+    """Drop search entries for deleted rows."""
+    if not pks or not ensure_search_index(model, using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.executemany(
+            f'DELETE FROM "{fts_table(model)}" WHERE rowid = %s', [(_rowid(pk),) for pk in pks]
+        )
+
+
+def _fts_ranking(model, text, using, limit=SEARCH_RESULT_LIMIT):
+    """
+    Rank the best ``limit`` FTS5 candidates for ``text``.
+
+    Returns:
+        None: if the query is too short for trigrams
+        tuple: (ranked ``[(pk, score)]``, whether more than ``limit`` rows
+            matched the index)
+    """
+    query_grams = trigrams(text)
+    if not query_grams:
+        return None
+    match = ' OR '.join('"{}"'.format(gram.replace('"', '""')) for gram in sorted(query_grams))
+    table = fts_table(model)
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f'SELECT pk, name, description FROM "{table}" WHERE "{table}" MATCH %s '
+            f'ORDER BY bm25("{table}") LIMIT %s',
+            [match, limit + 1],
+        )
+        candidates = cursor.fetchall()
+    truncated = len(candidates) > limit
+    candidates = candidates[:limit]
+
+    query_words = [word for word in text.lower().split() if len(word) >= TRIGRAM_SIZE]
+    ranking = []
+    for pk, name, description in candidates:
+        name_words = set(name.lower().split())
+        description_words = set(description.lower().split())
+        name_scores = [word_similarity(word, name_words) for word in query_words]
+        scores = [
+            max(name_score, word_similarity(word, description_words))
+            for word, name_score in zip(query_words, name_scores)
+        ]
+        score = sum(scores) / len(scores)
+        if score >= MIN_WORD_SIMILARITY:
+            # Name hits outrank description-only hits; ties keep bm25 order
+            name_score = sum(name_scores) / len(name_scores)
+            ranking.append((pk, round(name_score + score, 4)))
+    ranking.sort(key=lambda item: item[1], reverse=True)
+    return ranking, truncated
+
+
+def build_search_indexes(using='default', **kwargs):
+    """``post_migrate`` handler: make sure every catalog model has its FTS5 table."""
+    from components.models import Component
+    from ores.models import Ore
+    from .models import Block
+
+    for model in (Ore, Component, Block):
+        ensure_search_index(model, using)
+
+
+# ---- Query API ----
+
+def _contains(queryset, text):
+    return queryset.filter(
+        Q(name__icontains=text) | Q(description__icontains=text)
+    ).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+def _all_words(text):
+    """Rows whose name or description contains every word of ``text``."""
+    condition = Q()
+    for word in text.split():
+        condition &= Q(name__icontains=word) | Q(description__icontains=word)
+    return condition
+
+
+def _postgres_search(queryset, text):
+    from django.contrib.postgres.search import (
+        SearchQuery, SearchRank, SearchVector, TrigramSimilarity,
+    )
+    vector = SearchVector('name', 'description', config='simple')
+    query = SearchQuery(text, config='simple', search_type='websearch')
+    return queryset.annotate(
+        search_vector=vector,
+        search_rank=SearchRank(vector, query) + TrigramSimilarity('name', text),
+    ).filter(Q(search_vector=query) | Q(name__trigram_similar=text))
+
+
+def apply_search(queryset, text):
+    """
+    Filter ``queryset`` to rows matching ``text`` and annotate ``search_rank``.
+
+    Args:
+        queryset: Ore, Component or Block queryset
+        text: User's search string
+
+    Returns:
+        QuerySet: matching rows with a ``search_rank`` float (higher is better)
+    """
+    text = text.strip()
+    model = queryset.model
+    using = queryset.db
+    if not text:
+        return queryset
+
+    if connections[using].vendor == 'postgresql':
+        return _postgres_search(queryset, text)
+
+    if not ensure_search_index(model, using):
+        return _contains(queryset, text)
+    result = _fts_ranking(model, text, using)
+    if result is None:
+        return _contains(queryset, text)
+    ranking, truncated = result
+    matches = Q(pk__in=[pk for pk, _ in ranking])
+    if truncated:
+        # The ranked head only orders results; rows past it still match
+        matches |= _all_words(text)
+    elif not ranking:
+        return queryset.none().annotate(search_rank=Value(0.0, output_field=FloatField()))
+    return queryset.filter(matches).annotate(
+        search_rank=Case(
+            *(When(pk=pk, then=Value(score)) for pk, score in ranking),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+    )
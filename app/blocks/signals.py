@@ -0,0 +1,60 @@
+"""
+Signal handlers for the Blocks app.
+
+Keeps derived catalog data in step with writes to Ore, Component and Block:
+
+- Block.components is dual-written into BlockComponent rows; a new component
+  back-fills the rows of blocks that referenced it before it existed.
+- The catalog version is bumped in the write's transaction, so the recipe
+  graph, resource chains and list totals keyed on it are rebuilt on demand
+  (see ``blocks.catalog_version``).
+- SQLite FTS5 search tables follow the saved/deleted rows (see ``blocks.search``).
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from components.models import Component
+from ores.models import Ore
+from .catalog_version import bump_catalog_version
+from .models import Block, BlockComponent
+from .search import index_instances, remove_from_index
+
+
+@receiver(post_save, sender=Block)
+def sync_component_links(sender, instance, **kwargs):
+    """Mirror the saved components JSON into BlockComponent rows."""
+    instance.sync_component_links()
+
+
+@receiver(post_save, sender=Component)
+def backfill_component_links(sender, instance, created, **kwargs):
+    """Link blocks that referenced this component before it existed."""
+    if created:
+        BlockComponent.backfill([instance.component_id])
+
+
+@receiver(post_save, sender=Ore)
+@receiver(post_save, sender=Component)
+@receiver(post_save, sender=Block)
+@receiver(post_delete, sender=Ore)
+@receiver(post_delete, sender=Component)
+@receiver(post_delete, sender=Block)
+def invalidate_catalog(sender, instance, using, **kwargs):
+    """Bump the catalog version; version-keyed caches drop out on their own."""
+    bump_catalog_version(using=using)
+
+
+@receiver(post_save, sender=Ore)
+@receiver(post_save, sender=Component)
+@receiver(post_save, sender=Block)
+def update_search_index(sender, instance, using, **kwargs):
+    """Refresh the row's search entry in the same transaction as the write."""
+    index_instances(sender, [instance], using=using)
+
+
+@receiver(post_delete, sender=Ore)
+@receiver(post_delete, sender=Component)
+@receiver(post_delete, sender=Block)
+def remove_search_entry(sender, instance, using, **kwargs):
+    """Drop the deleted row's search entry."""
+    remove_from_index(sender, [instance.pk], using=using)
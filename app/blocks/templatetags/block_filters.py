@@ -8,9 +8,7 @@ and calculating resource chains.
 Pattern adapted from ENH-0000006 component_filters.py
 """
 from django import template
-from components.models import Component
-from django.core.cache import cache
-from django.core.exceptions import ValidationError
+from blocks.recipe_graph import get_recipe_graph
 import logging
 
 register = template.Library()
@@ -31,7 +29,7 @@ def get_component_name(component_id):
     Returns:
         Component name if found, otherwise "Unknown Component (uuid)"
     
-    Caches component lookups to improve performance.
+    Resolved from the compiled recipe graph, so no per-UUID queries.
     """
     if not component_id:
         return "Unknown Component"
@@ -39,30 +37,12 @@ def get_component_name(component_id):
     # Convert to string if UUID object
     component_id_str = str(component_id)
     
-    # Check cache first (5 minute TTL)
-    cache_key = f'component_name_{component_id_str}'
-    cached_name = cache.get(cache_key)
-    
-    if cached_name:
-        return cached_name
-    
-    # Query database
-    try:
-        component = Component.objects.get(component_id=component_id_str)
-        component_name = component.name
-        
-        # Cache for 5 minutes
-        cache.set(cache_key, component_name, 300)
-        
-        logger.debug(f"Resolved component {component_id_str} to '{component_name}'")
-        return component_name
-        
-    except Component.DoesNotExist:
+    component_name = get_recipe_graph().component_name(component_id_str)
+    if component_name is None:
         logger.warning(f"Component {component_id_str} not found in database")
-        return f"Unknown Component"
-    except (ValidationError, ValueError, TypeError) as e:
-        logger.error(f"Error resolving component {component_id_str}: {e}")
-        return f"Unknown Component"
+        return "Unknown Component"
+    
+    return component_name
 
 
 @register.filter
@@ -82,20 +62,8 @@ def get_component_mass(component_id):
     if not component_id:
         return 0
     
-    component_id_str = str(component_id)
-    cache_key = f'component_mass_{component_id_str}'
-    cached_mass = cache.get(cache_key)
-    
-    if cached_mass is not None:
-        return cached_mass
-    
-    try:
-        component = Component.objects.get(component_id=component_id_str)
-        mass = float(component.mass)
-        cache.set(cache_key, mass, 300)
-        return mass
-    except (Component.DoesNotExist, ValidationError, ValueError, TypeError):
-        return 0
+    mass = get_recipe_graph().component_mass(str(component_id))
+    return 0 if mass is None else mass
 
 
 @register.filter
@@ -0,0 +1,85 @@
+"""
+Tests for the in-process name index and the typeahead endpoint.
+"""
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from blocks.autocomplete import NameIndex
+from blocks.recipe_graph import load_recipe_graph
+from components.models import Component
+from ores.models import Ore
+
+
+def names(results):
+    return [result['name'] for result in results]
+
+
+class NameIndexTest(SimpleTestCase):
+
+    def setUp(self):
+        self.index = NameIndex(
+            ['1', '2', '3', '4'],
+            ['Steel Plate', 'Steel Tube', 'Large Steel Plate', 'Motor'],
+        )
+
+    def test_name_prefix_ranks_above_word_prefix(self):
+        self.assertEqual(names(self.index.search('steel')),
+                         ['Steel Plate', 'Steel Tube', 'Large Steel Plate'])
+        self.assertEqual(names(self.index.search('plate')), ['Large Steel Plate', 'Steel Plate'])
+
+    def test_prefix_is_case_and_whitespace_insensitive(self):
+        self.assertEqual(names(self.index.search('  STEEL   t'))[0], 'Steel Tube')
+
+    def test_typos_fall_back_to_trigrams(self):
+        self.assertEqual(names(self.index.search('motr')), ['Motor'])
+        self.assertEqual(names(self.index.search('steal tube'))[0], 'Steel Tube')
+
+    def test_limit_and_empty_query(self):
+        self.assertEqual(len(self.index.search('s', limit=2)), 2)
+        self.assertEqual(self.index.search('   '), [])
+        self.assertEqual(self.index.search('xyzzy'), [])
+
+    def test_results_carry_ids(self):
+        self.assertEqual(self.index.search('motor'), [{'id': '4', 'name': 'Motor'}])
+
+
+class AutocompleteApiTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.iron = Ore.objects.create(name="Iron Ore", mass=1.0)
+        Ore.objects.create(name="Nickel Ore", mass=1.0)
+        cls.plate = Component.objects.create(
+            name="Steel Plate", mass=20.0, materials={str(cls.iron.ore_id): 21.0},
+        )
+        cls.url = reverse('blocks:catalog_autocomplete')
+
+    def test_returns_top_matches_without_queries_once_graph_is_loaded(self):
+        load_recipe_graph()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'kind': 'ore', 'q': 'iro'})
+        self.assertEqual(response.json()['results'],
+                         [{'id': str(self.iron.ore_id), 'name': 'Iron Ore'}])
+        self.assertEqual(len(queries.captured_queries), 0)
+
+    def test_defaults_to_components(self):
+        response = self.client.get(self.url, {'q': 'plate'})
+        self.assertEqual(names(response.json()['results']), ['Steel Plate'])
+
+    def test_limit_is_clamped(self):
+        response = self.client.get(self.url, {'kind': 'ore', 'q': 'ore', 'limit': '0'})
+        self.assertEqual(len(response.json()['results']), 1)
+
+    def test_rejects_bad_parameters(self):
+        self.assertEqual(self.client.get(self.url, {'kind': 'user'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'limit': 'ten'}).status_code, 400)
+        self.assertEqual(self.client.post(self.url).status_code, 405)
+
+    def test_component_form_ships_only_selected_ores(self):
+        response = self.client.get(
+            reverse('components:component_update', kwargs={'pk': self.plate.pk})
+        )
+        self.assertEqual(response.context['selected_ores'], {str(self.iron.ore_id): 'Iron Ore'})
+        self.assertNotContains(response, 'Nickel Ore')
@@ -0,0 +1,307 @@
+"""
+Tests for Phase 3 build order calculators, the bill-of-materials matrices
+and the BuildOrder model.
+
+Uses the calculation example from docs/projectPlan/phase3_buildorder.md.
+"""
+import json
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from django.urls import reverse
+from blocks.bom import get_bill_of_materials
+from blocks.calculators import (
+    BuildOrderCalculator,
+    calculate_fabricator_times,
+    calculate_required_components,
+    calculate_required_components_sql,
+    calculate_required_ores,
+    calculate_required_ores_sql,
+    calculate_total_mass,
+)
+from blocks.models import Block, BuildOrder
+from components.models import Component
+from ores.models import Ore
+
+
+class CalculatorTestBase(TestCase):
+    """
+    2x Block A (3x X, 2x Y) + 1x Block B (1x X, 4x Z).
+    """
+
+    def setUp(self):
+        self.iron = Ore.objects.create(name="Calc Iron", mass=1.0)
+        self.silicon = Ore.objects.create(name="Calc Silicon", mass=1.0)
+        self.x = Component.objects.create(
+            name="Calc X", materials={str(self.iron.ore_id): 10},
+            fabricator_type="Assembler", crafting_time=2.0, mass=10.0,
+        )
+        self.y = Component.objects.create(
+            name="Calc Y", materials={str(self.silicon.ore_id): 5},
+            fabricator_type="Refinery", crafting_time=1.5, mass=5.0,
+        )
+        self.z = Component.objects.create(
+            name="Calc Z", materials={str(self.iron.ore_id): 1, str(self.silicon.ore_id): 2},
+            fabricator_type="Assembler", crafting_time=0.5, mass=3.0,
+        )
+        self.block_a = self._block("Calc A", 100.0, {self.x: 3, self.y: 2})
+        self.block_b = self._block("Calc B", 40.0, {self.x: 1, self.z: 4})
+        self.order = [
+            {"block_id": str(self.block_a.block_id), "quantity": 2},
+            {"block_id": str(self.block_b.block_id), "quantity": 1},
+        ]
+
+    def _block(self, name, mass, components):
+        return Block.objects.create(
+            name=name, mass=mass, health=1.0, pcu=1, snap_size=0.5,
+            components={str(comp.component_id): qty for comp, qty in components.items()},
+        )
+
+
+class CalculatorTest(CalculatorTestBase):
+    """Test calculate_* functions."""
+
+    def test_calculate_required_components(self):
+        """Component quantities aggregate across blocks."""
+        self.assertEqual(calculate_required_components(self.order), {
+            str(self.x.component_id): 7.0,
+            str(self.y.component_id): 4.0,
+            str(self.z.component_id): 4.0,
+        })
+
+    def test_calculate_required_ores(self):
+        """Ore quantities traverse component materials."""
+        components = calculate_required_components(self.order)
+        self.assertEqual(calculate_required_ores(components), {
+            str(self.iron.ore_id): 7 * 10 + 4 * 1.0,
+            str(self.silicon.ore_id): 4 * 5 + 4 * 2.0,
+        })
+
+    def test_calculate_fabricator_times(self):
+        """Crafting time is grouped by fabricator type."""
+        components = calculate_required_components(self.order)
+        self.assertEqual(calculate_fabricator_times(components), {
+            "Assembler": 7 * 2.0 + 4 * 0.5,
+            "Refinery": 4 * 1.5,
+        })
+
+    def test_calculate_total_mass(self):
+        """Total mass is block mass × quantity."""
+        self.assertEqual(calculate_total_mass(self.order), 2 * 100.0 + 40.0)
+
+    def test_repeated_lines_accumulate(self):
+        """The same block on several lines is summed."""
+        order = [{"block_id": str(self.block_b.block_id), "quantity": 1}] * 3
+        self.assertEqual(
+            calculate_required_components(order)[str(self.z.component_id)], 12.0
+        )
+
+    def test_unknown_block_ignored(self):
+        """Lines for blocks not in the catalog contribute nothing."""
+        order = [{"block_id": "00000000-0000-0000-0000-000000000000", "quantity": 5}]
+        self.assertEqual(calculate_required_components(order), {})
+        self.assertEqual(calculate_total_mass(order), 0.0)
+
+
+class LinkTableAggregationTest(CalculatorTestBase):
+    """Test JOIN + GROUP BY aggregation over the link tables."""
+
+    def test_sql_components_match_matrix_result(self):
+        """Component totals agree with the matrix-based calculator."""
+        self.assertEqual(
+            calculate_required_components_sql(self.order),
+            calculate_required_components(self.order),
+        )
+
+    def test_sql_ores_match_matrix_result(self):
+        """Ore totals agree with the matrix-based calculator."""
+        self.assertEqual(
+            calculate_required_ores_sql(self.order),
+            calculate_required_ores(calculate_required_components(self.order)),
+        )
+
+    def test_sql_ores_single_query(self):
+        """Ore aggregation is a single query."""
+        with self.assertNumQueries(1):
+            calculate_required_ores_sql(self.order * 1000)
+
+
+class BillOfMaterialsTest(CalculatorTestBase):
+    """Test the sparse matrices directly."""
+
+    def test_matrix_shapes(self):
+        """Matrices are sized by catalog counts and hold one entry per recipe line."""
+        bom = get_bill_of_materials()
+        self.assertEqual(bom.block_components.shape, (2, 3))
+        self.assertEqual(bom.component_ores.shape, (3, 2))
+        self.assertEqual(bom.block_components.nnz, 4)
+        self.assertEqual(bom.component_ores.nnz, 4)
+
+    def test_rebuilt_after_catalog_write(self):
+        """A catalog write yields a fresh bill of materials."""
+        bom = get_bill_of_materials()
+        self.assertIs(get_bill_of_materials(), bom)
+        self.iron.save()
+        self.assertIsNot(get_bill_of_materials(), bom)
+
+
+class BuildOrderCalculatorTest(CalculatorTestBase):
+    """Test BuildOrderCalculator totals and query count."""
+
+    def test_totals_match_phase3_example(self):
+        """Calculator agrees with the matrix-based calculate_* functions."""
+        result = BuildOrderCalculator(self.order).calculate()
+        self.assertEqual(result['total_mass'], 240.0)
+        self.assertEqual(
+            {comp_id: data['quantity'] for comp_id, data in result['components'].items()},
+            calculate_required_components(self.order),
+        )
+        self.assertEqual(
+            {ore_id: data['quantity'] for ore_id, data in result['ores'].items()},
+            calculate_required_ores(calculate_required_components(self.order)),
+        )
+        self.assertEqual(result['fabricators'], {"Assembler": 16.0, "Refinery": 6.0})
+        self.assertEqual(result['missing_blocks'], [])
+
+    def test_missing_and_invalid_lines(self):
+        """Unknown blocks are reported; malformed lines are skipped."""
+        missing_id = "00000000-0000-0000-0000-000000000000"
+        result = BuildOrderCalculator([
+            {"block_id": missing_id, "quantity": 1},
+            {"block_id": "not-a-uuid", "quantity": 1},
+            {"quantity": 3},
+            {"block_id": str(self.block_a.block_id), "quantity": 0},
+        ]).calculate()
+        self.assertEqual(result['missing_blocks'], [missing_id])
+        self.assertEqual(result['blocks'], [])
+        self.assertEqual(result['total_mass'], 0.0)
+
+    def test_empty_order_issues_no_queries(self):
+        """An empty order needs no database access."""
+        with self.assertNumQueries(0):
+            result = BuildOrderCalculator([]).calculate()
+        self.assertEqual(result['components'], {})
+
+    def test_query_count_flat_from_1_to_5000_lines(self):
+        """Three batched queries whatever the number of order lines."""
+        blocks = [self.block_a, self.block_b]
+        for size in (1, 50, 500, 5000):
+            order = [
+                {"block_id": str(blocks[i % 2].block_id), "quantity": 1}
+                for i in range(size)
+            ]
+            with self.assertNumQueries(3):
+                result = BuildOrderCalculator(order).calculate()
+            self.assertEqual(sum(block['quantity'] for block in result['blocks']), size)
+
+
+class BuildOrderModelTest(CalculatorTestBase):
+    """Test BuildOrder validation and calculation helpers."""
+
+    def test_create_and_calculate(self):
+        """Saved build orders expose aggregated totals."""
+        order = BuildOrder.objects.create(name="Outpost", blocks=self.order)
+        self.assertEqual(str(order), "Outpost")
+        self.assertEqual(order.total_mass(), 240.0)
+        self.assertEqual(order.required_components()[str(self.x.component_id)]['quantity'], 7)
+        self.assertIn(str(self.iron.ore_id), order.required_ores())
+
+    def test_validation_rejects_unknown_block(self):
+        """Saving with a nonexistent block raises ValidationError."""
+        with self.assertRaises(ValidationError):
+            BuildOrder.objects.create(
+                name="Bad",
+                blocks=[{"block_id": "00000000-0000-0000-0000-000000000000", "quantity": 1}],
+            )
+
+    def test_validation_rejects_bad_quantity(self):
+        """Quantities must be positive integers."""
+        order = BuildOrder(name="Bad", blocks=[{"block_id": str(self.block_a.block_id), "quantity": 0}])
+        is_valid, errors = order.validate_blocks()
+        self.assertFalse(is_valid)
+        self.assertIn("Invalid quantity", errors[0])
+
+    def test_validation_checks_existence_in_one_query(self):
+        """Block existence is checked with one batched query."""
+        order = BuildOrder(name="Many", blocks=self.order * 100)
+        with self.assertNumQueries(1):
+            is_valid, errors = order.validate_blocks()
+        self.assertTrue(is_valid)
+
+
+class CalculateApiTest(CalculatorTestBase):
+    """Test the batch resource-calculation endpoint."""
+
+    def post(self, payload):
+        return self.client.post(
+            reverse('blocks:block_calculate_api'),
+            data=json.dumps(payload),
+            content_type='application/json',
+        )
+
+    def test_matches_build_order_calculator(self):
+        response = self.post({'blocks': self.order})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        expected = BuildOrderCalculator(self.order).calculate()
+        self.assertEqual(data['total_mass'], expected['total_mass'])
+        self.assertEqual(
+            {k: v['quantity'] for k, v in data['components'].items()},
+            {k: v['quantity'] for k, v in expected['components'].items()},
+        )
+        self.assertEqual(
+            {k: v['quantity'] for k, v in data['ores'].items()},
+            {k: v['quantity'] for k, v in expected['ores'].items()},
+        )
+        self.assertEqual(data['fabricators'], expected['fabricators'])
+
+    def test_lines_by_name_and_duplicates_collapse(self):
+        response = self.post([
+            {'name': 'Calc A', 'quantity': 1},
+            {'block_id': str(self.block_a.block_id), 'quantity': 1},
+            {'name': 'Calc B'},
+        ])
+        data = response.json()
+        self.assertEqual(data['total_mass'], 240.0)
+        self.assertEqual([b['quantity'] for b in data['blocks']], [2.0, 1.0])
+
+    def test_missing_blocks_reported(self):
+        response = self.post([
+            {'name': 'No Such Block', 'quantity': 1},
+            {'block_id': '00000000-0000-0000-0000-000000000000', 'quantity': 1},
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['missing_blocks']), 2)
+        self.assertEqual(response.json()['total_mass'], 0.0)
+
+    def test_no_queries_once_graph_is_compiled(self):
+        get_bill_of_materials()
+        with self.assertNumQueries(0):
+            self.post({'blocks': self.order * 100})
+
+    def test_invalid_lines_rejected(self):
+        response = self.post([{'name': 'Calc A', 'quantity': 0}, {'quantity': 1}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(response.json()['errors']), 2)
+
+    def test_non_string_name_rejected(self):
+        response = self.post([{'name': ['Calc A'], 'quantity': 1}, {'name': {'a': 1}}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(response.json()['errors']), 2)
+
+    def test_non_finite_quantity_rejected(self):
+        for body in ('[{"name": "Calc A", "quantity": NaN}]', '[{"name": "Calc A", "quantity": Infinity}]'):
+            response = self.client.post(
+                reverse('blocks:block_calculate_api'), data=body, content_type='application/json'
+            )
+            self.assertEqual(response.status_code, 400)
+
+    def test_invalid_json_rejected(self):
+        response = self.client.post(
+            reverse('blocks:block_calculate_api'), data='{', content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_get_not_allowed(self):
+        response = self.client.get(reverse('blocks:block_calculate_api'))
+        self.assertEqual(response.status_code, 405)
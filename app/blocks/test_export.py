@@ -0,0 +1,97 @@
+"""
+Tests for the streaming catalog export (views and export_catalog command).
+"""
+import csv
+import io
+import json
+import tempfile
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from blocks.models import Block
+from components.models import Component
+from ores.models import Ore
+
+
+class CatalogExportTestBase(TestCase):
+    """Two ores, two components and one block built from both components."""
+
+    def setUp(self):
+        self.iron = Ore.objects.create(name="Iron", mass=1.0)
+        self.nickel = Ore.objects.create(name="Nickel", mass=1.0)
+        self.plate = Component.objects.create(
+            name="Plate", mass=20.0, materials={str(self.iron.ore_id): 21},
+        )
+        self.motor = Component.objects.create(
+            name="Motor", mass=24.0,
+            materials={str(self.iron.ore_id): 20, str(self.nickel.ore_id): 5},
+        )
+        self.block = Block.objects.create(
+            name="Rotor", mass=100.0, health=1.0, pcu=1, snap_size=0.5,
+            components={str(self.plate.component_id): 2, str(self.motor.component_id): 3},
+        )
+
+    @staticmethod
+    def body(response):
+        return b''.join(response.streaming_content).decode()
+
+
+class ExportViewTests(CatalogExportTestBase):
+
+    def test_ores_csv_is_streamed(self):
+        response = self.client.get(reverse('ores:ore_export'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn('filename="ores.csv"', response['Content-Disposition'])
+
+        rows = list(csv.DictReader(io.StringIO(self.body(response))))
+        self.assertEqual([row['name'] for row in rows], ['Iron', 'Nickel'])
+
+    def test_components_ndjson(self):
+        response = self.client.get(reverse('components:component_export'), {'format': 'ndjson'})
+        records = [json.loads(line) for line in self.body(response).splitlines()]
+        self.assertEqual([r['name'] for r in records], ['Motor', 'Plate'])
+        self.assertEqual(records[1]['materials'], {str(self.iron.ore_id): 21})
+
+    def test_blocks_ndjson_with_ore_totals(self):
+        response = self.client.get(
+            reverse('blocks:block_export'), {'format': 'ndjson', 'ore_totals': '1'}
+        )
+        record = json.loads(self.body(response))
+        self.assertEqual(record['ore_totals'], {'Iron': 2 * 21 + 3 * 20, 'Nickel': 3 * 5})
+
+    def test_blocks_csv_flattens_ore_totals(self):
+        response = self.client.get(reverse('blocks:block_export'), {'ore_totals': 'true'})
+        row = next(csv.DictReader(io.StringIO(self.body(response))))
+        self.assertEqual(float(row['ore:Iron']), 102)
+        self.assertEqual(float(row['ore:Nickel']), 15)
+        self.assertEqual(json.loads(row['components'])[str(self.motor.component_id)], 3)
+
+    def test_unknown_format_rejected(self):
+        response = self.client.get(reverse('blocks:block_export'), {'format': 'xml'})
+        self.assertEqual(response.status_code, 400)
+
+
+class ExportCommandTests(CatalogExportTestBase):
+
+    def test_stdout_ndjson(self):
+        out = io.StringIO()
+        call_command('export_catalog', 'components', fmt='ndjson', stdout=out)
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
+
+    def test_file_output_with_ore_totals(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'blocks.csv'
+            err = io.StringIO()
+            call_command(
+                'export_catalog', 'blocks', ore_totals=True, output=str(path),
+                chunk_size=1, stderr=err,
+            )
+            rows = list(csv.DictReader(path.open()))
+        self.assertEqual(len(rows), 1)
+        self.assertIn('ore:Nickel', rows[0])
+        self.assertIn('Exported 1 blocks', err.getvalue())
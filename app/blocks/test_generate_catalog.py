@@ -0,0 +1,100 @@
+"""
+Tests for the seeded synthetic catalog generator and its management command.
+"""
+import io
+import uuid
+from collections import Counter
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase
+
+from blocks.generator import CatalogGenerator, parse_range
+from blocks.models import Block, BlockComponent
+from components.models import Component, ComponentMaterial
+from ores.models import Ore
+
+
+def records(generator):
+    return list(generator.ores()), list(generator.components()), list(generator.blocks())
+
+
+class CatalogGeneratorTest(SimpleTestCase):
+
+    def test_same_seed_same_catalog(self):
+        first = records(CatalogGenerator(5, 20, 40, seed=7))
+        self.assertEqual(first, records(CatalogGenerator(5, 20, 40, seed=7)))
+        self.assertNotEqual(first, records(CatalogGenerator(5, 20, 40, seed=8)))
+
+    def test_keys_are_time_ordered_uuid7(self):
+        generator = CatalogGenerator(3, 3, 50)
+        keys = [uuid.UUID(pk) for pk in generator.ids['block']]
+        self.assertTrue(all(key.version == 7 for key in keys))
+        self.assertEqual(keys, sorted(keys))
+
+    def test_growing_one_table_keeps_the_others(self):
+        small = CatalogGenerator(5, 10, 10, seed=1)
+        large = CatalogGenerator(5, 10, 100, seed=1)
+        self.assertEqual(list(small.components()), list(large.components()))
+        self.assertEqual(small.ids['block'], large.ids['block'][:10])
+
+    def test_fan_out_stays_in_range(self):
+        generator = CatalogGenerator(
+            10, 30, 60, materials_per_component=(2, 3), components_per_block=(1, 5),
+        )
+        for component in generator.components():
+            self.assertIn(len(component['materials']), (2, 3))
+        for block in generator.blocks():
+            self.assertTrue(1 <= len(block['components']) <= 5)
+            self.assertTrue(set(block['components']) <= set(generator.ids['component']))
+
+    def test_skew_concentrates_references(self):
+        def top_share(skew):
+            generator = CatalogGenerator(50, 500, 0, skew=skew, materials_per_component=(1, 1))
+            uses = Counter(ore for c in generator.components() for ore in c['materials'])
+            return uses.most_common(1)[0][1] / 500
+
+        self.assertGreater(top_share(1.5), 3 * top_share(0))
+
+    def test_heavy_skew_on_small_table_still_fills_fan_out(self):
+        generator = CatalogGenerator(4, 20, 0, skew=8, materials_per_component=(4, 4))
+        self.assertTrue(all(len(c['materials']) == 4 for c in generator.components()))
+
+    def test_parse_range(self):
+        self.assertEqual(parse_range('2:12'), (2, 12))
+        self.assertEqual(parse_range('3'), (3, 3))
+        for bad in ('5:2', '-1:2', 'a:b'):
+            with self.assertRaises(ValueError):
+                parse_range(bad)
+
+
+class GenerateCatalogCommandTest(TestCase):
+
+    def generate(self, *args):
+        out = io.StringIO()
+        call_command('generate_catalog', *args, stdout=out)
+        return out.getvalue()
+
+    def test_bulk_loads_catalog_with_link_rows(self):
+        output = self.generate('--ores', '6', '--components', '25', '--blocks', '40',
+                               '--chunk-size', '10')
+        self.assertIn('Generated 71 records', output)
+        self.assertEqual((Ore.objects.count(), Component.objects.count(), Block.objects.count()),
+                         (6, 25, 40))
+        self.assertEqual(
+            BlockComponent.objects.count(),
+            sum(len(b.components) for b in Block.objects.all()),
+        )
+        self.assertTrue(ComponentMaterial.objects.exists())
+
+    def test_rerun_updates_the_same_rows(self):
+        self.generate('--ores', '3', '--components', '5', '--blocks', '5')
+        names = set(Block.objects.values_list('name', flat=True))
+        output = self.generate('--ores', '3', '--components', '5', '--blocks', '5')
+        self.assertIn('0 created, 5 updated', output)
+        self.assertEqual(set(Block.objects.values_list('name', flat=True)), names)
+
+    def test_rejects_bad_options(self):
+        with self.assertRaises(CommandError):
+            self.generate('--components-per-block', '9:1')
+        with self.assertRaises(CommandError):
+            self.generate('--ores', '0', '--components', '5', '--blocks', '0')
@@ -0,0 +1,155 @@
+"""
+Tests for the streaming catalog importer and the import_catalog command.
+"""
+import io
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from blocks import importer
+from blocks.catalog_version import get_catalog_version
+from blocks.importer import CatalogImporter, iter_records
+from blocks.models import Block, BlockComponent
+from components.models import Component, ComponentMaterial
+from ores.models import Ore
+
+APP_DIR = Path(__file__).resolve().parent.parent
+FIXTURES = {
+    'ores': APP_DIR / 'ores' / 'fixtures' / 'sample_ores.json',
+    'components': APP_DIR / 'components' / 'fixtures' / 'sample_components.json',
+    'blocks': APP_DIR / 'blocks' / 'fixtures' / 'sample_blocks.json',
+}
+
+
+class IterRecordsTests(TestCase):
+    """Format detection and incremental decoding."""
+
+    def test_json_array(self):
+        stream = io.StringIO('  [{"a": 1}, {"b": [1, 2]} ,{"c": "]"}]')
+        self.assertEqual(list(iter_records(stream)), [{'a': 1}, {'b': [1, 2]}, {'c': ']'}])
+
+    def test_json_array_across_buffer_refills(self):
+        records = [{'name': f'Ore {i}', 'mass': i} for i in range(200)]
+        with mock.patch.object(importer, 'READ_SIZE', 7):
+            decoded = list(iter_records(io.StringIO(json.dumps(records))))
+        self.assertEqual(decoded, records)
+
+    def test_ndjson(self):
+        stream = io.StringIO('{"a": 1}\n\n{"b": 2}\n')
+        self.assertEqual(list(iter_records(stream)), [{'a': 1}, {'b': 2}])
+
+    def test_unclosed_array(self):
+        with self.assertRaises(importer.CatalogImportError):
+            list(iter_records(io.StringIO('[{"a": 1},')))
+
+
+class ImportCatalogCommandTests(TestCase):
+    """End-to-end imports through the management command."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write_ndjson(self, name, records):
+        path = Path(self.tmp.name) / name
+        path.write_text('\n'.join(json.dumps(r) for r in records))
+        return str(path)
+
+    def run_import(self, **kwargs):
+        out = io.StringIO()
+        call_command('import_catalog', stdout=out, **kwargs)
+        return out.getvalue()
+
+    def test_imports_sample_fixtures(self):
+        output = self.run_import(**{k: str(v) for k, v in FIXTURES.items()}, chunk_size=4)
+
+        self.assertEqual(Ore.objects.count(), 15)
+        self.assertEqual(Component.objects.count(), 15)
+        self.assertEqual(Block.objects.count(), 15)
+        self.assertTrue(ComponentMaterial.objects.exists())
+        self.assertEqual(
+            BlockComponent.objects.count(),
+            sum(len(b.components) for b in Block.objects.all()),
+        )
+        self.assertIn('rows/sec', output)
+
+    def test_reimport_updates_in_place(self):
+        paths = {k: str(v) for k, v in FIXTURES.items()}
+        self.run_import(**paths)
+        ore = Ore.objects.get(name='Iron Ore')
+        ore.mass = 99.0
+        ore.save()
+
+        output = self.run_import(**paths)
+
+        self.assertEqual(Ore.objects.count(), 15)
+        self.assertEqual(Ore.objects.get(name='Iron Ore').mass, 1.0)
+        self.assertIn('0 created, 15 updated', output)
+
+    def test_flat_records_matched_by_name(self):
+        iron = Ore.objects.create(name='Iron', mass=1.0)
+        ores = self.write_ndjson('ores.ndjson', [
+            {'name': 'Iron', 'mass': 2.5},
+            {'name': 'Nickel', 'mass': 1.0},
+        ])
+        self.run_import(ores=ores)
+
+        self.assertEqual(Ore.objects.count(), 2)
+        iron.refresh_from_db()
+        self.assertEqual(iron.mass, 2.5)
+
+    def test_duplicate_primary_key_last_record_wins(self):
+        pk = '00000000-0000-0000-0000-000000000001'
+        ores = self.write_ndjson('ores.ndjson', [
+            {'ore_id': pk, 'name': 'Iron', 'mass': 1.0},
+            {'ore_id': pk, 'name': 'Iron Ore', 'mass': 2.0},
+        ])
+        self.run_import(ores=ores)
+
+        self.assertEqual(list(Ore.objects.values_list('name', 'mass')), [('Iron Ore', 2.0)])
+
+    def test_invalid_references_skipped(self):
+        iron = Ore.objects.create(name='Iron', mass=1.0)
+        components = self.write_ndjson('components.ndjson', [
+            {'name': 'Plate', 'mass': 1.0, 'materials': {str(iron.ore_id): 2}},
+            {'name': 'Broken', 'mass': 1.0, 'materials': {'00000000-0000-0000-0000-000000000000': 1}},
+            {'name': 'Negative', 'mass': 1.0, 'materials': {str(iron.ore_id): -1}},
+        ])
+        output = self.run_import(components=components)
+
+        self.assertEqual(list(Component.objects.values_list('name', flat=True)), ['Plate'])
+        self.assertIn('2 skipped', output)
+        self.assertIn('does not exist', output)
+
+    def test_strict_aborts(self):
+        components = self.write_ndjson('components.ndjson', [
+            {'name': 'Broken', 'mass': 1.0, 'materials': {'00000000-0000-0000-0000-000000000000': 1}},
+        ])
+        with self.assertRaises(CommandError):
+            self.run_import(components=components, strict=True)
+        self.assertFalse(Component.objects.exists())
+
+    def test_chunk_written_with_constant_queries(self):
+        ores = [{'name': f'Ore {i}', 'mass': 1.0} for i in range(100)]
+        stream = io.StringIO('\n'.join(json.dumps(r) for r in ores))
+        get_catalog_version()  # creates the version row, as migration 0009 does
+        # name lookup, savepoint, one bulk INSERT, link back-fill lookup,
+        # search index DELETE/INSERT (one executemany each), catalog version
+        # UPDATE/SELECT, release
+        with self.assertNumQueries(9):
+            CatalogImporter(chunk_size=1000).run(ores=stream)
+        self.assertEqual(Ore.objects.count(), 100)
+
+    def test_bumps_catalog_version(self):
+        version = get_catalog_version()
+        self.run_import(ores=self.write_ndjson('ores.ndjson', [{'name': 'Iron', 'mass': 1.0}]))
+        self.assertGreater(get_catalog_version(), version)
+
+    def test_requires_an_input(self):
+        with self.assertRaises(CommandError):
+            self.run_import()
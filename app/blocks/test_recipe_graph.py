@@ -0,0 +1,344 @@
+"""
+Tests for the compiled recipe graph.
+
+Covers expansion totals, the catalog version stamp and version-based
+rebuilds on catalog writes, version-keyed resource chain caching, the
+query-free detail view and the request-scoped identity map.
+"""
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from blocks import recipe_graph
+from blocks.catalog_version import bump_catalog_version, get_catalog_version
+from blocks.identity_map import catalog_scope, current_identity_map, get_many
+from blocks.models import Block, CatalogVersion
+from blocks.recipe_graph import get_recipe_graph, resource_chain_cache_key
+from blocks.templatetags.block_filters import get_component_mass, get_component_name
+from components.models import Component
+from components.templatetags.component_filters import get_ore_name
+from ores.models import Ore
+
+
+class RecipeGraphTestBase(TestCase):
+    """Small two-component catalog shared by the graph tests."""
+
+    def setUp(self):
+        self.iron = Ore.objects.create(name="Graph Iron", mass=1.0)
+        self.nickel = Ore.objects.create(name="Graph Nickel", mass=2.0)
+        self.plate = Component.objects.create(
+            name="Graph Plate",
+            materials={str(self.iron.ore_id): 20},
+            mass=20.0,
+        )
+        self.motor = Component.objects.create(
+            name="Graph Motor",
+            materials={str(self.iron.ore_id): 5, str(self.nickel.ore_id): 3},
+            mass=24.0,
+        )
+        self.block = Block.objects.create(
+            name="Graph Block",
+            mass=500.0,
+            components={str(self.plate.component_id): 10, str(self.motor.component_id): 2},
+            health=100.0,
+            pcu=1,
+            snap_size=0.5,
+        )
+
+
+class RecipeGraphExpansionTest(RecipeGraphTestBase):
+    """Test RecipeGraph.expand and lookups."""
+
+    def test_expand_block_totals(self):
+        """Ore totals sum across every component in the block."""
+        chain = get_recipe_graph().expand(self.block.components)
+        ores = chain['ores']
+        self.assertEqual(ores[str(self.iron.ore_id)]['quantity'], 10 * 20 + 2 * 5)
+        self.assertEqual(ores[str(self.nickel.ore_id)]['quantity'], 2 * 3)
+        self.assertEqual(chain['total_ore_mass'], 210 * 1.0 + 6 * 2.0)
+        self.assertEqual(len(chain['components']), 2)
+
+    def test_expand_block_by_id_matches_expand(self):
+        """expand_block uses the recipe stored in the graph."""
+        graph = get_recipe_graph()
+        self.assertEqual(
+            graph.expand_block(self.block.block_id),
+            graph.expand(self.block.components),
+        )
+
+    def test_expand_skips_unknown_component(self):
+        """Unknown component IDs are skipped, not raised."""
+        chain = get_recipe_graph().expand({'00000000-0000-0000-0000-000000000000': 1})
+        self.assertEqual(chain['components'], [])
+        self.assertEqual(chain['total_ore_mass'], 0)
+
+    def test_lookups(self):
+        """Name and mass lookups accept UUID objects and strings."""
+        graph = get_recipe_graph()
+        self.assertEqual(graph.component_name(self.plate.component_id), "Graph Plate")
+        self.assertEqual(graph.component_mass(str(self.motor.component_id)), 24.0)
+        self.assertEqual(graph.ore_name(self.nickel.ore_id), "Graph Nickel")
+        self.assertIsNone(graph.ore_name('invalid-id'))
+
+    def test_expansion_issues_no_queries(self):
+        """A compiled graph expands without hitting the database."""
+        graph = get_recipe_graph()
+        with self.assertNumQueries(0):
+            graph.expand(self.block.components)
+
+
+class RecipeGraphNavigationTest(RecipeGraphTestBase):
+    """Test name-ordered previous/next lookups for the detail pages."""
+
+    def test_neighbours_follow_name_order(self):
+        graph = get_recipe_graph()
+        previous, following = graph.neighbours('component', self.plate.component_id)
+        self.assertEqual(previous, (str(self.motor.component_id), "Graph Motor"))
+        self.assertIsNone(following)
+
+        previous, following = graph.neighbours('ore', self.iron.ore_id)
+        self.assertIsNone(previous)
+        self.assertEqual(following.name, "Graph Nickel")
+
+    def test_unknown_row_has_no_neighbours(self):
+        self.assertEqual(get_recipe_graph().neighbours('block', 'invalid-id'), (None, None))
+
+    def test_lookups_issue_no_queries(self):
+        graph = get_recipe_graph()
+        with self.assertNumQueries(0):
+            graph.neighbours('ore', self.nickel.ore_id)
+            graph.neighbours('block', self.block.block_id)
+
+    def test_detail_views_link_neighbours(self):
+        response = self.client.get(reverse('ores:ore_detail', kwargs={'pk': self.nickel.ore_id}))
+        self.assertEqual(response.context['previous_ore'].pk, str(self.iron.ore_id))
+        self.assertIsNone(response.context['next_ore'])
+
+        response = self.client.get(
+            reverse('components:component_detail', kwargs={'pk': self.motor.component_id})
+        )
+        self.assertEqual(response.context['next_component'].name, "Graph Plate")
+        self.assertContains(
+            response, reverse('components:component_detail', kwargs={'pk': self.plate.component_id})
+        )
+
+        Block.objects.create(name="Graph Anchor", mass=1.0, health=1.0, pcu=1, snap_size=0.5)
+        response = self.client.get(reverse('blocks:block_detail', kwargs={'pk': self.block.block_id}))
+        self.assertEqual(response.context['previous_block'].name, "Graph Anchor")
+        self.assertIsNone(response.context['next_block'])
+
+
+class RecipeGraphVersioningTest(RecipeGraphTestBase):
+    """Test that catalog writes rebuild the graph."""
+
+    def test_graph_is_reused_while_version_unchanged(self):
+        """Consecutive reads share the same compiled graph."""
+        self.assertIs(get_recipe_graph(), get_recipe_graph())
+
+    def test_bump_forces_rebuild(self):
+        """Bumping the version compiles a new graph."""
+        graph = get_recipe_graph()
+        bump_catalog_version()
+        self.assertIsNot(get_recipe_graph(), graph)
+
+    def test_ore_save_rebuilds_graph(self):
+        """Saving an ore is reflected in the next graph."""
+        get_recipe_graph()
+        self.iron.mass = 3.0
+        self.iron.save()
+        self.assertEqual(get_recipe_graph().ore_mass(self.iron.ore_id), 3.0)
+
+    def test_component_delete_rebuilds_graph(self):
+        """Deleting a component removes it from the next graph."""
+        get_recipe_graph()
+        self.plate.delete()
+        self.assertIsNone(get_recipe_graph().component_name(self.plate.component_id))
+
+
+class BlockDetailViewGraphTest(RecipeGraphTestBase):
+    """Test BlockDetailView reads the resource chain from the graph."""
+
+    def test_detail_query_count_independent_of_component_count(self):
+        """Detail view issues the same queries for 2 or 40 components."""
+        components = {}
+        for i in range(40):
+            comp = Component.objects.create(
+                name=f"Graph Filler {i}",
+                materials={str(self.iron.ore_id): 1, str(self.nickel.ore_id): 1},
+                mass=1.0,
+            )
+            components[str(comp.component_id)] = 1
+        big_block = Block.objects.create(
+            name="Graph Big Block", mass=1.0, components=components,
+            health=1.0, pcu=1, snap_size=0.5,
+        )
+        get_recipe_graph()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse('blocks:block_detail', kwargs={'pk': big_block.block_id})
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['resource_chain']['components']), 40)
+
+
+class CatalogVersionTest(RecipeGraphTestBase):
+    """Test the catalog-wide version stamp."""
+
+    def test_every_write_bumps_the_version(self):
+        """Saves and deletes of ores, components and blocks all move the version."""
+        for write in (self.iron.save, self.plate.save, self.block.save, self.motor.delete):
+            version = get_catalog_version()
+            write()
+            self.assertGreater(get_catalog_version(), version)
+
+    def test_rolled_back_write_keeps_the_version(self):
+        """The bump is part of the writer's transaction."""
+        version = CatalogVersion.objects.get().version
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            self.iron.save()
+            raise RuntimeError
+        self.assertEqual(CatalogVersion.objects.get().version, version)
+
+    def test_bumped_again_on_commit(self):
+        """Anything derived while the write was uncommitted is abandoned too."""
+        version = get_catalog_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.iron.save()
+            during = get_catalog_version()
+        self.assertEqual((during, get_catalog_version()), (version + 1, version + 2))
+
+    def test_survives_cache_loss(self):
+        """The row is authoritative when the shared cache loses the value."""
+        version = get_catalog_version()
+        cache.clear()
+        self.assertEqual(get_catalog_version(), version)
+
+    def test_memoized_per_request(self):
+        """Inside a request scope the version is read once, until a write."""
+        get_catalog_version()
+        with catalog_scope():
+            with mock.patch.object(cache, 'get', wraps=cache.get) as cache_get:
+                for _ in range(3):
+                    get_catalog_version()
+            self.assertEqual(cache_get.call_count, 1)
+            version = get_catalog_version()
+            self.nickel.save()
+            self.assertGreater(get_catalog_version(), version)
+
+
+    @override_settings(CATALOG_VERSION_TIMEOUT=5)
+    def test_per_process_cache_rereads_other_workers_writes(self):
+        """A locmem copy expires, so a bump made by another process shows up."""
+        version = get_catalog_version()
+        # Another worker's write: the row moves, this process's cache does not
+        CatalogVersion.objects.update(version=F('version') + 1)
+        self.assertEqual(get_catalog_version(), version)
+        later = time.time() + 6
+        with mock.patch('django.core.cache.backends.locmem.time.time', return_value=later):
+            self.assertEqual(get_catalog_version(), version + 1)
+
+
+class ResourceChainCacheTest(RecipeGraphTestBase):
+    """Test resource chains cached under the catalog version."""
+
+    def setUp(self):
+        super().setUp()
+        self.unrelated_block = Block.objects.create(
+            name="Graph Vault", mass=1.0, health=1.0, pcu=1, snap_size=0.5,
+            components={str(self.plate.component_id): 1},
+        )
+        for block in (self.block, self.unrelated_block):
+            self.client.get(reverse('blocks:block_detail', kwargs={'pk': block.block_id}))
+
+    def assertCached(self, block, cached=True, version=None):
+        key = resource_chain_cache_key(block.block_id, version or get_catalog_version())
+        self.assertEqual(cache.get(key) is not None, cached)
+
+    def test_chains_cached_after_detail_view(self):
+        """Detail views populate the resource chain cache."""
+        self.assertCached(self.block)
+        self.assertCached(self.unrelated_block)
+
+    def test_write_invalidates_without_deleting_keys(self):
+        """A catalog write moves readers to new keys in O(1)."""
+        version = get_catalog_version()
+        with mock.patch.object(cache, 'delete_many') as delete_many, \
+                mock.patch.object(cache, 'delete') as delete:
+            self.nickel.mass = 9.0
+            self.nickel.save()
+        delete_many.assert_not_called()
+        delete.assert_not_called()
+        self.assertCached(self.block, cached=False)
+        self.assertCached(self.unrelated_block, cached=False)
+        # Superseded entries are left to expire
+        self.assertCached(self.block, version=version)
+
+    def test_ore_edit_reflected_immediately(self):
+        """Detail view shows the new ore mass right after the edit."""
+        self.nickel.mass = 10.0
+        self.nickel.save()
+        response = self.client.get(reverse('blocks:block_detail', kwargs={'pk': self.block.block_id}))
+        chain = response.context['resource_chain']
+        self.assertEqual(chain['ores'][str(self.nickel.ore_id)]['mass'], 10.0)
+
+    def test_component_delete_reflected_immediately(self):
+        """Deleting a component drops it from the next chain."""
+        self.motor.delete()
+        response = self.client.get(reverse('blocks:block_detail', kwargs={'pk': self.block.block_id}))
+        names = [c['name'] for c in response.context['resource_chain']['components']]
+        self.assertNotIn("Graph Motor", names)
+
+
+class IdentityMapTest(RecipeGraphTestBase):
+    """Test the request-scoped identity map."""
+
+    def test_graph_version_checked_once_per_scope(self):
+        get_recipe_graph()
+        with mock.patch.object(
+            recipe_graph, 'get_catalog_version', wraps=recipe_graph.get_catalog_version
+        ) as version:
+            with catalog_scope():
+                for _ in range(3):
+                    get_component_name(self.plate.component_id)
+                    get_component_mass(self.motor.component_id)
+                    get_ore_name(self.iron.ore_id)
+        self.assertEqual(version.call_count, 1)
+
+    def test_filters_resolve_without_queries(self):
+        get_recipe_graph()
+        with catalog_scope(), self.assertNumQueries(0):
+            self.assertEqual(get_component_name(self.plate.component_id), "Graph Plate")
+            self.assertEqual(get_ore_name(self.nickel.ore_id), "Graph Nickel")
+
+    def test_instances_loaded_once_per_scope(self):
+        ids = [self.iron.ore_id, self.nickel.ore_id, "00000000-0000-0000-0000-000000000000"]
+        with catalog_scope():
+            with self.assertNumQueries(1):
+                ores = get_many(Ore, ids)
+            with self.assertNumQueries(0):
+                self.assertIs(get_many(Ore, ids[:1])[str(self.iron.ore_id)], ores[str(self.iron.ore_id)])
+                self.assertEqual(len(get_many(Ore, ids)), 2)
+
+    def test_block_requirements_single_query(self):
+        with catalog_scope(), self.assertNumQueries(1):
+            names = [name for _, name, _, _ in self.block.iter_component_requirements()]
+        self.assertEqual(sorted(names), ["Graph Motor", "Graph Plate"])
+
+    def test_catalog_write_clears_scope(self):
+        with catalog_scope():
+            pinned = get_recipe_graph()
+            self.plate.name = "Graph Plate v2"
+            self.plate.save()
+            self.assertIsNot(get_recipe_graph(), pinned)
+            self.assertEqual(get_component_name(self.plate.component_id), "Graph Plate v2")
+
+    def test_middleware_scopes_each_request(self):
+        self.assertIsNone(current_identity_map())
+        response = self.client.get(reverse('blocks:block_detail', kwargs={'pk': self.block.block_id}))
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(current_identity_map())
@@ -0,0 +1,137 @@
+"""
+Tests for ranked catalog search (SQLite FTS5 backend) and the list views using it.
+"""
+import io
+import json
+
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+
+from blocks.importer import CatalogImporter
+from blocks.models import Block
+from blocks.search import SEARCH_RESULT_LIMIT, apply_search, fts_table, index_instances
+from components.models import Component
+from ores.models import Ore
+
+
+def ranked_names(queryset, text):
+    return [obj.name for obj in apply_search(queryset, text).order_by('-search_rank', 'name')]
+
+
+class CatalogSearchTest(TestCase):
+    """Search over a handful of components."""
+
+    def setUp(self):
+        self.plate = Component.objects.create(
+            name="Steel Plate", mass=20.0, description="Basic armor component",
+        )
+        Component.objects.create(name="Steel Tube", mass=15.0, description="Structural tube")
+        Component.objects.create(
+            name="Girder", mass=6.0, description="Cheaper than a steel plate for frames",
+        )
+        Component.objects.create(name="Motor", mass=24.0, description="Rotating parts")
+
+    def test_ranks_name_matches_above_description_matches(self):
+        names = ranked_names(Component.objects.all(), "steel plate")
+        self.assertEqual(names[0], "Steel Plate")
+        self.assertIn("Girder", names)
+        self.assertNotIn("Motor", names)
+        self.assertLess(names.index("Steel Plate"), names.index("Girder"))
+
+    def test_tolerates_typos(self):
+        self.assertEqual(ranked_names(Component.objects.all(), "steal plaet")[0], "Steel Plate")
+
+    def test_short_query_falls_back_to_contains(self):
+        self.assertEqual(ranked_names(Component.objects.all(), "tu"), ["Steel Tube"])
+
+    def test_no_match_returns_empty_queryset(self):
+        self.assertEqual(ranked_names(Component.objects.all(), "xyzzy"), [])
+
+    def test_index_follows_saves_and_deletes(self):
+        self.plate.name = "Titanium Plate"
+        self.plate.save()
+        self.assertNotIn("Titanium Plate", ranked_names(Component.objects.all(), "steel"))
+        self.assertEqual(ranked_names(Component.objects.all(), "titanium")[0], "Titanium Plate")
+
+        self.plate.delete()
+        self.assertEqual(ranked_names(Component.objects.all(), "titanium"), [])
+
+    def test_bulk_import_is_indexed(self):
+        records = [{'name': 'Platinum Ore', 'mass': 1.0}, {'name': 'Silver Ore', 'mass': 1.0}]
+        CatalogImporter().run(ores=io.StringIO('\n'.join(json.dumps(r) for r in records)))
+        self.assertEqual(ranked_names(Ore.objects.all(), "platinum"), ["Platinum Ore"])
+
+    def test_list_views_order_search_results_by_relevance(self):
+        response = self.client.get(reverse('components:component_list'), {'q': 'steel plate'})
+        self.assertEqual(response.context['current_sort'], 'relevance')
+        self.assertEqual(response.context['component_list'][0].name, "Steel Plate")
+
+        response = self.client.get(
+            reverse('components:component_list'), {'q': 'steel plate', 'sort': 'name'}
+        )
+        names = [c.name for c in response.context['component_list']]
+        self.assertEqual(names, sorted(names))
+
+        Ore.objects.create(name="Steel Scrap", mass=1.0)
+        response = self.client.get(reverse('ores:ore_list'), {'search': 'steel', 'sort_by': ''})
+        self.assertEqual([o.name for o in response.context['ore_list']], ["Steel Scrap"])
+
+        Block.objects.create(name="Steel Catwalk", mass=1.0, health=1.0, pcu=1, snap_size=0.5)
+        response = self.client.get(reverse('blocks:block_list'), {'q': 'catwlk'})
+        self.assertEqual([b.name for b in response.context['block_list']], ["Steel Catwalk"])
+
+    def test_sort_select_shows_the_effective_ordering(self):
+        best_match = '<option value="" selected>Best Match</option>'
+        by_name = '<option value="name" selected>Name</option>'
+        for url, search in ((reverse('blocks:block_list'), 'q'), (reverse('ores:ore_list'), 'search')):
+            response = self.client.get(url)
+            self.assertContains(response, by_name, html=True)
+            self.assertNotContains(response, best_match, html=True)
+
+            response = self.client.get(url, {search: 'steel'})
+            self.assertContains(response, best_match, html=True)
+
+    def test_relevance_pages_follow_cursor(self):
+        Component.objects.bulk_create(
+            Component(name=f"Steel Beam {i:02d}", mass=1.0) for i in range(30)
+        )
+        # bulk_create skips signals; the importer and save() keep the index in step
+        index_instances(Component, list(Component.objects.filter(name__startswith="Steel Beam")))
+
+        url = reverse('components:component_list')
+        first = self.client.get(url, {'q': 'steel'})
+        cursor = first.context['page_obj'].next_cursor
+        second = self.client.get(url, {'q': 'steel', 'cursor': cursor})
+
+        seen = [c.pk for c in first.context['component_list']]
+        seen += [c.pk for c in second.context['component_list']]
+        self.assertEqual(len(seen), len(set(seen)))
+        # 30 beams, Steel Plate, Steel Tube and Girder (description match)
+        self.assertEqual(len(seen), 33)
+
+
+    def test_matches_past_the_ranked_head_are_kept(self):
+        count = SEARCH_RESULT_LIMIT + 50
+        panels = Component.objects.bulk_create(
+            Component(name=f"Armor Panel {i:03d}", mass=1.0) for i in range(count)
+        )
+        index_instances(Component, panels)
+
+        results = apply_search(Component.objects.all(), "armor panel")
+        # The ranked head is scored; the rest match by the plain filter and follow it
+        self.assertEqual(results.filter(name__startswith="Armor Panel").count(), count)
+        ranked = list(results.order_by('-search_rank', 'name').values_list('search_rank', flat=True))
+        self.assertEqual(ranked, sorted(ranked, reverse=True))
+        self.assertEqual(ranked.count(0.0), count - SEARCH_RESULT_LIMIT)
+
+
+class RebuildSearchIndexCommandTest(TransactionTestCase):
+    """The rebuild command drops and refills the FTS5 tables outside a transaction."""
+
+    def test_rebuild_indexes_existing_rows(self):
+        Ore.objects.create(name="Cobalt Ore", mass=1.0)
+        out = io.StringIO()
+        call_command('rebuild_search_index', stdout=out)
+        self.assertIn(f'{fts_table(Ore)}: 1 rows indexed', out.getvalue())
+        self.assertEqual(ranked_names(Ore.objects.all(), "cobalt"), ["Cobalt Ore"])
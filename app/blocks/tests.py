@@ -1,10 +1,14 @@
+import json
+
 from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 
 from ores.models import Ore
 from components.models import Component
-from blocks.models import Block
+from blocks.forms import BlockForm
+from blocks.models import Block, BlockComponent
+from blocks.validators import validate_components_many
 
 
 # ---- Test helpers / factories ----
@@ -451,7 +455,117 @@ class BlockComponentRelationshipTests(TestCase):
         self.assertEqual(Block.objects.get(pk=blk.block_id).description, "OK")
 
 
+class BlockComponentLinkTests(TestCase):
+    """BlockComponent rows mirror Block.components on every save."""
+
+    def test_links_created_on_save(self):
+        comp1 = create_component(name="Link Motor")
+        comp2 = create_component(name="Link Computer")
+        blk = create_block(
+            name="Link Block",
+            components_dict=[component_entry(comp1, 2), component_entry(comp2, 3)],
+        )
+        links = dict(blk.component_links.values_list("component__name", "quantity"))
+        self.assertEqual(links, {"Link Motor": 2, "Link Computer": 3})
+
+    def test_links_rewritten_on_update(self):
+        comp1 = create_component(name="Link Grid")
+        comp2 = create_component(name="Link Tube")
+        blk = create_block(name="Link Update Block", components_dict=[component_entry(comp1, 1)])
+        blk.components = component_entry(comp2, 5)
+        blk.save()
+        self.assertEqual(
+            [(str(pk), quantity) for pk, quantity in blk.component_links.values_list("component_id", "quantity")],
+            [(str(comp2.component_id), 5)],
+        )
+
+    def test_reverse_lookup_from_component(self):
+        comp = create_component(name="Link Shared")
+        blk1 = create_block(name="Link User 1", components_dict=[component_entry(comp, 1)])
+        blk2 = create_block(name="Link User 2", components_dict=[component_entry(comp, 4)])
+        users = set(comp.block_links.values_list("block__name", flat=True))
+        self.assertEqual(users, {blk1.name, blk2.name})
+
+    def test_links_removed_with_block(self):
+        comp = create_component(name="Link Gone")
+        blk = create_block(name="Link Deleted Block", components_dict=[component_entry(comp, 1)])
+        blk.delete()
+        self.assertFalse(BlockComponent.objects.filter(component=comp).exists())
+
+    def test_fixture_load_populates_links(self):
+        from django.core.management import call_command
+        call_command("loaddata", "sample_ores.json", "sample_components.json", "sample_blocks.json", verbosity=0)
+        expected = sum(len(b.components) for b in Block.objects.all())
+        self.assertEqual(BlockComponent.objects.count(), expected)
+
+    def test_fixture_loaded_before_components_backfills_links(self):
+        from django.core.management import call_command
+        call_command("loaddata", "sample_ores.json", "sample_blocks.json", verbosity=0)
+        self.assertFalse(BlockComponent.objects.exists())
+        call_command("loaddata", "sample_components.json", verbosity=0)
+        expected = sum(len(b.components) for b in Block.objects.all())
+        self.assertEqual(BlockComponent.objects.count(), expected)
+
+
 # ---- BlockMetaTests (4) ----
+class BlockBatchedValidationTests(TestCase):
+    """Component references are resolved with one query, whatever the count."""
+
+    def setUp(self):
+        ore = create_ore(name="Batch Ore")
+        self.components = [
+            create_component(name=f"Batch Comp {i}", materials={str(ore.ore_id): 1})
+            for i in range(50)
+        ]
+        self.components_dict = {str(c.component_id): 1 for c in self.components}
+
+    def test_validate_components_single_query(self):
+        blk = Block(name="Batch Block", mass=1.0, components=self.components_dict)
+        with self.assertNumQueries(1):
+            is_valid, errors = blk.validate_components()
+        self.assertTrue(is_valid)
+        self.assertEqual(errors, [])
+
+    def test_validate_components_reports_every_missing_id(self):
+        missing = ["00000000-0000-0000-0000-000000000001", "00000000-0000-0000-0000-000000000002"]
+        components = dict(self.components_dict, **{m: 1 for m in missing})
+        with self.assertNumQueries(1):
+            is_valid, errors = Block(name="Missing", components=components).validate_components()
+        self.assertFalse(is_valid)
+        self.assertEqual(len(errors), 2)
+
+    def test_validate_many_blocks_single_query(self):
+        maps = [{str(c.component_id): 2} for c in self.components]
+        maps.append({"00000000-0000-0000-0000-000000000000": 1})
+        with self.assertNumQueries(1):
+            results = validate_components_many(maps)
+        self.assertEqual([ok for ok, _ in results], [True] * 50 + [False])
+
+    def test_validate_with_known_ids_skips_query(self):
+        known = set(self.components_dict)
+        with self.assertNumQueries(0):
+            results = validate_components_many([self.components_dict], known_ids=known)
+        self.assertEqual(results, [(True, [])])
+
+    def test_form_clean_query_count_independent_of_component_count(self):
+        form = BlockForm(data={
+            "name": "Batch Form Block",
+            "mass": 10.0,
+            "health": 100.0,
+            "pcu": 1,
+            "snap_size": 0.5,
+            "input_mass": 0,
+            "output_mass": 0,
+            "consumer_rate": 0,
+            "producer_rate": 0,
+            "storage_capacity": 0,
+            "components_json": json.dumps(self.components_dict),
+        })
+        # Unique-name check + component references + model full_clean
+        with self.assertNumQueries(3):
+            self.assertTrue(form.is_valid(), form.errors)
+
+
 class BlockMetaTests(TestCase):
     def test_verbose_names(self):
         self.assertEqual(Block._meta.verbose_name, "Block")
@@ -5,16 +5,19 @@ Provides CRUD endpoints for Block model with UUID-based routing.
 Follows ENH-0000005 (Ores) and ENH-0000006 (Components) URL pattern conventions.
 """
 from django.urls import path
+
+from se2CalcProject.page_cache import cache_anonymous_page, conditional_catalog_view
+
 from . import views
 
 app_name = 'blocks'
 
 urlpatterns = [
     # List view - paginated with search and sorting
-    path('', views.BlockListView.as_view(), name='block_list'),
+    path('', cache_anonymous_page(views.BlockListView.as_view()), name='block_list'),
     
     # Detail view - display individual block with components and resource chain
-    path('<uuid:pk>/', views.BlockDetailView.as_view(), name='block_detail'),
+    path('<uuid:pk>/', conditional_catalog_view(cache_anonymous_page(views.BlockDetailView.as_view())), name='block_detail'),
     
     # Create view - dynamic component selection
     path('create/', views.BlockCreateView.as_view(), name='block_create'),
@@ -24,4 +27,13 @@ urlpatterns = [
     
     # Delete view - confirmation before deletion
     path('<uuid:pk>/delete/', views.BlockDeleteView.as_view(), name='block_delete'),
+    
+    # Streaming export - CSV or NDJSON, optionally with flattened ore totals
+    path('export/', views.block_export, name='block_export'),
+    
+    # Batch resource calculation (POST JSON)
+    path('api/calculate/', views.calculate_api, name='block_calculate_api'),
+    
+    # Typeahead for the component/ore pickers (GET ?kind=&q=&limit=)
+    path('api/autocomplete/', conditional_catalog_view(views.autocomplete_api), name='catalog_autocomplete'),
 ]
@@ -0,0 +1,31 @@
+"""
+Batched validation of ``Block.components`` maps.
+
+Thin wrappers around ``components.validators`` that resolve every referenced
+Component with one ``__in`` query, however many blocks or entries are checked.
+"""
+from components.models import Component
+from components.validators import validate_reference_maps
+
+
+def validate_components(components, known_ids=None):
+    """
+    Validate a single ``Block.components`` map (at most one query).
+
+    Returns:
+        tuple: (is_valid: bool, errors: list of error messages)
+    """
+    return validate_components_many([components], known_ids=known_ids)[0]
+
+
+def validate_components_many(components_list, known_ids=None):
+    """
+    Validate many ``Block.components`` maps with one Component query in total.
+
+    Returns:
+        list: ``(is_valid, errors)`` tuples aligned with ``components_list``
+    """
+    return validate_reference_maps(
+        components_list, Component.objects.all(), 'component_id', 'Component',
+        known_ids=known_ids,
+    )
@@ -7,7 +7,7 @@ Implements CRUD operations with:
 - Create/Update views with dynamic component selector
 - Delete view with confirmation
 - Resource chain calculation (Block → Components → Ores)
-- Performance optimization (select_related, caching)
+- Performance optimization (compiled recipe graph, caching)
 
 Pattern follows ENH-0000005 (Ores) and ENH-0000006 (Components).
 """
@@ -15,27 +15,40 @@ from django.views.generic import ListView, DetailView, CreateView, UpdateView, D
 from django.urls import reverse_lazy
 from django.shortcuts import get_object_or_404
 from django.contrib import messages
-from django.db.models import Q
 from django.core.cache import cache
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
 from .models import Block
 from .forms import BlockForm
-from components.models import Component
-from ores.models import Ore
+from . import autocomplete
+from .bom import get_bill_of_materials
+from .calculators import calculate_plan, resolve_plan_lines
+from .exporter import export_response
+from .recipe_graph import (
+    RESOURCE_CHAIN_CACHE_TIMEOUT,
+    get_recipe_graph,
+    resource_chain_cache_key,
+)
+from .search import apply_search
+from se2CalcProject.pagination import KeysetPaginationMixin
+from se2CalcProject.profiling import timer
 import logging
 import json
 
 logger = logging.getLogger(__name__)
 
 
-class BlockListView(ListView):
+class BlockListView(KeysetPaginationMixin, ListView):
     """
-    Display paginated list of blocks with search and sorting.
+    Display cursor-paginated list of blocks with search and sorting.
     
     Query Parameters:
-    - q: Search query (searches name and description)
-    - sort: Sort field (name, mass, pcu, created_at, updated_at)
+    - q: Search query (ranked full-text/trigram match on name and description)
+    - sort: Sort field (relevance, name, mass, pcu, created_at, updated_at;
+      relevance is the default while searching)
     - order: Sort order (asc, desc)
-    - page: Page number for pagination
+    - cursor: Opaque page cursor (``page`` numbers are still accepted)
     """
     model = Block
     template_name = 'blocks/block_list.html'
@@ -46,18 +59,19 @@ class BlockListView(ListView):
         """Get filtered and sorted queryset."""
         queryset = Block.objects.all()
         
-        # Search functionality
+        # Ranked search (see blocks.search)
         search_query = self.request.GET.get('q', '').strip()
         if search_query:
-            queryset = queryset.filter(
-                Q(name__icontains=search_query) |
-                Q(description__icontains=search_query)
-            )
+            queryset = apply_search(queryset, search_query)
         
         # Sorting
-        sort_by = self.request.GET.get('sort', 'name')
+        sort_by = self.request.GET.get('sort') or ('relevance' if search_query else 'name')
         order = self.request.GET.get('order', 'asc')
         
+        # Search results default to relevance order
+        if sort_by == 'relevance' and search_query:
+            return queryset.order_by('-search_rank')
+        
         # Validate sort field
         valid_sort_fields = ['name', 'mass', 'pcu', 'created_at', 'updated_at']
         if sort_by not in valid_sort_fields:
@@ -69,22 +83,17 @@ class BlockListView(ListView):
         else:
             queryset = queryset.order_by(sort_by)
         
-        logger.debug(f"BlockListView query: search='{search_query}', sort={sort_by}, order={order}, count={queryset.count()}")
+        logger.debug(f"BlockListView query: search='{search_query}', sort={sort_by}, order={order}")
         return queryset
     
     def get_context_data(self, **kwargs):
         """Add search and sorting context."""
         context = super().get_context_data(**kwargs)
         context['search_query'] = self.request.GET.get('q', '')
-        context['current_sort'] = self.request.GET.get('sort', 'name')
+        context['current_sort'] = self.request.GET.get('sort') or (
+            'relevance' if context['search_query'].strip() else 'name'
+        )
         context['current_order'] = self.request.GET.get('order', 'asc')
-        
-        # Build query string for pagination
-        query_params = self.request.GET.copy()
-        if 'page' in query_params:
-            query_params.pop('page')
-        context['query_string'] = query_params.urlencode()
-        
         return context
 
 
@@ -97,6 +106,7 @@ class BlockDetailView(DetailView):
     - Formatted components list with quantities
     - Full resource chain (Block → Components → Ores)
     - Statistics (total mass, component count, ore breakdown)
+    - Previous/next blocks by name
     """
     model = Block
     template_name = 'blocks/block_detail.html'
@@ -115,10 +125,16 @@ class BlockDetailView(DetailView):
         context = super().get_context_data(**kwargs)
         block = self.object
         
-        # Calculate resource chain
-        resource_chain = self._calculate_resource_chain(block)
+        # Calculate resource chain (the "chain" Server-Timing metric)
+        with timer('chain'):
+            resource_chain = self._calculate_resource_chain(block)
         context['resource_chain'] = resource_chain
         
+        # Previous/next navigation from the recipe graph's name index
+        context['previous_block'], context['next_block'] = get_recipe_graph().neighbours(
+            'block', block.block_id
+        )
+        
         # Calculate statistics
         context['stats'] = self._calculate_stats(block, resource_chain)
         
@@ -129,6 +145,9 @@ class BlockDetailView(DetailView):
         """
         Calculate full resource chain: Block → Components → Ores
         
+        Expands against the compiled recipe graph, so no per-component or
+        per-ore queries are issued.
+        
         Args:
             block: Block instance
         
@@ -138,78 +157,17 @@ class BlockDetailView(DetailView):
         if not block.components:
             return {'components': [], 'ores': {}, 'total_ore_mass': 0}
         
-        # Check cache first
-        cache_key = f'resource_chain_{block.block_id}'
+        # Keyed by the graph's catalog version: any catalog write moves
+        # readers to a new key (see blocks.catalog_version)
+        graph = get_recipe_graph()
+        cache_key = resource_chain_cache_key(block.block_id, graph.version)
         cached_chain = cache.get(cache_key)
         if cached_chain:
             logger.debug(f"Using cached resource chain for {block.name}")
             return cached_chain
         
-        components_data = []
-        ore_totals = {}
-        
-        # Iterate through block components
-        for comp_id, quantity in block.components.items():
-            try:
-                component = Component.objects.get(component_id=comp_id)
-                
-                comp_data = {
-                    'id': str(component.component_id),
-                    'name': component.name,
-                    'quantity': quantity,
-                    'mass_per_unit': float(component.mass),
-                    'total_mass': float(component.mass) * quantity,
-                    'materials': []
-                }
-                
-                # Get component's materials (ores)
-                if component.materials:
-                    for ore_id, ore_quantity in component.materials.items():
-                        try:
-                            ore = Ore.objects.get(ore_id=ore_id)
-                            
-                            # Calculate total ore needed for this component quantity
-                            total_ore_qty = ore_quantity * quantity
-                            
-                            ore_data = {
-                                'id': str(ore.ore_id),
-                                'name': ore.name,
-                                'quantity_per_component': ore_quantity,
-                                'total_quantity': total_ore_qty,
-                                'mass_per_unit': float(ore.mass)
-                            }
-                            
-                            comp_data['materials'].append(ore_data)
-                            
-                            # Add to total ore count
-                            ore_key = str(ore.ore_id)
-                            if ore_key not in ore_totals:
-                                ore_totals[ore_key] = {
-                                    'name': ore.name,
-                                    'quantity': 0,
-                                    'mass': float(ore.mass)
-                                }
-                            ore_totals[ore_key]['quantity'] += total_ore_qty
-                            
-                        except Ore.DoesNotExist:
-                            logger.warning(f"Ore {ore_id} not found for component {component.name}")
-                
-                components_data.append(comp_data)
-                
-            except Component.DoesNotExist:
-                logger.warning(f"Component {comp_id} not found in database")
-        
-        # Calculate total ore mass
-        total_ore_mass = sum(ore['quantity'] * ore['mass'] for ore in ore_totals.values())
-        
-        resource_chain = {
-            'components': components_data,
-            'ores': ore_totals,
-            'total_ore_mass': total_ore_mass
-        }
-        
-        # Cache for 5 minutes
-        cache.set(cache_key, resource_chain, 300)
+        resource_chain = graph.expand(block.components)
+        cache.set(cache_key, resource_chain, RESOURCE_CHAIN_CACHE_TIMEOUT)
         
         return resource_chain
     
@@ -223,6 +181,25 @@ class BlockDetailView(DetailView):
         }
 
 
+def selected_component_names(form, components=None):
+    """
+    ``{component_id: name}`` for the rows a block form starts with.
+    
+    Covers the block's saved components plus any re-posted in
+    ``components_json``, so the picker can label them; everything else is
+    fetched on demand from the autocomplete endpoint.
+    """
+    component_ids = list(components or {})
+    if form.is_bound:
+        try:
+            posted = json.loads(form.data.get('components_json') or '{}')
+        except json.JSONDecodeError:
+            posted = {}
+        if isinstance(posted, dict):
+            component_ids.extend(posted)
+    return get_recipe_graph().names_for('component', component_ids)
+
+
 class BlockCreateView(CreateView):
     """
     Create new block with component selection.
@@ -235,10 +212,9 @@ class BlockCreateView(CreateView):
     success_url = reverse_lazy('blocks:block_list')
     
     def get_context_data(self, **kwargs):
-        """Add components list for dropdown."""
+        """Add names of the selected components for the picker."""
         context = super().get_context_data(**kwargs)
-        context['components_list'] = Component.objects.all().order_by('name')
-        context['available_components'] = context['components_list']  # Alias for templates
+        context['selected_components'] = selected_component_names(context['form'])
         context['form_title'] = 'Create Block'
         context['button_text'] = 'Create Block'
         return context
@@ -286,10 +262,11 @@ class BlockUpdateView(UpdateView):
         return reverse_lazy('blocks:block_detail', kwargs={'pk': self.object.pk})
     
     def get_context_data(self, **kwargs):
-        """Add components list and existing components."""
+        """Add existing components and the names of the selected ones."""
         context = super().get_context_data(**kwargs)
-        context['components_list'] = Component.objects.all().order_by('name')
-        context['available_components'] = context['components_list']  # Alias for templates
+        context['selected_components'] = selected_component_names(
+            context['form'], self.object.components
+        )
         context['form_title'] = f'Update Block: {self.object.name}'
         context['button_text'] = 'Update Block'
         
@@ -354,3 +331,83 @@ class BlockDeleteView(DeleteView):
         )
         logger.info(f"Deleted block: {block_name}")
         return response
+
+
+def block_export(request):
+    """
+    Stream every block as CSV or NDJSON.
+    
+    URL: /blocks/export/?format=csv|ndjson&ore_totals=1
+    With ore_totals, each block carries its flattened ore quantities
+    (one ore:<name> column per ore in CSV).
+    """
+    return export_response(request, 'blocks')
+
+
+# Upper bound on lines per calculation request
+MAX_PLAN_LINES = 10000
+
+
+@csrf_exempt
+@require_POST
+def calculate_api(request):
+    """
+    Aggregate resources for a whole build plan in one request.
+    
+    URL: POST /blocks/api/calculate/
+    Body (JSON): either a list of lines or {"blocks": [...]}, where each line
+    is {"block_id": uuid, "quantity": n} or {"name": str, "quantity": n}.
+    
+    Response: total_mass, blocks, components, ores and fabricators (crafting
+    seconds per fabricator type), plus missing_blocks for unknown IDs/names.
+    Every line is resolved against the compiled recipe graph; no per-block
+    queries or resource-chain computations are made.
+    """
+    try:
+        payload = json.loads(request.body)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return JsonResponse({'errors': ['Request body must be valid JSON']}, status=400)
+    
+    lines = payload.get('blocks') if isinstance(payload, dict) else payload
+    if not isinstance(lines, list):
+        return JsonResponse({'errors': ['Expected a list of blocks']}, status=400)
+    if len(lines) > MAX_PLAN_LINES:
+        return JsonResponse(
+            {'errors': [f'At most {MAX_PLAN_LINES} lines per request']}, status=400
+        )
+    
+    bom = get_bill_of_materials()
+    resolved, missing, errors = resolve_plan_lines(lines, bom.graph)
+    if errors:
+        return JsonResponse({'errors': errors}, status=400)
+    
+    result = calculate_plan(resolved, bom=bom)
+    result['missing_blocks'] = missing
+    return JsonResponse(result)
+
+
+@require_GET
+def autocomplete_api(request):
+    """
+    Typeahead suggestions for the component/ore pickers.
+    
+    URL: GET /blocks/api/autocomplete/?kind=component&q=ste&limit=10
+    kind is ore, component or block. Matches come from the in-process name
+    index on the recipe graph (name prefix, then word prefix, then trigram
+    similarity); no database queries once the graph is loaded.
+    
+    Response: {"results": [{"id": uuid, "name": str}, ...]}
+    """
+    kind = request.GET.get('kind', 'component')
+    if kind not in autocomplete.KINDS:
+        return JsonResponse(
+            {'errors': [f"kind must be one of: {', '.join(autocomplete.KINDS)}"]}, status=400
+        )
+    try:
+        limit = int(request.GET.get('limit', autocomplete.DEFAULT_LIMIT))
+    except ValueError:
+        return JsonResponse({'errors': ['limit must be an integer']}, status=400)
+    limit = max(1, min(limit, autocomplete.MAX_LIMIT))
+    
+    index = get_recipe_graph().name_index(kind)
+    return JsonResponse({'results': index.search(request.GET.get('q', ''), limit)})
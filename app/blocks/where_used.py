@@ -0,0 +1,73 @@
+"""
+"Where used" lookups for ores and components.
+
+Answers "which components/blocks consume this ore" and "which blocks use
+this component" from the BlockComponent/ComponentMaterial link tables, which
+are maintained on every save and delete. Each lookup is one indexed query;
+nothing scans the JSON fields.
+"""
+from django.db.models import F, Sum
+
+from components.models import ComponentMaterial
+from .models import BlockComponent
+
+
+def components_using_ore(ore_id):
+    """
+    Components whose materials include the ore.
+
+    Returns:
+        list: [{'id', 'name', 'quantity'}] ordered by name, where quantity is
+              the ore needed per component
+    """
+    rows = (
+        ComponentMaterial.objects
+        .filter(ore_id=ore_id)
+        .order_by('component__name')
+        .values_list('component_id', 'component__name', 'quantity')
+    )
+    return [
+        {'id': str(comp_id), 'name': name, 'quantity': quantity}
+        for comp_id, name, quantity in rows
+    ]
+
+
+def blocks_using_ore(ore_id):
+    """
+    Blocks that need the ore through any of their components.
+
+    Returns:
+        list: [{'id', 'name', 'quantity'}] ordered by name, where quantity is
+              the total ore needed per block (summed across components)
+    """
+    rows = (
+        BlockComponent.objects
+        .filter(component__material_links__ore_id=ore_id)
+        .values('block_id', 'block__name')
+        .annotate(ore_quantity=Sum(F('quantity') * F('component__material_links__quantity')))
+        .order_by('block__name')
+    )
+    return [
+        {'id': str(row['block_id']), 'name': row['block__name'], 'quantity': row['ore_quantity']}
+        for row in rows
+    ]
+
+
+def blocks_using_component(component_id):
+    """
+    Blocks built from the component.
+
+    Returns:
+        list: [{'id', 'name', 'quantity'}] ordered by name, where quantity is
+              the component count per block
+    """
+    rows = (
+        BlockComponent.objects
+        .filter(component_id=component_id)
+        .order_by('block__name')
+        .values_list('block_id', 'block__name', 'quantity')
+    )
+    return [
+        {'id': str(block_id), 'name': name, 'quantity': quantity}
+        for block_id, name, quantity in rows
+    ]
@@ -1,9 +1,11 @@
 import json
 
-from django.contrib import admin
-from django.utils.html import format_html
+from django.contrib import admin, messages
+from django.utils.html import format_html, format_html_join
 from django.utils.safestring import mark_safe
+from blocks.recipe_graph import get_recipe_graph
 from .models import Component
+from .validators import validate_materials_many
 
 # Register your models here.
 @admin.register(Component)
@@ -18,6 +20,7 @@ class ComponentAdmin(admin.ModelAdmin):
     )
     search_fields = ('name', 'description', 'fabricator_type')
     list_filter = ('fabricator_type', 'created_at', 'updated_at')
+    actions = ['validate_selected']
     readonly_fields = (
         'component_id',
         'created_at',
@@ -84,16 +87,18 @@ class ComponentAdmin(admin.ModelAdmin):
         if not obj.materials:
             return mark_safe('<em>No ores referenced</em>')
         
-        ores = obj.get_material_ores()
-        if not ores:
-            return mark_safe('<em>No ores referenced</em>')
-        
+        graph = get_recipe_graph()
         ore_items = [
-            '<strong>{}</strong>: {} units'.format(ore.name, obj.materials[str(ore.ore_id)])
-            for ore in ores
+            (graph.ore_name(ore_id), quantity)
+            for ore_id, quantity in obj.materials.items()
+            if graph.ore_name(ore_id) is not None
         ]
-        ore_list = '<br>'.join(ore_items)
-        return mark_safe(ore_list)
+        if not ore_items:
+            return mark_safe('<em>No ores referenced</em>')
+        
+        return format_html_join(
+            mark_safe('<br>'), '<strong>{}</strong>: {} units', ore_items
+        )
     material_ores.short_description = 'Referenced Ores'
     
     def validation_status(self, obj):
@@ -109,4 +114,24 @@ class ComponentAdmin(admin.ModelAdmin):
             return mark_safe(
                 '<span style="color: red; font-weight: bold;">✗ Invalid</span><br>{}'.format(error_list)
             )
-    validation_status.short_description = 'Material Validation'
\ No newline at end of file
+    validation_status.short_description = 'Material Validation'
+    
+    @admin.action(description='Validate materials of selected components')
+    def validate_selected(self, request, queryset):
+        """Validate every selected component with one Ore query in total."""
+        components = list(queryset.only('component_id', 'name', 'materials'))
+        results = validate_materials_many(c.materials for c in components)
+        invalid = [
+            component.name
+            for component, (is_valid, _) in zip(components, results)
+            if not is_valid
+        ]
+        if invalid:
+            self.message_user(
+                request,
+                f"{len(invalid)} of {len(components)} components have invalid materials: "
+                f"{', '.join(invalid)}",
+                messages.ERROR,
+            )
+        else:
+            self.message_user(request, f"All {len(components)} components are valid.")
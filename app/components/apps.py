@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class ComponentsConfig(AppConfig):
     name = 'components'
+
+    def ready(self):
+        from . import signals  # noqa: F401
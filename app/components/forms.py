@@ -3,15 +3,15 @@ Forms for Components app.
 
 Handles JSONField materials with custom form processing:
 - Converts between form data (ore_id[], quantity[]) and JSON storage
-- Validates ore UUIDs against database
+- Validates ore UUIDs against database (one batched query)
 - Validates quantities (positive numbers)
-- Reuses Phase 1 Component.validate_materials() helper
+- Reuses the shared components.validators helper
 """
 from django import forms
 from django.core.exceptions import ValidationError
 from django.db.models import Q
 from .models import Component
-from ores.models import Ore
+from .validators import validate_materials
 import uuid
 
 
@@ -146,9 +146,9 @@ class ComponentForm(forms.ModelForm):
         if not materials:
             raise ValidationError("At least one material is required.")
         
-        # Validate each material entry
+        # Validate each material entry's format; existence is checked below
+        # for all ores at once.
         validated_materials = {}
-        ore_cache = {}  # Cache ore lookups
         
         for ore_id_str, quantity in materials.items():
             # Validate UUID format
@@ -157,14 +157,6 @@ class ComponentForm(forms.ModelForm):
             except (ValueError, AttributeError) as e:
                 raise ValidationError(f"Invalid ore UUID: {ore_id_str}")
             
-            # Validate ore exists in database
-            if ore_id_str not in ore_cache:
-                try:
-                    ore = Ore.objects.get(ore_id=ore_id)
-                    ore_cache[ore_id_str] = ore
-                except Ore.DoesNotExist:
-                    raise ValidationError(f"Ore with UUID {ore_id_str} does not exist.")
-            
             # Validate quantity
             try:
                 quantity_float = float(quantity)
@@ -177,16 +169,8 @@ class ComponentForm(forms.ModelForm):
             # Store validated material
             validated_materials[str(ore_id)] = quantity_float
         
-        # Use Phase 1 validation helper
-        # Create temporary component instance for validation
-        temp_component = Component(
-            name=self.cleaned_data.get('name', 'temp'),
-            mass=self.cleaned_data.get('mass', 1.0),
-            crafting_time=self.cleaned_data.get('crafting_time', 0),
-            materials=validated_materials
-        )
-        
-        is_valid, validation_errors = temp_component.validate_materials()
+        # Verify every referenced ore exists with one batched query
+        is_valid, validation_errors = validate_materials(validated_materials)
         if not is_valid:
             raise ValidationError(validation_errors)
         
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.1 on 2026-10-16 22:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('components', '0001_initial'),
+        ('ores', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ComponentMaterial',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('quantity', models.FloatField(help_text='Ore quantity per component')),
+                ('component', models.ForeignKey(help_text='Component that consumes the ore', on_delete=django.db.models.deletion.CASCADE, related_name='material_links', to='components.component')),
+                ('ore', models.ForeignKey(help_text='Ore consumed by the component', on_delete=django.db.models.deletion.CASCADE, related_name='component_links', to='ores.ore')),
+            ],
+            options={
+                'verbose_name': 'Component Material',
+                'verbose_name_plural': 'Component Materials',
+                'db_table': 'components_componentmaterial',
+                'indexes': [models.Index(fields=['ore', 'component'], name='componentmaterial_ore_idx')],
+                'constraints': [models.UniqueConstraint(fields=('component', 'ore'), name='unique_component_material')],
+            },
+        ),
+    ]
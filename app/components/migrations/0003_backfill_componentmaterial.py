@@ -0,0 +1,40 @@
+# Generated by Django 6.0.1 on 2026-10-16 22:55
+
+import uuid
+
+from django.db import migrations
+
+
+def backfill_material_links(apps, schema_editor):
+    """Create ComponentMaterial rows from every Component.materials dict."""
+    Component = apps.get_model('components', 'Component')
+    ComponentMaterial = apps.get_model('components', 'ComponentMaterial')
+    Ore = apps.get_model('ores', 'Ore')
+
+    ore_ids = {str(pk) for pk in Ore.objects.values_list('ore_id', flat=True)}
+    rows = []
+    for component_id, materials in Component.objects.values_list('component_id', 'materials').iterator():
+        for ore_id, quantity in (materials or {}).items():
+            try:
+                ore_id = str(uuid.UUID(str(ore_id)))
+            except ValueError:
+                continue
+            if ore_id in ore_ids:
+                rows.append(ComponentMaterial(component_id=component_id, ore_id=ore_id, quantity=quantity))
+    ComponentMaterial.objects.bulk_create(rows, batch_size=1000)
+
+
+def clear_material_links(apps, schema_editor):
+    """Remove all ComponentMaterial rows."""
+    apps.get_model('components', 'ComponentMaterial').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('components', '0002_componentmaterial'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_material_links, clear_material_links),
+    ]
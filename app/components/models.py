@@ -1,6 +1,9 @@
+import uuid
+
 from django.db import models
 from uuid_utils import uuid7
 from ores.models import Ore
+from .validators import validate_materials
 
 # Create your models here.
 def generate_uuid():
@@ -70,35 +73,16 @@ class Component(models.Model):
         """
         Validate that all ore_ids in materials JSON reference valid Ores.
         
+        Resolves every referenced ore with a single query
+        (see ``components.validators``).
+        
         Returns:
             tuple: (is_valid: bool, errors: list of error messages)
         """
         if not self.materials:
             return True, []
         
-        errors = []
-        
-        for ore_id_str, quantity in self.materials.items():
-            try:
-                # Validate quantity is numeric
-                if not isinstance(quantity, (int, float)) or quantity <= 0:
-                    errors.append(
-                        f"Invalid quantity for ore {ore_id_str}: "
-                        f"must be positive number, got {quantity}"
-                    )
-                    continue
-                
-                # Validate ore_id references existing Ore
-                try:
-                    ore = Ore.objects.get(ore_id=ore_id_str)
-                except Ore.DoesNotExist:
-                    errors.append(
-                        f"Ore with ID {ore_id_str} does not exist"
-                    )
-            except Exception as e:
-                errors.append(f"Error validating material {ore_id_str}: {str(e)}")
-        
-        return len(errors) == 0, errors
+        return validate_materials(self.materials)
 
     def get_material_ores(self):
         """
@@ -126,4 +110,115 @@ class Component(models.Model):
     def save(self, *args, **kwargs):
         """Override save to validate materials before saving."""
         self.clean()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        super().save(*args, **kwargs)
+
+    def sync_material_links(self):
+        """
+        Rewrite this component's ComponentMaterial rows from the materials JSON.
+        
+        Entries whose ore does not exist (or whose key is not a UUID) are
+        skipped, so the table only mirrors resolvable references; a missing
+        ore's rows are added once it is created (``ComponentMaterial.backfill``).
+        Called from post_save (including raw fixture loads).
+        """
+        ComponentMaterial.objects.filter(component_id=self.component_id).delete()
+        ComponentMaterial.objects.bulk_create(
+            ComponentMaterial.rows_for(self.component_id, self.materials)
+        )
+
+
+class ComponentMaterial(models.Model):
+    """
+    Relational mirror of one Component.materials entry.
+    
+    Component.materials stays the source of truth; these rows are dual-written
+    on save so "which components use this ore" and ore aggregation become
+    indexed joins instead of JSON scans.
+    """
+    id = models.BigAutoField(primary_key=True)
+
+    component = models.ForeignKey(
+        Component,
+        on_delete=models.CASCADE,
+        related_name='material_links',
+        help_text="Component that consumes the ore",
+    )
+
+    ore = models.ForeignKey(
+        Ore,
+        on_delete=models.CASCADE,
+        related_name='component_links',
+        help_text="Ore consumed by the component",
+    )
+
+    quantity = models.FloatField(
+        help_text="Ore quantity per component",
+    )
+
+    class Meta:
+        verbose_name = 'Component Material'
+        verbose_name_plural = 'Component Materials'
+        db_table = 'components_componentmaterial'
+        constraints = [
+            models.UniqueConstraint(fields=['component', 'ore'], name='unique_component_material'),
+        ]
+        indexes = [
+            models.Index(fields=['ore', 'component'], name='componentmaterial_ore_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.component_id} → {self.ore_id} × {self.quantity}"
+
+    @classmethod
+    def rows_for(cls, component_id, materials, existing_ore_ids=None):
+        """
+        Build (unsaved) rows for a materials dict.
+        
+        Args:
+            component_id: Owning component's primary key
+            materials: {ore_id: quantity}
+            existing_ore_ids: Optional set of ore ID strings known to exist;
+                queried when not given
+        
+        Returns:
+            list: ComponentMaterial instances ready for bulk_create
+        """
+        ore_ids = {}
+        for ore_id, quantity in (materials or {}).items():
+            try:
+                ore_ids[str(uuid.UUID(str(ore_id)))] = quantity
+            except ValueError:
+                continue
+
+        if existing_ore_ids is None:
+            existing_ore_ids = {
+                str(pk) for pk in Ore.objects.filter(ore_id__in=ore_ids).values_list('ore_id', flat=True)
+            }
+
+        return [
+            cls(component_id=component_id, ore_id=ore_id, quantity=quantity)
+            for ore_id, quantity in ore_ids.items()
+            if ore_id in existing_ore_ids
+        ]
+
+    @classmethod
+    def backfill(cls, ore_ids):
+        """
+        Add the rows ``rows_for`` skipped because these ores did not exist yet.
+
+        Components saved before one of their ores (e.g. fixtures loaded in the
+        wrong order) get their missing link once the ore is created.
+
+        Args:
+            ore_ids: Primary keys of newly created ores
+        """
+        keys = {str(pk) for pk in ore_ids}
+        if not keys:
+            return
+        rows = [
+            cls(component_id=component_id, ore_id=key, quantity=materials[key])
+            for component_id, materials in
+            Component.objects.filter(materials__has_any_keys=list(keys)).values_list('component_id', 'materials')
+            for key in keys.intersection(materials)
+        ]
+        cls.objects.bulk_create(rows, ignore_conflicts=True)
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""
+Signal handlers for the Components app.
+
+Dual-writes Component.materials into ComponentMaterial rows.
+"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from ores.models import Ore
+from .models import Component, ComponentMaterial
+
+
+@receiver(post_save, sender=Component)
+def sync_material_links(sender, instance, **kwargs):
+    """Mirror the saved materials JSON into ComponentMaterial rows."""
+    instance.sync_material_links()
+
+
+@receiver(post_save, sender=Ore)
+def backfill_material_links(sender, instance, created, **kwargs):
+    """Link components that referenced this ore before it existed."""
+    if created:
+        ComponentMaterial.backfill([instance.ore_id])
@@ -5,8 +5,7 @@ Provides custom template filters for displaying component data,
 particularly for converting ore UUIDs to human-readable names.
 """
 from django import template
-from ores.models import Ore
-from django.core.cache import cache
+from blocks.recipe_graph import get_recipe_graph
 import logging
 
 register = template.Library()
@@ -27,7 +26,7 @@ def get_ore_name(ore_id):
     Returns:
         Ore name if found, otherwise "Unknown Ore (uuid)"
     
-    Caches ore lookups to improve performance.
+    Resolved from the compiled recipe graph, so no per-UUID queries.
     """
     if not ore_id:
         return "Unknown Ore"
@@ -35,28 +34,12 @@ def get_ore_name(ore_id):
     # Convert to string if UUID object
     ore_id_str = str(ore_id)
     
-    # Check cache first (5 minute TTL)
-    cache_key = f'ore_name_{ore_id_str}'
-    cached_name = cache.get(cache_key)
-    
-    if cached_name:
-        return cached_name
-    
-    # Query database
-    try:
-        ore = Ore.objects.get(ore_id=ore_id_str)
-        ore_name = ore.name
-        
-        # Cache for 5 minutes
-        cache.set(cache_key, ore_name, 300)
-        
-        return ore_name
-    except Ore.DoesNotExist:
+    ore_name = get_recipe_graph().ore_name(ore_id_str)
+    if ore_name is None:
         logger.warning(f'Ore not found for UUID: {ore_id_str}')
         return f"Unknown Ore ({ore_id_str[:8]}...)"
-    except Exception as e:
-        logger.error(f'Error looking up ore {ore_id_str}: {e}')
-        return "Unknown Ore (error)"
+    
+    return ore_name
 
 
 @register.filter
@@ -5,6 +5,7 @@ from django.contrib.messages import get_messages
 from django.test import Client, TestCase
 from django.urls import reverse
 
+from blocks.models import Block
 from components.models import Component
 from ores.models import Ore
 
@@ -205,6 +206,45 @@ class ComponentViewTestCase(TestCase):
 
         self.assertEqual(response.context["component"].name, "Detail Component")
 
+    def test_component_detail_lists_blocks_using_component(self):
+        block = Block.objects.create(
+            name="Detail Block", mass=10.0, health=1.0, pcu=1, snap_size=0.5,
+            components={str(self.detail_component.component_id): 4},
+        )
+        url = reverse("components:component_detail", args=[self.detail_component.pk])
+        response = self.client.get(url)
+
+        self.assertEqual(
+            response.context["used_by_blocks"],
+            [{"id": str(block.block_id), "name": "Detail Block", "quantity": 4}],
+        )
+        self.assertContains(response, reverse("blocks:block_detail", args=[block.block_id]))
+
+    def test_component_detail_unused_component_shows_empty_state(self):
+        url = reverse("components:component_detail", args=[self.updatable_component.pk])
+        response = self.client.get(url)
+
+        self.assertContains(response, "No blocks use this component.")
+
+    def test_component_used_by_json(self):
+        block = Block.objects.create(
+            name="JSON Block", mass=10.0, health=1.0, pcu=1, snap_size=0.5,
+            components={str(self.detail_component.component_id): 2},
+        )
+        response = self.client.get(
+            reverse("components:component_used_by", args=[self.detail_component.pk])
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["component"]["id"], str(self.detail_component.pk))
+        self.assertEqual(data["blocks"][0]["id"], str(block.block_id))
+
+    def test_component_used_by_json_missing_component(self):
+        response = self.client.get(reverse("components:component_used_by", args=[uuid.uuid4()]))
+
+        self.assertEqual(response.status_code, 404)
+
     # ComponentCreateView tests (6)
     def test_component_create_view_get(self):
         url = reverse("components:component_create")
@@ -212,7 +252,7 @@ class ComponentViewTestCase(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "components/component_form.html")
-        self.assertIn("ores", response.context)
+        self.assertIn("selected_ores", response.context)
         self.assertIn("form_title", response.context)
         self.assertIn("submit_text", response.context)
 
@@ -1,9 +1,12 @@
 from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
-from components.models import Component
+from components.forms import ComponentForm
+from components.models import Component, ComponentMaterial
+from components.validators import validate_materials_many
 from ores.models import Ore
 from datetime import timedelta
+import json
 import time
 
 
@@ -540,4 +543,87 @@ class ComponentIntegrationTests(TestCase):
         component.delete()
         
         # Verify ore still exists
-        self.assertTrue(Ore.objects.filter(ore_id=self.iron.ore_id).exists())
\ No newline at end of file
+        self.assertTrue(Ore.objects.filter(ore_id=self.iron.ore_id).exists())
+
+
+class ComponentMaterialLinkTests(TestCase):
+    """ComponentMaterial rows mirror Component.materials on every save."""
+
+    def setUp(self):
+        self.iron = Ore.objects.create(name="Link Iron", mass=1.0)
+        self.nickel = Ore.objects.create(name="Link Nickel", mass=1.0)
+
+    def test_links_created_on_save(self):
+        component = Component.objects.create(
+            name="Link Plate",
+            materials={str(self.iron.ore_id): 20, str(self.nickel.ore_id): 2.5},
+        )
+        links = dict(component.material_links.values_list("ore__name", "quantity"))
+        self.assertEqual(links, {"Link Iron": 20, "Link Nickel": 2.5})
+
+    def test_links_rewritten_on_update(self):
+        component = Component.objects.create(name="Link Tube", materials={str(self.iron.ore_id): 1})
+        component.materials = {str(self.nickel.ore_id): 3}
+        component.save()
+        self.assertEqual(
+            [(str(pk), quantity) for pk, quantity in component.material_links.values_list("ore_id", "quantity")],
+            [(str(self.nickel.ore_id), 3)],
+        )
+
+    def test_reverse_lookup_from_ore(self):
+        Component.objects.create(name="Link A", materials={str(self.iron.ore_id): 1})
+        Component.objects.create(name="Link B", materials={str(self.iron.ore_id): 2})
+        users = set(self.iron.component_links.values_list("component__name", flat=True))
+        self.assertEqual(users, {"Link A", "Link B"})
+
+    def test_links_removed_with_ore(self):
+        Component.objects.create(name="Link C", materials={str(self.iron.ore_id): 1})
+        self.iron.delete()
+        self.assertFalse(ComponentMaterial.objects.exists())
+
+    def test_fixture_loaded_before_ores_backfills_links(self):
+        from django.core.management import call_command
+        Ore.objects.all().delete()
+        call_command("loaddata", "sample_components.json", verbosity=0)
+        self.assertFalse(ComponentMaterial.objects.exists())
+        call_command("loaddata", "sample_ores.json", verbosity=0)
+        expected = sum(len(c.materials) for c in Component.objects.all())
+        self.assertEqual(ComponentMaterial.objects.count(), expected)
+
+
+class ComponentBatchedValidationTests(TestCase):
+    """Ore references are resolved with one query, whatever the count."""
+
+    def setUp(self):
+        self.ores = [Ore.objects.create(name=f"Batch Ore {i}", mass=1.0) for i in range(30)]
+        self.materials = {str(ore.ore_id): 1 for ore in self.ores}
+
+    def test_validate_materials_single_query(self):
+        component = Component(name="Batch", materials=self.materials)
+        with self.assertNumQueries(1):
+            is_valid, errors = component.validate_materials()
+        self.assertTrue(is_valid)
+        self.assertEqual(errors, [])
+
+    def test_validate_materials_invalid_uuid(self):
+        component = Component(name="Bad UUID", materials={"not-a-uuid": 1})
+        is_valid, errors = component.validate_materials()
+        self.assertFalse(is_valid)
+        self.assertIn("not a valid UUID", errors[0])
+
+    def test_validate_many_components_single_query(self):
+        maps = [{str(ore.ore_id): 1} for ore in self.ores] + [{"00000000-0000-0000-0000-000000000000": 1}]
+        with self.assertNumQueries(1):
+            results = validate_materials_many(maps)
+        self.assertEqual(sum(ok for ok, _ in results), 30)
+
+    def test_form_clean_materials_single_query(self):
+        form = ComponentForm(data={
+            "name": "Batch Form",
+            "mass": 1.0,
+            "crafting_time": 1.0,
+            "materials_json": json.dumps(self.materials),
+        })
+        form.cleaned_data = {}
+        with self.assertNumQueries(1):
+            self.assertEqual(len(form.clean_materials()), 30)
@@ -5,16 +5,19 @@ Provides CRUD endpoints for Component model with UUID-based routing.
 Follows ENH-0000005 (Ores) URL pattern conventions.
 """
 from django.urls import path
+
+from se2CalcProject.page_cache import cache_anonymous_page, conditional_catalog_view
+
 from . import views
 
 app_name = 'components'
 
 urlpatterns = [
     # List view - paginated with search and sorting
-    path('', views.ComponentListView.as_view(), name='component_list'),
+    path('', cache_anonymous_page(views.ComponentListView.as_view()), name='component_list'),
     
     # Detail view - display individual component with materials
-    path('<uuid:pk>/', views.ComponentDetailView.as_view(), name='component_detail'),
+    path('<uuid:pk>/', conditional_catalog_view(cache_anonymous_page(views.ComponentDetailView.as_view())), name='component_detail'),
     
     # Create view - form with dynamic material selector
     path('create/', views.ComponentCreateView.as_view(), name='component_create'),
@@ -24,4 +27,10 @@ urlpatterns = [
     
     # Delete view - confirmation before deletion
     path('<uuid:pk>/delete/', views.ComponentDeleteView.as_view(), name='component_delete'),
+    
+    # Where used (JSON) - blocks built from this component
+    path('<uuid:pk>/used-by/', conditional_catalog_view(views.component_used_by), name='component_used_by'),
+    
+    # Streaming export (CSV or NDJSON)
+    path('export/', views.component_export, name='component_export'),
 ]
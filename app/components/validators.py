@@ -0,0 +1,128 @@
+"""
+Batched reference validation for recipe JSON fields.
+
+``Component.materials`` and ``Block.components`` are both ``{uuid: quantity}``
+maps. Rather than one ``.get()`` per entry, these helpers collect every ID
+referenced by any number of maps, resolve them with one ``__in`` query per
+referenced table, and check each map against the resulting ID set in memory.
+
+Callers that already know the valid IDs (fixture files, bulk imports) can pass
+``known_ids`` and skip the query entirely.
+"""
+import uuid
+
+from django.db import connection
+
+from ores.models import Ore
+
+
+def canonical_reference_id(value):
+    """Return ``value`` as a canonical UUID string, or None if it is not a UUID."""
+    try:
+        return str(uuid.UUID(str(value)))
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def existing_ids(queryset, field, ids):
+    """
+    Return the subset of ``ids`` present in ``queryset`` as canonical strings.
+
+    One query for any number of IDs on PostgreSQL; split only where the
+    backend caps parameters per statement (SQLite).
+    """
+    ids = list(ids)
+    if not ids:
+        return set()
+    batch_size = connection.features.max_query_params or len(ids)
+    found = set()
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start:start + batch_size]
+        found.update(
+            str(pk) for pk in
+            queryset.order_by().filter(**{f'{field}__in': batch}).values_list(field, flat=True)
+        )
+    return found
+
+
+def reference_errors(references, known_ids, label):
+    """
+    Check one ``{uuid: quantity}`` map against a set of known IDs.
+
+    Args:
+        references: dict mapping referenced IDs to quantities
+        known_ids: set of canonical UUID strings that exist
+        label: Referenced model name used in messages ("Ore", "Component")
+
+    Returns:
+        list: Error messages, empty when the map is valid
+    """
+    errors = []
+    for ref_id, quantity in (references or {}).items():
+        if not isinstance(quantity, (int, float)) or quantity <= 0:
+            errors.append(
+                f"Invalid quantity for {label.lower()} {ref_id}: "
+                f"must be positive number, got {quantity}"
+            )
+            continue
+
+        canonical = canonical_reference_id(ref_id)
+        if canonical is None:
+            errors.append(f"{label} ID {ref_id} is not a valid UUID")
+        elif canonical not in known_ids:
+            errors.append(f"{label} with ID {ref_id} does not exist")
+    return errors
+
+
+def validate_reference_maps(reference_maps, queryset, field, label, known_ids=None):
+    """
+    Validate many ``{uuid: quantity}`` maps against one table.
+
+    Args:
+        reference_maps: Iterable of dicts (None is treated as empty)
+        queryset: Queryset of the referenced model
+        field: Primary key field name on the referenced model
+        label: Referenced model name used in messages
+        known_ids: Optional set of valid canonical IDs; skips the query
+
+    Returns:
+        list: ``(is_valid, errors)`` tuples aligned with ``reference_maps``
+    """
+    reference_maps = [references or {} for references in reference_maps]
+
+    if known_ids is None:
+        referenced = {
+            canonical
+            for references in reference_maps
+            for canonical in map(canonical_reference_id, references)
+            if canonical is not None
+        }
+        known_ids = existing_ids(queryset, field, referenced)
+
+    results = []
+    for references in reference_maps:
+        errors = reference_errors(references, known_ids, label)
+        results.append((len(errors) == 0, errors))
+    return results
+
+
+def validate_materials(materials, known_ids=None):
+    """
+    Validate a single ``Component.materials`` map (at most one query).
+
+    Returns:
+        tuple: (is_valid: bool, errors: list of error messages)
+    """
+    return validate_materials_many([materials], known_ids=known_ids)[0]
+
+
+def validate_materials_many(materials_list, known_ids=None):
+    """
+    Validate many ``Component.materials`` maps with one Ore query in total.
+
+    Returns:
+        list: ``(is_valid, errors)`` tuples aligned with ``materials_list``
+    """
+    return validate_reference_maps(
+        materials_list, Ore.objects.all(), 'ore_id', 'Ore', known_ids=known_ids
+    )
@@ -11,25 +11,33 @@ Implements CRUD operations with:
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
 from django.urls import reverse_lazy
 from django.contrib import messages
-from django.db.models import Q
-from django.core.paginator import Paginator
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
 from .models import Component
 from .forms import ComponentForm
 from ores.models import Ore
+from blocks.exporter import export_response
+from blocks.identity_map import get_many
+from blocks.recipe_graph import get_recipe_graph
+from blocks.search import apply_search
+from blocks.where_used import blocks_using_component
+from se2CalcProject.pagination import KeysetPaginationMixin, approximate_count
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class ComponentListView(ListView):
+class ComponentListView(KeysetPaginationMixin, ListView):
     """
-    Display paginated list of components with search and sorting.
+    Display cursor-paginated list of components with search and sorting.
     
     Query Parameters:
-    - q: Search query (searches name and description)
-    - sort: Sort field (name, mass, created_at, updated_at)
+    - q: Search query (ranked full-text/trigram match on name and description)
+    - sort: Sort field (relevance, name, mass, crafting_time, created_at, updated_at;
+      relevance is the default while searching)
     - order: Sort order (asc, desc)
-    - page: Page number for pagination
+    - cursor: Opaque page cursor (``page`` numbers are still accepted)
     """
     model = Component
     template_name = 'components/component_list.html'
@@ -40,20 +48,21 @@ class ComponentListView(ListView):
         """Get filtered and sorted queryset."""
         queryset = Component.objects.all()
         
-        # Search functionality
+        # Ranked search (see blocks.search)
         search_query = self.request.GET.get('q', '').strip()
         if search_query:
-            queryset = queryset.filter(
-                Q(name__icontains=search_query) |
-                Q(description__icontains=search_query)
-            )
+            queryset = apply_search(queryset, search_query)
         
         # Sorting functionality
-        sort_field = self.request.GET.get('sort', 'name')
+        sort_field = self.request.GET.get('sort') or ('relevance' if search_query else 'name')
         sort_order = self.request.GET.get('order', 'asc')
         
+        # Search results default to relevance order
+        if sort_field == 'relevance' and search_query:
+            return queryset.order_by('-search_rank')
+        
         # Validate sort field
-        valid_sort_fields = ['name', 'mass', 'build_time', 'created_at', 'updated_at']
+        valid_sort_fields = ['name', 'mass', 'crafting_time', 'created_at', 'updated_at']
         if sort_field not in valid_sort_fields:
             sort_field = 'name'
         
@@ -71,17 +80,13 @@ class ComponentListView(ListView):
         
         # Preserve query parameters
         context['search_query'] = self.request.GET.get('q', '')
-        context['current_sort'] = self.request.GET.get('sort', 'name')
+        context['current_sort'] = self.request.GET.get('sort') or (
+            'relevance' if context['search_query'].strip() else 'name'
+        )
         context['current_order'] = self.request.GET.get('order', 'asc')
         
-        # Calculate statistics
-        context['total_components'] = Component.objects.count()
-        
-        # For pagination with query params
-        query_params = self.request.GET.copy()
-        if 'page' in query_params:
-            query_params.pop('page')
-        context['query_string'] = query_params.urlencode()
+        # Catalog size (approximate, cached; see se2CalcProject.pagination)
+        context['total_components'] = approximate_count(Component.objects.all())
         
         return context
 
@@ -91,7 +96,8 @@ class ComponentDetailView(DetailView):
     Display detailed information for a single component.
     
     Shows all component properties including formatted materials list
-    with ore names (not just UUIDs).
+    with ore names (not just UUIDs), the blocks that use the component and
+    links to the previous/next component by name.
     """
     model = Component
     template_name = 'components/component_detail.html'
@@ -102,13 +108,12 @@ class ComponentDetailView(DetailView):
         context = super().get_context_data(**kwargs)
         
         # Format materials with ore names
-        component = self.get_object()
+        component = self.object
         formatted_materials = []
         
         if component.materials:
-            # Batch fetch all ores to avoid N+1 queries
-            ore_ids = list(component.materials.keys())
-            ores = {str(ore.ore_id): ore for ore in Ore.objects.filter(ore_id__in=ore_ids)}
+            # One batch through the request's identity map
+            ores = get_many(Ore, component.materials.keys())
             
             for ore_id_str, quantity in component.materials.items():
                 ore = ores.get(ore_id_str)
@@ -122,9 +127,50 @@ class ComponentDetailView(DetailView):
         context['formatted_materials'] = formatted_materials
         context['total_material_mass'] = sum(m['quantity'] for m in formatted_materials)
         
+        # "Used by" section from the link-table reverse index
+        context['used_by_blocks'] = blocks_using_component(component.component_id)
+        
+        # Previous/next navigation from the recipe graph's name index
+        context['previous_component'], context['next_component'] = get_recipe_graph().neighbours(
+            'component', component.component_id
+        )
+        
         return context
 
 
+def component_used_by(request, pk):
+    """
+    Return the blocks built from a component as JSON.
+    
+    URL: /components/<uuid:pk>/used-by/
+    Response:
+        {"component": {"id", "name"}, "blocks": [...]}
+    """
+    component = get_object_or_404(Component, pk=pk)
+    return JsonResponse({
+        'component': {'id': str(component.component_id), 'name': component.name},
+        'blocks': blocks_using_component(component.component_id),
+    })
+
+
+def selected_ore_names(form, materials=None):
+    """
+    ``{ore_id: name}`` for the rows a component form starts with.
+    
+    Covers the component's saved materials plus any re-posted in
+    ``materials_json``; other ores come from the autocomplete endpoint.
+    """
+    ore_ids = list(materials or {})
+    if form.is_bound:
+        try:
+            posted = json.loads(form.data.get('materials_json') or '{}')
+        except json.JSONDecodeError:
+            posted = {}
+        if isinstance(posted, dict):
+            ore_ids.extend(posted)
+    return get_recipe_graph().names_for('ore', ore_ids)
+
+
 class ComponentCreateView(CreateView):
     """
     Create new component with dynamic material selector.
@@ -138,11 +184,11 @@ class ComponentCreateView(CreateView):
     success_url = reverse_lazy('components:component_list')
     
     def get_context_data(self, **kwargs):
-        """Add ore list for material selector."""
+        """Add names of the selected ores for the material selector."""
         context = super().get_context_data(**kwargs)
         
-        # Provide all ores for dropdown
-        context['ores'] = Ore.objects.all().order_by('name')
+        # Only the selected ores are shipped; the picker fetches the rest on demand
+        context['selected_ores'] = selected_ore_names(context['form'])
         context['form_title'] = 'Create New Component'
         context['submit_text'] = 'Create Component'
         
@@ -200,11 +246,11 @@ class ComponentUpdateView(UpdateView):
         return reverse_lazy('components:component_detail', kwargs={'pk': self.object.pk})
     
     def get_context_data(self, **kwargs):
-        """Add ore list and existing materials to context."""
+        """Add existing materials and the names of the selected ores."""
         context = super().get_context_data(**kwargs)
         
-        # Provide all ores for dropdown
-        context['ores'] = Ore.objects.all().order_by('name')
+        # Only the selected ores are shipped; the picker fetches the rest on demand
+        context['selected_ores'] = selected_ore_names(context['form'], self.object.materials)
         context['form_title'] = f'Edit Component: {self.object.name}'
         context['submit_text'] = 'Update Component'
         
@@ -260,12 +306,11 @@ class ComponentDeleteView(DeleteView):
         context = super().get_context_data(**kwargs)
         
         # Format materials for display
-        component = self.get_object()
+        component = self.object
         formatted_materials = []
         
         if component.materials:
-            ore_ids = list(component.materials.keys())
-            ores = {str(ore.ore_id): ore for ore in Ore.objects.filter(ore_id__in=ore_ids)}
+            ores = get_many(Ore, component.materials.keys())
             
             for ore_id_str, quantity in component.materials.items():
                 ore = ores.get(ore_id_str)
@@ -298,3 +343,12 @@ class ComponentDeleteView(DeleteView):
         )
         
         return super().delete(request, *args, **kwargs)
+
+
+def component_export(request):
+    """
+    Stream every component as CSV or NDJSON.
+    
+    URL: /components/export/?format=csv|ndjson
+    """
+    return export_response(request, 'components')
@@ -1,6 +1,22 @@
 import os
 import django
+import pytest
 from django.conf import settings
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'se2CalcProject.settings')
-django.setup()
\ No newline at end of file
+django.setup()
+
+pytest_plugins = ['se2CalcProject.budgets']
+
+
+@pytest.fixture(autouse=True)
+def clear_catalog_caches():
+    """
+    Start every test from an empty cache.
+
+    TestCase rollbacks do not send model signals, so cached resource chains
+    and the recipe graph version would otherwise leak between tests.
+    """
+    from django.core.cache import cache
+    cache.clear()
+    yield
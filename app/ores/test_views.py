@@ -6,6 +6,8 @@ from django.test import TestCase, Client
 from django.urls import reverse
 from ores.models import Ore
 from ores.forms import OreForm
+from components.models import Component
+from blocks.models import Block
 
 
 class OreViewsTestCase(TestCase):
@@ -259,6 +261,72 @@ class OreViewsTestCase(TestCase):
         self.assertFalse(Ore.objects.filter(ore_id=ore_id).exists())
 
 
+class OreUsedByTestCase(TestCase):
+    """Test case for the ore "Used by" section and JSON endpoint."""
+    
+    def setUp(self):
+        """Create an ore used by two components and one block."""
+        self.client = Client()
+        self.iron = Ore.objects.create(name='Iron', mass=1.0)
+        self.unused = Ore.objects.create(name='Unused', mass=1.0)
+        self.plate = Component.objects.create(
+            name='Steel Plate', materials={str(self.iron.ore_id): 21}, mass=20.0
+        )
+        self.girder = Component.objects.create(
+            name='Girder', materials={str(self.iron.ore_id): 6}, mass=6.0
+        )
+        self.block = Block.objects.create(
+            name='Armor Block', mass=500.0, health=100.0, pcu=1, snap_size=0.5,
+            components={str(self.plate.component_id): 10, str(self.girder.component_id): 2},
+        )
+    
+    def test_detail_view_lists_consumers(self):
+        """Test that the detail page links every component and block using the ore."""
+        response = self.client.get(
+            reverse('ores:ore_detail', kwargs={'pk': self.iron.ore_id})
+        )
+        self.assertEqual(
+            [c['name'] for c in response.context['used_by_components']],
+            ['Girder', 'Steel Plate'],
+        )
+        self.assertEqual(len(response.context['used_by_blocks']), 1)
+        self.assertContains(
+            response, reverse('components:component_detail', args=[self.plate.component_id])
+        )
+        self.assertContains(
+            response, reverse('blocks:block_detail', args=[self.block.block_id])
+        )
+    
+    def test_detail_view_unused_ore(self):
+        """Test that an unused ore shows the empty state."""
+        response = self.client.get(
+            reverse('ores:ore_detail', kwargs={'pk': self.unused.ore_id})
+        )
+        self.assertContains(response, 'No components use this ore.')
+    
+    def test_used_by_json(self):
+        """Test that the JSON endpoint sums ore per block across components."""
+        response = self.client.get(
+            reverse('ores:ore_used_by', kwargs={'pk': self.iron.ore_id})
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['ore']['name'], 'Iron')
+        self.assertEqual(len(data['components']), 2)
+        self.assertEqual(data['blocks'], [{
+            'id': str(self.block.block_id),
+            'name': 'Armor Block',
+            'quantity': 21 * 10 + 6 * 2,
+        }])
+    
+    def test_used_by_json_missing_ore(self):
+        """Test that the JSON endpoint returns 404 for unknown ores."""
+        response = self.client.get(
+            reverse('ores:ore_used_by', kwargs={'pk': '00000000-0000-0000-0000-000000000000'})
+        )
+        self.assertEqual(response.status_code, 404)
+
+
 class OreFormTestCase(TestCase):
     """Test case for OreForm validation."""
     
@@ -3,16 +3,19 @@ URL configuration for the Ores app.
 Maps URLs to corresponding view classes for CRUD operations.
 """
 from django.urls import path
+
+from se2CalcProject.page_cache import cache_anonymous_page, conditional_catalog_view
+
 from . import views
 
 app_name = 'ores'
 
 urlpatterns = [
     # List view - /ores/
-    path('', views.OreListView.as_view(), name='ore_list'),
+    path('', cache_anonymous_page(views.OreListView.as_view()), name='ore_list'),
     
     # Detail view - /ores/<uuid>/
-    path('<uuid:pk>/', views.OreDetailView.as_view(), name='ore_detail'),
+    path('<uuid:pk>/', conditional_catalog_view(cache_anonymous_page(views.OreDetailView.as_view())), name='ore_detail'),
     
     # Create view - /ores/create/
     path('create/', views.OreCreateView.as_view(), name='ore_create'),
@@ -22,4 +25,10 @@ urlpatterns = [
     
     # Delete view - /ores/<uuid>/delete/
     path('<uuid:pk>/delete/', views.OreDeleteView.as_view(), name='ore_delete'),
+    
+    # Where used (JSON) - /ores/<uuid>/used-by/
+    path('<uuid:pk>/used-by/', conditional_catalog_view(views.ore_used_by), name='ore_used_by'),
+    
+    # Streaming export - /ores/export/?format=csv|ndjson
+    path('export/', views.ore_export, name='ore_export'),
 ]
\ No newline at end of file
@@ -1,23 +1,30 @@
 from django.contrib import messages
 from django.contrib.messages.views import SuccessMessageMixin
-from django.db.models import Q
 from django.db.models.query import QuerySet
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
 from django.views.generic import (ListView, DetailView, CreateView, UpdateView, DeleteView)
 from .models import Ore
 from .forms import OreForm
+from blocks.exporter import export_response
+from blocks.recipe_graph import get_recipe_graph
+from blocks.search import apply_search
+from blocks.where_used import blocks_using_ore, components_using_ore
+from se2CalcProject.pagination import KeysetPaginationMixin
 
-class OreListView(ListView):
+class OreListView(KeysetPaginationMixin, ListView):
     """
-    Display paginated list of ores with filtering and sorting capabilities.
+    Display cursor-paginated list of ores with filtering and sorting capabilities.
     
     URL: /ores/
     Template: ores/ore_list.html
     Context:
-        - ore_list: Queryset of Ore objects
+        - ore_list: Page of Ore objects
         - search_query: Current search term
         - sort_by: Current sort field
         - sort_order: Current sort order (asc/desc)
+        - query_string: GET parameters without cursor/page, for page links
     """
     model = Ore
     template_name = 'ores/ore_list.html'
@@ -27,18 +34,18 @@ class OreListView(ListView):
     def get_queryset(self):
         queryset = Ore.objects.all()
         
-        # search filtering
+        # Ranked search (see blocks.search)
         search_query = self.request.GET.get('search','').strip()
         if search_query:
-            queryset = queryset.filter(
-                Q(name__icontains=search_query) |
-                Q(description__icontains=search_query)
-            )
+            queryset = apply_search(queryset, search_query)
             
-        # Sorting
-        sort_by = self.request.GET.get('sort_by', 'name')
+        # Sorting (search results default to relevance)
+        sort_by = self.request.GET.get('sort_by') or ('relevance' if search_query else 'name')
         sort_order = self.request.GET.get('sort_order', 'asc')
         
+        if sort_by == 'relevance' and search_query:
+            return queryset.order_by('-search_rank')
+        
         # Validate sort_by parameter
         valid_sort_fields = ['name', 'mass', 'created_at', 'updated_at']
         if sort_by not in valid_sort_fields:
@@ -55,12 +62,10 @@ class OreListView(ListView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['search_query'] = self.request.GET.get('search', '')
-        context['sort_by'] = self.request.GET.get('sort_by', 'name')
+        context['sort_by'] = self.request.GET.get('sort_by') or (
+            'relevance' if context['search_query'].strip() else 'name'
+        )
         context['sort_order'] = self.request.GET.get('order', 'asc')
-        
-        # Add total count
-        context['total_count'] = self.get_queryset().count()
-        
         return context
 
 
@@ -72,6 +77,9 @@ class OreDetailView(DetailView):
     Template: ores/ore_detail.html
     Context:
         - ore: Ore object instance
+        - previous_ore, next_ore: Neighbouring ores by name (CatalogRef or None)
+        - used_by_components: Components whose materials include this ore
+        - used_by_blocks: Blocks that need this ore through their components
     """
     model = Ore
     template_name = 'ores/ore_detail.html'
@@ -81,22 +89,35 @@ class OreDetailView(DetailView):
         """Add additional context for the detail view."""
         context = super().get_context_data(**kwargs)
         
-        # Add previous/next navigation
-        current_ore = self.get_object()
-        all_ores = Ore.objects.all().order_by('name')
-        ore_list = list(all_ores)
+        # Add previous/next navigation from the recipe graph's name index
+        current_ore = self.object
+        context['previous_ore'], context['next_ore'] = get_recipe_graph().neighbours(
+            'ore', current_ore.ore_id
+        )
         
-        try:
-            current_index = ore_list.index(current_ore)
-            context['previous_ore'] = ore_list[current_index - 1] if current_index > 0 else None
-            context['next_ore'] = ore_list[current_index + 1] if current_index < len(ore_list) - 1 else None
-        except (ValueError, IndexError):
-            context['previous_ore'] = None
-            context['next_ore'] = None
+        # "Used by" sections from the link-table reverse index
+        context['used_by_components'] = components_using_ore(current_ore.ore_id)
+        context['used_by_blocks'] = blocks_using_ore(current_ore.ore_id)
         
         return context
 
 
+def ore_used_by(request, pk):
+    """
+    Return the components and blocks that consume an ore as JSON.
+    
+    URL: /ores/<uuid:pk>/used-by/
+    Response:
+        {"ore": {"id", "name"}, "components": [...], "blocks": [...]}
+    """
+    ore = get_object_or_404(Ore, pk=pk)
+    return JsonResponse({
+        'ore': {'id': str(ore.ore_id), 'name': ore.name},
+        'components': components_using_ore(ore.ore_id),
+        'blocks': blocks_using_ore(ore.ore_id),
+    })
+
+
 class OreCreateView(SuccessMessageMixin, CreateView):
     """
     Create a new ore instance.
@@ -161,4 +182,13 @@ class OreDeleteView(DeleteView):
         """Override delete to add success message."""
         ore = self.get_object()
         messages.success(request, f"Ore '{ore.name}' was deleted successfully!")
-        return super().delete(request, *args, **kwargs)
\ No newline at end of file
+        return super().delete(request, *args, **kwargs)
+
+
+def ore_export(request):
+    """
+    Stream every ore as CSV or NDJSON.
+    
+    URL: /ores/export/?format=csv|ndjson
+    """
+    return export_response(request, 'ores')
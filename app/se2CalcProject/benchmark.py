@@ -0,0 +1,287 @@
+"""
+End-to-end view benchmarks with latency percentiles.
+
+``BenchmarkRunner`` requests every list, detail, create and update page of
+ores, components and blocks many times and records, per route:
+
+- latency p50/p95/p99, mean, min and max (milliseconds)
+- SQL queries per request (median and max; Django test client only)
+- response size (mean bytes) and status codes
+
+Requests go through the Django test client in-process by default, or over
+HTTP to a running server (``base_url``), which includes the WSGI server,
+nginx and network in the timings but cannot count queries.
+
+Detail and update routes pick a different row each iteration (seeded), so
+caches see a realistic spread instead of one hot key. Run against a large
+catalog (``manage.py generate_catalog --preset 10k``) for meaningful
+numbers; ``manage.py benchmark_views`` wraps this module and writes the
+JSON/Markdown reports.
+"""
+import datetime
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from typing import NamedTuple
+
+import django
+from django.conf import settings
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from blocks.models import Block
+from components.models import Component
+from ores.models import Ore
+
+
+class Route(NamedTuple):
+    """
+    One benchmarked page.
+
+    ``path`` may contain ``{pk}``, filled from ``model`` each iteration.
+    """
+    name: str
+    path: str
+    model: type = None
+
+
+ROUTES = [
+    Route('ore list', '/ores/'),
+    Route('ore list search', '/ores/?search=iron'),
+    Route('ore detail', '/ores/{pk}/', Ore),
+    Route('ore create', '/ores/create/'),
+    Route('ore update', '/ores/{pk}/update/', Ore),
+    Route('component list', '/components/'),
+    Route('component list search', '/components/?q=plate'),
+    Route('component detail', '/components/{pk}/', Component),
+    Route('component create', '/components/create/'),
+    Route('component update', '/components/{pk}/update/', Component),
+    Route('block list', '/blocks/'),
+    Route('block list search', '/blocks/?q=reactor'),
+    Route('block list by mass', '/blocks/?sort=mass&order=desc'),
+    Route('block detail', '/blocks/{pk}/', Block),
+    Route('block create', '/blocks/create/'),
+    Route('block update', '/blocks/{pk}/update/', Block),
+]
+
+# Rows sampled per model for detail/update routes
+SAMPLE_SIZE = 500
+
+
+def percentile(sorted_values, pct):
+    """Linear-interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(route, timings, queries, sizes, statuses):
+    """Aggregate one route's samples into a report row."""
+    timings = sorted(timings)
+    return {
+        'route': route.name,
+        'path': route.path,
+        'requests': len(timings),
+        'p50_ms': round(percentile(timings, 50), 2),
+        'p95_ms': round(percentile(timings, 95), 2),
+        'p99_ms': round(percentile(timings, 99), 2),
+        'mean_ms': round(statistics.fmean(timings), 2),
+        'min_ms': round(timings[0], 2),
+        'max_ms': round(timings[-1], 2),
+        'queries_median': statistics.median(queries) if queries else None,
+        'queries_max': max(queries) if queries else None,
+        'mean_bytes': round(statistics.fmean(sizes)),
+        'statuses': {str(code): count for code, count in sorted(statuses.items())},
+    }
+
+
+class BenchmarkRunner:
+    """
+    Run ``routes`` ``iterations`` times each and collect the results.
+
+    Args:
+        iterations: Measured requests per route
+        warmup: Unmeasured requests per route first (graph build, caches)
+        base_url: Benchmark a live server over HTTP instead of the test client
+        seed: Seed for picking detail/update rows
+        routes: Routes to run (default ``ROUTES``)
+    """
+
+    def __init__(self, iterations=100, warmup=5, base_url=None, seed=42, routes=None):
+        if iterations < 1:
+            raise ValueError("iterations must be at least 1")
+        self.iterations = iterations
+        self.warmup = warmup
+        self.base_url = base_url.rstrip('/') if base_url else None
+        self.rng = random.Random(seed)
+        self.routes = routes or ROUTES
+        self._samples = {}
+        if not self.base_url:
+            host = next((h for h in settings.ALLOWED_HOSTS if h not in ('*', '')), 'testserver')
+            self.client = Client(HTTP_HOST=host.lstrip('.'))
+
+    def _sample(self, model):
+        """Primary keys to spread detail/update requests over."""
+        if model not in self._samples:
+            pks = list(model.objects.values_list('pk', flat=True)[:SAMPLE_SIZE])
+            if not pks:
+                raise ValueError(f"No {model._meta.verbose_name_plural} to benchmark; "
+                                 f"run generate_catalog first")
+            self._samples[model] = [str(pk) for pk in pks]
+        return self._samples[model]
+
+    def _url(self, route):
+        if route.model is None:
+            return route.path
+        return route.path.format(pk=self.rng.choice(self._sample(route.model)))
+
+    def _request(self, url):
+        """Return (status, bytes, milliseconds, queries or None) for one GET."""
+        if self.base_url:
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(self.base_url + url) as response:
+                    body = response.read()
+                    status = response.status
+            except urllib.error.HTTPError as e:
+                body, status = e.read(), e.code
+            return status, len(body), (time.perf_counter() - start) * 1000, None
+
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            response = self.client.get(url)
+            elapsed = (time.perf_counter() - start) * 1000
+        body = b''.join(response) if response.streaming else response.content
+        return response.status_code, len(body), elapsed, len(context.captured_queries)
+
+    def run_route(self, route):
+        """Benchmark one route and return its summary row."""
+        for _ in range(self.warmup):
+            self._request(self._url(route))
+
+        timings, queries, sizes, statuses = [], [], [], {}
+        for _ in range(self.iterations):
+            status, size, elapsed, query_count = self._request(self._url(route))
+            timings.append(elapsed)
+            sizes.append(size)
+            statuses[status] = statuses.get(status, 0) + 1
+            if query_count is not None:
+                queries.append(query_count)
+        return summarize(route, timings, queries, sizes, statuses)
+
+    def run(self, progress=None):
+        """
+        Benchmark every route.
+
+        Args:
+            progress: Optional callable receiving each summary row as it completes
+
+        Returns:
+            dict: report with ``meta`` and ``results``
+        """
+        results = []
+        for route in self.routes:
+            row = self.run_route(route)
+            results.append(row)
+            if progress:
+                progress(row)
+        return {'meta': self.metadata(), 'results': results}
+
+    def metadata(self):
+        """Environment details that make two reports comparable."""
+        try:
+            commit = subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'],
+                capture_output=True, text=True, timeout=5, cwd=settings.BASE_DIR,
+            ).stdout.strip() or None
+        except (OSError, subprocess.SubprocessError):
+            commit = None
+        return {
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'commit': commit,
+            'mode': 'live' if self.base_url else 'test-client',
+            'base_url': self.base_url,
+            'iterations': self.iterations,
+            'warmup': self.warmup,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            # Anonymous list/detail requests hit the page cache unless it is 0
+            'page_cache_timeout': getattr(settings, 'PAGE_CACHE_TIMEOUT', 0),
+            'catalog': {
+                'ores': Ore.objects.count(),
+                'components': Component.objects.count(),
+                'blocks': Block.objects.count(),
+            },
+        }
+
+
+# ---- Reports ----
+
+def to_json(report):
+    return json.dumps(report, indent=2)
+
+
+def to_markdown(report, baseline=None):
+    """
+    Render a report as a Markdown table.
+
+    With a ``baseline`` report (e.g. the previous release's JSON), a column
+    shows each route's p95 change.
+    """
+    meta = report['meta']
+    catalog = meta['catalog']
+    lines = [
+        '# View benchmark',
+        '',
+        f"- Date: {meta['timestamp']}" + (f" (commit `{meta['commit']}`)" if meta['commit'] else ''),
+        f"- Mode: {meta['mode']}" + (f" ({meta['base_url']})" if meta['base_url'] else ''),
+        f"- Catalog: {catalog['ores']} ores, {catalog['components']} components, "
+        f"{catalog['blocks']} blocks on {meta['database']}",
+        f"- {meta['iterations']} requests per route after {meta['warmup']} warm-up; "
+        f"Python {meta['python']}, Django {meta['django']}",
+        '',
+    ]
+    baseline_p95 = {}
+    if baseline:
+        baseline_p95 = {row['route']: row['p95_ms'] for row in baseline['results']}
+        base_meta = baseline['meta']
+        lines[-1:-1] = [
+            f"- Baseline: {base_meta['timestamp']}"
+            + (f" (commit `{base_meta['commit']}`)" if base_meta.get('commit') else '')
+        ]
+
+    header = ['Route', 'p50 ms', 'p95 ms', 'p99 ms', 'Mean ms', 'Queries', 'KB', 'Status']
+    if baseline:
+        header.append('p95 vs baseline')
+    lines.append('| ' + ' | '.join(header) + ' |')
+    lines.append('|' + '|'.join(['---'] + ['---:'] * (len(header) - 1)) + '|')
+    for row in report['results']:
+        queries = '-' if row['queries_median'] is None else (
+            f"{row['queries_median']:g}"
+            + (f" (max {row['queries_max']})" if row['queries_max'] != row['queries_median'] else '')
+        )
+        cells = [
+            row['route'],
+            f"{row['p50_ms']:.1f}",
+            f"{row['p95_ms']:.1f}",
+            f"{row['p99_ms']:.1f}",
+            f"{row['mean_ms']:.1f}",
+            queries,
+            f"{row['mean_bytes'] / 1024:.1f}",
+            ', '.join(f'{code}×{count}' for code, count in row['statuses'].items()),
+        ]
+        if baseline:
+            before = baseline_p95.get(row['route'])
+            cells.append('new' if not before else f"{(row['p95_ms'] - before) / before:+.0%}")
+        lines.append('| ' + ' | '.join(cells) + ' |')
+    return '\n'.join(lines) + '\n'
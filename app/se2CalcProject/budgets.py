@@ -0,0 +1,224 @@
+"""
+Query-count and latency budgets for every page, as a pytest plugin.
+
+Each ``Budget`` declares, for one URL, the most SQL queries, SQL time and
+wall time a warm request may take. ``test_budgets.py`` requests every
+budgeted URL while a synthetic catalog grows through ``CATALOG_SIZES`` and
+fails when a budget is exceeded or when the query count grows with the
+catalog, which is how an N+1 regression shows up.
+
+Loaded from ``conftest.py`` (``pytest_plugins``). The plugin adds:
+
+- the ``check_budget`` fixture, which grows a synthetic catalog through
+  ``CatalogImporter`` (so link tables and search indexes are filled),
+  measures the page at each size and asserts the budget;
+- a "query budgets" table in the terminal summary, listing every
+  measurement against its budget.
+
+Time budgets are loose by design (shared CI runners are noisy); scale them
+with ``BUDGET_TIME_SCALE`` (e.g. ``BUDGET_TIME_SCALE=3`` on a slow machine).
+Query counts are exact and never scaled.
+
+The page cache (``se2CalcProject.page_cache``) is switched off while
+measuring: budgets describe the views themselves, a cached page costs none.
+
+Usage (from app/):
+    pytest se2CalcProject/test_budgets.py -q
+"""
+import io
+import json
+import os
+import time
+import uuid
+from typing import NamedTuple
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Rows per table in each synthetic catalog
+CATALOG_SIZES = (5, 60)
+
+# Multiplier for every SQL/wall time budget (query counts are never scaled)
+TIME_SCALE = float(os.environ.get('BUDGET_TIME_SCALE', '1'))
+
+
+class Budget(NamedTuple):
+    """
+    Declared maxima for one page.
+
+    ``path`` may contain ``{ore}``, ``{component}`` or ``{block}``, filled
+    with a primary key from the catalog under test.
+    """
+    name: str
+    path: str
+    max_queries: int
+    max_sql_ms: float = 100.0
+    max_wall_ms: float = 500.0
+    admin: bool = False
+
+
+class Measurement(NamedTuple):
+    """What one request actually cost."""
+    budget: Budget
+    catalog_size: int
+    status_code: int
+    queries: int
+    sql_ms: float
+    wall_ms: float
+
+    @property
+    def failures(self):
+        """Human-readable list of exceeded maxima (empty when within budget)."""
+        budget = self.budget
+        problems = []
+        if self.queries > budget.max_queries:
+            problems.append(f'{self.queries} queries > {budget.max_queries}')
+        if self.sql_ms > budget.max_sql_ms * TIME_SCALE:
+            problems.append(f'SQL {self.sql_ms:.1f}ms > {budget.max_sql_ms * TIME_SCALE:.0f}ms')
+        if self.wall_ms > budget.max_wall_ms * TIME_SCALE:
+            problems.append(f'wall {self.wall_ms:.1f}ms > {budget.max_wall_ms * TIME_SCALE:.0f}ms')
+        return problems
+
+
+def build_catalog(size, start=0):
+    """
+    Import ores, components and blocks ``start`` .. ``size - 1`` with
+    realistic fan-out.
+
+    Each component uses up to three ores and each block up to four
+    components, so any per-reference query in a view multiplies with size.
+    Call again with a larger ``size`` and the previous ``size`` as ``start``
+    to grow an existing catalog.
+
+    Returns:
+        dict: {'ore': pk, 'component': pk, 'block': pk} of the first new rows
+    """
+    from blocks.importer import CatalogImporter
+
+    count = size - start
+    ore_ids = [str(uuid.uuid4()) for _ in range(count)]
+    component_ids = [str(uuid.uuid4()) for _ in range(count)]
+    block_ids = [str(uuid.uuid4()) for _ in range(count)]
+
+    ores = [
+        {'ore_id': pk, 'name': f'Budget Ore {start + i:03d}', 'mass': 1.0 + i % 5}
+        for i, pk in enumerate(ore_ids)
+    ]
+    components = [
+        {
+            'component_id': pk,
+            'name': f'Budget Component {start + i:03d}',
+            'mass': 2.0 + i % 7,
+            'crafting_time': 1.0,
+            'fabricator_type': 'Assembler',
+            'materials': {ore_ids[(i + k) % count]: 1.0 + k for k in range(min(3, count))},
+        }
+        for i, pk in enumerate(component_ids)
+    ]
+    blocks = [
+        {
+            'block_id': pk,
+            'name': f'Budget Block {start + i:03d}',
+            'mass': 10.0 + i,
+            'health': 100.0,
+            'pcu': 1,
+            'snap_size': 0.5,
+            'components': {
+                component_ids[(i + k) % count]: 1 + k for k in range(min(4, count))
+            },
+        }
+        for i, pk in enumerate(block_ids)
+    ]
+    CatalogImporter(strict=True).run(
+        ores=io.StringIO(json.dumps(ores)),
+        components=io.StringIO(json.dumps(components)),
+        blocks=io.StringIO(json.dumps(blocks)),
+    )
+    return {'ore': ore_ids[0], 'component': component_ids[0], 'block': block_ids[0]}
+
+
+def measure(client, budget, catalog, catalog_size):
+    """
+    Request a budgeted page twice and measure the second (warm) request.
+
+    The first request pays one-off costs (recipe graph build, cached counts)
+    that every later request skips; budgets describe the steady state.
+    """
+    url = budget.path.format(**catalog)
+    client.get(url)
+    with CaptureQueriesContext(connection) as context:
+        start = time.perf_counter()
+        response = client.get(url)
+        wall_ms = (time.perf_counter() - start) * 1000
+    sql_ms = sum(float(query['time']) for query in context.captured_queries) * 1000
+    return Measurement(
+        budget, catalog_size, response.status_code,
+        len(context.captured_queries), sql_ms, wall_ms,
+    )
+
+
+# ---- pytest plugin ----
+
+_measurements_key = pytest.StashKey[list]()
+
+
+def pytest_configure(config):
+    config.stash[_measurements_key] = []
+
+
+@pytest.fixture
+def check_budget(request, db, client, settings):
+    """
+    Check a page against its budget at every size in ``CATALOG_SIZES``.
+
+    The catalog is grown between measurements, so the same rows are
+    requested each time while the tables around them get bigger. Fails if
+    any measurement is over budget or the query count grows with the catalog.
+    """
+    stash = request.config.stash[_measurements_key]
+    settings.PAGE_CACHE_TIMEOUT = 0
+
+    def check(budget):
+        if budget.admin:
+            client.force_login(request.getfixturevalue('admin_user'))
+        results = []
+        catalog, built = None, 0
+        for size in CATALOG_SIZES:
+            first_rows = build_catalog(size, start=built)
+            catalog, built = catalog or first_rows, size
+            result = measure(client, budget, catalog, size)
+            stash.append(result)
+            results.append(result)
+            assert result.status_code == 200, f'{budget.name}: HTTP {result.status_code}'
+
+        for result in results:
+            assert not result.failures, (
+                f'{budget.name} over budget with {result.catalog_size} rows: '
+                f'{"; ".join(result.failures)}'
+            )
+        counts = [result.queries for result in results]
+        assert len(set(counts)) == 1, (
+            f'{budget.name}: query count grows with the catalog '
+            f'({", ".join(f"{r.catalog_size} rows: {r.queries}" for r in results)}) - N+1?'
+        )
+        return results
+
+    return check
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    measurements = config.stash.get(_measurements_key, [])
+    if not measurements:
+        return
+    write = terminalreporter.write_line
+    terminalreporter.section('query budgets')
+    write(f"{'page':<28} {'rows':>5} {'queries':>9} {'SQL ms':>15} {'wall ms':>17}  status")
+    for m in sorted(measurements, key=lambda m: (m.budget.name, m.catalog_size)):
+        b = m.budget
+        write(
+            f'{b.name:<28} {m.catalog_size:>5} {m.queries:>4}/{b.max_queries:<4} '
+            f'{m.sql_ms:>7.1f}/{b.max_sql_ms * TIME_SCALE:<7.0f} '
+            f'{m.wall_ms:>8.1f}/{b.max_wall_ms * TIME_SCALE:<8.0f}  '
+            f"{'OVER' if m.failures else 'ok'}"
+        )
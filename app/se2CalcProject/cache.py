@@ -0,0 +1,258 @@
+"""
+Two-tier cache backend: a bounded per-process LRU (L1) in front of a shared
+cache (L2).
+
+Every gunicorn worker keeps its hottest entries in memory for a few seconds
+while the shared backend (file-based, Redis, ...) holds the authoritative copy,
+so workers no longer recompute resource chains independently.
+
+Configuration (see ``settings.CACHES``)::
+
+    'default': {
+        'BACKEND': 'se2CalcProject.cache.TieredCache',
+        'OPTIONS': {
+            'L2_ALIAS': 'shared',            # another entry in CACHES
+            'L1_MAX_ENTRIES': 1024,          # LRU capacity per process
+            'L1_TIMEOUT': 5,                 # seconds an entry may live in L1
+            'L1_BYPASS_PREFIXES': ['catalog_version'],
+        },
+    }
+
+Entries written by another process are seen at most ``L1_TIMEOUT`` seconds
+late; keys whose freshness matters across processes (e.g. the catalog
+version) should be listed in ``L1_BYPASS_PREFIXES`` and always go to L2.
+
+Hits, misses and evictions are counted per key prefix (the key up to its
+first UUID, hash or number), see ``TieredCache.stats()``. The current
+request's hits and misses also go to its ``Server-Timing`` header (see
+``se2CalcProject.profiling``).
+"""
+import pickle
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+from .profiling import record_cache
+
+# Key prefix = everything before the first UUID/hash/number, minus separators
+_PREFIX_SPLIT = re.compile(r'[0-9a-f]{8}|\d')
+
+STAT_FIELDS = ('l1_hits', 'l2_hits', 'misses', 'sets', 'deletes', 'evictions', 'expirations')
+
+
+def key_prefix(key):
+    """Return the stats bucket for a cache key, e.g. 'resource_chain'."""
+    return _PREFIX_SPLIT.split(str(key), maxsplit=1)[0].rstrip('_:-.') or str(key)
+
+
+class TieredCache(BaseCache):
+    """Per-process LRU with TTL in front of a shared Django cache alias."""
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._l2_alias = options.get('L2_ALIAS', 'shared')
+        self._l1_max_entries = int(options.get('L1_MAX_ENTRIES', 1024))
+        self._l1_timeout = float(options.get('L1_TIMEOUT', 5))
+        self._bypass_prefixes = tuple(options.get('L1_BYPASS_PREFIXES', ()))
+
+        self._l1 = OrderedDict()  # (key, version) -> (expires_at, pickled value)
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: dict.fromkeys(STAT_FIELDS, 0))
+
+    @property
+    def l2(self):
+        return caches[self._l2_alias]
+
+    # ---- L1 internals ----
+
+    def _uses_l1(self, key):
+        return self._l1_max_entries > 0 and not key.startswith(self._bypass_prefixes)
+
+    def _l1_key(self, key, version):
+        return key, self.version if version is None else version
+
+    def _count(self, key, field, amount=1):
+        with self._lock:
+            self._stats[key_prefix(key)][field] += amount
+        # Per-request totals for the Server-Timing header
+        record_cache(field, amount)
+
+    def _l1_get(self, key, version=None):
+        """Return (found, value) from L1, expiring stale entries."""
+        l1_key = self._l1_key(key, version)
+        with self._lock:
+            entry = self._l1.get(l1_key)
+            if entry is None:
+                return False, None
+            expires_at, payload = entry
+            if expires_at <= time.monotonic():
+                del self._l1[l1_key]
+                self._stats[key_prefix(key)]['expirations'] += 1
+                return False, None
+            self._l1.move_to_end(l1_key)
+        return True, pickle.loads(payload)
+
+    def _l1_set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        if not self._uses_l1(key):
+            return
+        ttl = self._l1_timeout
+        timeout = self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+        if timeout is not None:
+            if timeout <= 0:
+                self._l1_delete(key, version)
+                return
+            ttl = min(ttl, timeout)
+        # Pickled like LocMemCache, so callers cannot mutate the cached copy
+        payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        l1_key = self._l1_key(key, version)
+        with self._lock:
+            self._l1[l1_key] = (time.monotonic() + ttl, payload)
+            self._l1.move_to_end(l1_key)
+            while len(self._l1) > self._l1_max_entries:
+                (evicted, _), _ = self._l1.popitem(last=False)
+                self._stats[key_prefix(evicted)]['evictions'] += 1
+
+    def _l1_delete(self, key, version=None):
+        with self._lock:
+            self._l1.pop(self._l1_key(key, version), None)
+
+    # ---- Cache API ----
+
+    def get(self, key, default=None, version=None):
+        if self._uses_l1(key):
+            found, value = self._l1_get(key, version)
+            if found:
+                self._count(key, 'l1_hits')
+                return value
+
+        sentinel = object()
+        value = self.l2.get(key, sentinel, version=version)
+        if value is sentinel:
+            self._count(key, 'misses')
+            return default
+        self._count(key, 'l2_hits')
+        self._l1_set(key, value, version=version)
+        return value
+
+    def get_many(self, keys, version=None):
+        found = {}
+        remaining = []
+        for key in keys:
+            hit, value = self._l1_get(key, version) if self._uses_l1(key) else (False, None)
+            if hit:
+                self._count(key, 'l1_hits')
+                found[key] = value
+            else:
+                remaining.append(key)
+
+        if remaining:
+            from_l2 = self.l2.get_many(remaining, version=version)
+            for key in remaining:
+                if key in from_l2:
+                    self._count(key, 'l2_hits')
+                    self._l1_set(key, from_l2[key], version=version)
+                    found[key] = from_l2[key]
+                else:
+                    self._count(key, 'misses')
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.l2.set(key, value, timeout, version=version)
+        self._count(key, 'sets')
+        self._l1_set(key, value, timeout, version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.l2.set_many(data, timeout, version=version)
+        for key, value in data.items():
+            if key in failed:
+                self._l1_delete(key, version)
+                continue
+            self._count(key, 'sets')
+            self._l1_set(key, value, timeout, version)
+        return failed
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.l2.add(key, value, timeout, version=version)
+        if added:
+            self._count(key, 'sets')
+            self._l1_set(key, value, timeout, version)
+        else:
+            self._l1_delete(key, version)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self._l1_delete(key, version)
+        return self.l2.touch(key, timeout, version=version)
+
+    def delete(self, key, version=None):
+        self._l1_delete(key, version)
+        self._count(key, 'deletes')
+        return self.l2.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        for key in keys:
+            self._l1_delete(key, version)
+            self._count(key, 'deletes')
+        self.l2.delete_many(keys, version=version)
+
+    def has_key(self, key, version=None):
+        if self._uses_l1(key) and self._l1_get(key, version)[0]:
+            return True
+        return self.l2.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        self._l1_delete(key, version)
+        value = self.l2.incr(key, delta, version=version)
+        self._count(key, 'sets')
+        return value
+
+    def decr(self, key, delta=1, version=None):
+        return self.incr(key, -delta, version=version)
+
+    def clear(self):
+        self.clear_l1()
+        self.l2.clear()
+
+    def close(self, **kwargs):
+        self.l2.close(**kwargs)
+
+    # ---- Introspection ----
+
+    def clear_l1(self):
+        """Drop this process's L1 entries (L2 is untouched)."""
+        with self._lock:
+            self._l1.clear()
+
+    def stats(self):
+        """
+        Per-prefix counters for this process.
+
+        Returns:
+            dict: {prefix: {'l1_hits', 'l2_hits', 'misses', 'hit_rate', 'sets',
+                   'deletes', 'evictions', 'expirations'}} plus
+                  '_l1': {'entries', 'max_entries', 'timeout'}
+        """
+        with self._lock:
+            report = {prefix: dict(counters) for prefix, counters in self._stats.items()}
+            entries = len(self._l1)
+        for counters in report.values():
+            lookups = counters['l1_hits'] + counters['l2_hits'] + counters['misses']
+            hits = counters['l1_hits'] + counters['l2_hits']
+            counters['hit_rate'] = round(hits / lookups, 4) if lookups else None
+        report['_l1'] = {
+            'entries': entries,
+            'max_entries': self._l1_max_entries,
+            'timeout': self._l1_timeout,
+        }
+        return report
+
+    def reset_stats(self):
+        """Zero all counters."""
+        with self._lock:
+            self._stats.clear()
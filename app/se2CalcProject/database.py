@@ -0,0 +1,95 @@
+"""
+PostgreSQL connection reuse: settings for the pooling modes and their metrics.
+
+``DB_POOL_MODE`` (see ``settings.DATABASES``) selects how connections are
+reused:
+
+- ``none``: a new connection per request (Django's default)
+- ``persistent``: each thread keeps its connection for ``DB_CONN_MAX_AGE``
+  seconds; ``CONN_HEALTH_CHECKS`` re-validates it before reuse, so a
+  restarted database costs one failed check instead of a 500
+- ``pool``: a psycopg 3 ``ConnectionPool`` per process, sized by
+  ``DB_POOL_MIN_SIZE``/``DB_POOL_MAX_SIZE``; a request waits up to
+  ``DB_POOL_TIMEOUT`` seconds for a free connection, and connections idle
+  for ``DB_POOL_MAX_IDLE`` seconds are closed
+
+Pools and persistent connections belong to one process, so the metrics
+(``pool_stats()``, served at ``/health/db/``) describe the worker that
+answered; size ``DB_POOL_MAX_SIZE`` at least to the worker's thread count.
+"""
+POOL_MODES = ('none', 'persistent', 'pool')
+
+
+def pool_settings(mode, conn_max_age=60, min_size=2, max_size=4, timeout=10.0, max_idle=300.0):
+    """
+    ``DATABASES`` entries for a pooling mode.
+
+    Args:
+        mode: One of ``POOL_MODES``
+        conn_max_age: Seconds a persistent connection is kept
+        min_size, max_size: Connections the pool keeps open / may open
+        timeout: Seconds a request waits for a pooled connection
+        max_idle: Seconds before an idle pooled connection is closed
+
+    Returns:
+        dict: keys to merge into a database's settings
+            (``CONN_MAX_AGE``, ``CONN_HEALTH_CHECKS``, ``OPTIONS``)
+
+    Raises:
+        ValueError: for an unknown mode or an impossible pool size
+    """
+    if mode not in POOL_MODES:
+        raise ValueError(f"DB_POOL_MODE must be one of {', '.join(POOL_MODES)}, got '{mode}'")
+    if mode == 'none':
+        return {'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': False, 'OPTIONS': {}}
+    if mode == 'persistent':
+        return {'CONN_MAX_AGE': conn_max_age, 'CONN_HEALTH_CHECKS': True, 'OPTIONS': {}}
+    if not 0 <= min_size <= max_size or max_size < 1:
+        raise ValueError(f"Invalid pool size {min_size}..{max_size}")
+    # Django hands connections back to the pool after each request, so
+    # CONN_MAX_AGE must stay 0; the pool checks health itself.
+    return {
+        'CONN_MAX_AGE': 0,
+        'CONN_HEALTH_CHECKS': False,
+        'OPTIONS': {
+            'pool': {
+                'min_size': min_size,
+                'max_size': max_size,
+                'timeout': timeout,
+                'max_idle': max_idle,
+            },
+        },
+    }
+
+
+def pool_stats(alias='default'):
+    """
+    Connection reuse metrics for this process.
+
+    In ``pool`` mode this is psycopg's ``ConnectionPool.get_stats()`` (size,
+    available connections, waiting requests, wait time, errors, ...) plus
+    ``in_use`` and ``saturation`` (in-use connections / ``max_size``).
+    Otherwise it reports whether this thread holds an open connection.
+    """
+    from django.conf import settings
+    from django.db import connections
+
+    connection = connections[alias]
+    stats = {
+        'vendor': connection.vendor,
+        # Pooling settings only apply to PostgreSQL
+        'mode': getattr(settings, 'DB_POOL_MODE', 'none') if connection.vendor == 'postgresql' else 'none',
+        'conn_max_age': connection.settings_dict.get('CONN_MAX_AGE'),
+        'health_checks': connection.settings_dict.get('CONN_HEALTH_CHECKS'),
+    }
+    pool = getattr(connection, 'pool', None)
+    if pool is None:
+        stats['connected'] = connection.connection is not None
+        return stats
+
+    pool_stats = pool.get_stats()
+    in_use = pool_stats.get('pool_size', 0) - pool_stats.get('pool_available', 0)
+    stats.update(pool_stats)
+    stats['in_use'] = in_use
+    stats['saturation'] = round(in_use / pool.max_size, 3) if pool.max_size else None
+    return stats
@@ -0,0 +1,98 @@
+"""
+Gunicorn configuration for the production server mode.
+
+Used by ``docker-entrypoint.sh`` when ``SERVER_MODE=production``::
+
+    gunicorn -c python:se2CalcProject.gunicorn_conf se2CalcProject.wsgi:application
+
+- The app is preloaded in the master, warmed up (``se2CalcProject.warmup``)
+  and then forked, so workers share the compiled catalog copy-on-write.
+  Database connections are closed before forking; each worker warms up
+  again (database reachable, catalog current) before it accepts connections.
+- Workers default to ``2 * CPUs + 1`` and threads to 2 (gthread workers);
+  override with ``WEB_CONCURRENCY`` and ``GUNICORN_THREADS``. CPUs are the
+  ones this process may run on, so container CPU sets are respected.
+- ``kill -HUP <master>`` restarts workers gracefully with the new config.
+  Preloaded code is not re-imported by HUP; restart the container (or send
+  ``USR2`` then ``QUIT`` to the old master) to deploy new code.
+- Keep-alive outlasts nginx's upstream ``keepalive_timeout`` so nginx, not
+  gunicorn, closes idle upstream connections.
+"""
+import os
+
+
+def cpu_count():
+    """CPUs available to this process (respects container CPU sets)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def default_workers(cpus):
+    return 2 * cpus + 1
+
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('WEB_CONCURRENCY') or default_workers(cpu_count()))
+threads = int(os.getenv('GUNICORN_THREADS', '2'))
+worker_class = 'gthread' if threads > 1 else 'sync'
+preload_app = True
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+# Seconds an idle connection is kept open; above nginx's 60s keepalive_timeout
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '75'))
+
+# Recycle workers now and then so slow leaks cannot build up; jitter keeps
+# them from all restarting at once
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '5000'))
+max_requests_jitter = max_requests // 10
+
+accesslog = None
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+# Peers whose X-Forwarded-* headers are trusted: local only by default, so a
+# client reaching the port directly cannot spoof its scheme or address. Set
+# the proxy's address (or '*' when only the proxy can reach gunicorn).
+forwarded_allow_ips = os.getenv('FORWARDED_ALLOW_IPS', '127.0.0.1,::1')
+
+
+def when_ready(server):
+    """Warm up in the master so forked workers inherit the compiled catalog."""
+    from django.conf import settings
+    from django.db import connections
+    from se2CalcProject.warmup import warm_up
+
+    if workers > 1 and settings.CACHE_BACKEND == 'locmem':
+        server.log.warning(
+            "CACHE_BACKEND=locmem is per worker: catalog writes reach the other "
+            f"workers after up to {settings.CATALOG_VERSION_TIMEOUT}s; use file or redis"
+        )
+
+    try:
+        server.log.info(f"Master warm-up: {warm_up()}")
+    except Exception as e:
+        # e.g. the database is not migrated yet; workers warm up on their own
+        server.log.warning(f"Master warm-up failed: {e}")
+    finally:
+        # A connection (or a connection pool and its threads) must never be
+        # shared across fork; each worker creates its own pool
+        connections.close_all()
+        for connection in connections.all():
+            if hasattr(connection, 'close_pool'):
+                connection.close_pool()
+
+
+def post_worker_init(worker):
+    """Check the database and shared cache and refresh the catalog before serving."""
+    from django.db import connections
+    from se2CalcProject.warmup import warm_up
+
+    try:
+        worker.log.info(f"Worker {worker.pid} warm-up: {warm_up()}")
+    except Exception as e:
+        worker.log.warning(f"Worker {worker.pid} warm-up failed: {e}")
+    finally:
+        # Requests run on gthread threads with their own connections
+        connections.close_all()
@@ -0,0 +1,200 @@
+"""
+Full-page cache and conditional GETs for the catalog pages.
+
+The Ore/Component/Block list and detail pages only depend on the catalog and
+the query string, and are read far more often than the catalog is written.
+``cache_anonymous_page`` wraps such a view: a cached page is returned before
+the view runs, so a hit costs two cache reads (catalog version, page) and no
+ORM queries or template rendering.
+
+Pages are keyed on::
+
+    page_<catalog version>_<md5 of path + normalized query string>
+
+so any catalog write (see ``blocks.catalog_version``) retires every cached
+page at once. The normalized query string keeps only the parameters the
+views read (``PAGE_CACHE_QUERY_PARAMS``), drops blank values and sorts them,
+so ``?order=asc&q=x`` and ``?q=x&order=asc&utm_source=...`` share one entry.
+
+A request bypasses the cache (neither read nor stored) when:
+
+- it is not a GET, or the user is logged in;
+- the session has pending messages (``messages`` framework), which the page
+  must display once;
+- ``PAGE_CACHE_TIMEOUT`` is 0.
+
+Only complete ``200`` responses without cookies or ``Cache-Control: private``
+/ ``no-store`` are stored, and only from requests without unknown parameters
+(list links carry the request's query string). Pages are stored right after
+rendering, before the session and CSRF middleware add their cookies, so a
+render that used a CSRF token or changed the session is never stored: its
+response will carry a per-visitor cookie or token. Responses say
+``X-Page-Cache: hit`` or ``miss``.
+
+``conditional_catalog_view`` adds HTTP validators on top, for browsers and
+polling clients: a strong ``ETag`` from the catalog version and
+``Last-Modified`` from the time of the last catalog write. A matching
+``If-None-Match`` (or, without one, ``If-Modified-Since``) is answered with
+``304 Not Modified`` before the view or the page cache runs. Responses carry
+``Cache-Control: no-cache`` so clients revalidate instead of guessing a
+freshness lifetime from ``Last-Modified``. Requests with pending messages get
+neither validators nor a 304, as that page is shown only once.
+"""
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import has_vary_header, patch_cache_control
+from django.views.decorators.http import condition
+
+PAGE_CACHE_KEY_PREFIX = 'page'
+
+# GET parameters read by the list views (search, sorting, pagination)
+DEFAULT_QUERY_PARAMS = ('q', 'search', 'sort', 'sort_by', 'order', 'sort_order', 'page', 'cursor')
+
+# Headers worth replaying on a hit; the rest are added by middleware again
+STORED_HEADERS = ('Content-Type', 'Content-Language', 'Vary')
+
+
+def normalized_query_string(query_dict, params=DEFAULT_QUERY_PARAMS):
+    """
+    Return the cache-relevant part of a query string in canonical form.
+
+    Args:
+        query_dict: ``request.GET``
+        params: Parameter names that change the page
+
+    Returns:
+        tuple: (normalized query string, whether unknown parameters were dropped)
+    """
+    pairs = []
+    for name in sorted(set(query_dict) & set(params)):
+        pairs.extend((name, value) for value in query_dict.getlist(name) if value != '')
+    dropped = any(name not in params for name in query_dict)
+    return '&'.join(f'{name}={value}' for name, value in pairs), dropped
+
+
+def page_cache_key(path, query_string, version):
+    """Cache key of a page under a catalog version."""
+    digest = hashlib.md5(f'{path}?{query_string}'.encode()).hexdigest()
+    return f'{PAGE_CACHE_KEY_PREFIX}_{version}_{digest}'
+
+
+def _has_pending_messages(request):
+    # Loading the pending messages does not mark them as read
+    return bool(len(get_messages(request)))
+
+
+def _cacheable_request(request):
+    if request.method != 'GET':
+        return False
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return False
+    return not _has_pending_messages(request)
+
+
+def _sets_visitor_cookies(request):
+    """Whether the session or CSRF middleware will add a cookie to this response."""
+    if request.META.get('CSRF_COOKIE_NEEDS_UPDATE'):
+        return True
+    session = getattr(request, 'session', None)
+    if session is None:
+        return False
+    return session.modified or (settings.SESSION_SAVE_EVERY_REQUEST and not session.is_empty())
+
+
+def _cacheable_response(request, response):
+    if response.status_code != 200 or response.streaming or response.cookies:
+        return False
+    if _sets_visitor_cookies(request):
+        return False
+    cache_control = response.get('Cache-Control', '')
+    if 'private' in cache_control or 'no-store' in cache_control:
+        return False
+    # A page that varies on the session would differ per visitor
+    return not has_vary_header(response, 'Cookie')
+
+
+def cache_anonymous_page(view):
+    """
+    Serve ``view`` from the page cache for anonymous GET requests.
+
+    See the module docstring for the key and the bypass rules.
+    """
+    from blocks.catalog_version import get_catalog_version
+
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        timeout = getattr(settings, 'PAGE_CACHE_TIMEOUT', 0)
+        if not timeout or not _cacheable_request(request):
+            return view(request, *args, **kwargs)
+
+        params = getattr(settings, 'PAGE_CACHE_QUERY_PARAMS', DEFAULT_QUERY_PARAMS)
+        query_string, dropped = normalized_query_string(request.GET, params)
+        key = page_cache_key(request.path, query_string, get_catalog_version())
+
+        cached = cache.get(key)
+        if cached is not None:
+            content, headers = cached
+            response = HttpResponse(content, headers=headers)
+            response['X-Page-Cache'] = 'hit'
+            return response
+
+        response = view(request, *args, **kwargs)
+        response['X-Page-Cache'] = 'miss'
+        if dropped:
+            return response
+
+        def store(response):
+            if _cacheable_response(request, response):
+                headers = {name: response[name] for name in STORED_HEADERS if response.has_header(name)}
+                cache.set(key, (response.content, headers), timeout)
+
+        if hasattr(response, 'render') and callable(response.render) and not response.is_rendered:
+            response.add_post_render_callback(store)
+        else:
+            store(response)
+        return response
+
+    return wrapped
+
+
+def catalog_etag(request, *args, **kwargs):
+    """Strong ETag of a catalog page: the catalog version it was rendered from."""
+    from blocks.catalog_version import get_catalog_version
+
+    if _has_pending_messages(request):
+        return None
+    return f'"catalog-{get_catalog_version()}"'
+
+
+def catalog_last_modified(request, *args, **kwargs):
+    """``Last-Modified`` of a catalog page: the last catalog write."""
+    from blocks.catalog_version import get_catalog_last_modified
+
+    if _has_pending_messages(request):
+        return None
+    return get_catalog_last_modified()
+
+
+def conditional_catalog_view(view):
+    """
+    Answer conditional GETs of a catalog-only view from the catalog version.
+
+    Only for views whose output depends on nothing but the catalog and the
+    URL; see the module docstring.
+    """
+    conditional = condition(etag_func=catalog_etag, last_modified_func=catalog_last_modified)(view)
+
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        response = conditional(request, *args, **kwargs)
+        if response.has_header('ETag'):
+            patch_cache_control(response, no_cache=True)
+        return response
+
+    return wrapped
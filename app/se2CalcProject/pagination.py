@@ -0,0 +1,262 @@
+"""
+Keyset (cursor) pagination for the catalog list views.
+
+Pages are fetched with ``WHERE (sort_field, pk) > (last value, last pk)``
+instead of ``OFFSET``, so page 500 costs the same as page 1 and no page
+needs a ``COUNT(*)``. Cursors are opaque URL-safe tokens; ``?page=N`` links
+keep working (via ``OFFSET``) and switch to cursors from the first page they
+render.
+
+Totals are optional and approximate (see ``approximate_count``): the
+``paginator.count`` attribute is only computed when a template asks for it.
+"""
+import base64
+import datetime
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models import Q
+from django.http import Http404
+from django.utils.functional import cached_property
+
+# Exact counts are cached this long (seconds); stale totals are acceptable
+COUNT_CACHE_TIMEOUT = 60
+
+# Below this many rows the PostgreSQL planner estimate is not worth trusting
+ESTIMATE_MIN_ROWS = 10000
+
+FORWARD = 'n'
+BACKWARD = 'p'
+
+
+def approximate_count(queryset, timeout=COUNT_CACHE_TIMEOUT):
+    """
+    Row count for a queryset, allowed to be slightly stale.
+
+    Unfiltered tables on PostgreSQL use the planner's ``reltuples``
+    estimate once the table is large; everything else is an exact
+    ``COUNT(*)`` cached for ``timeout`` seconds. The cache key includes the
+    catalog version, so a catalog write is reflected on the next request.
+    """
+    from blocks.catalog_version import get_catalog_version
+
+    queryset = queryset.order_by()
+    try:
+        sql = str(queryset.query)
+    except EmptyResultSet:
+        # ``.none()`` (e.g. a search with no usable terms) has no SQL at all
+        return 0
+    connection = connections[queryset.db]
+    if connection.vendor == 'postgresql' and not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        if row and row[0] >= ESTIMATE_MIN_ROWS:
+            return row[0]
+
+    key = f"list_count:{get_catalog_version()}:{hashlib.md5(sql.encode()).hexdigest()}"
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout)
+    return count
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+class KeysetPage:
+    """One page of rows; mirrors the parts of ``django.core.paginator.Page`` templates use."""
+
+    def __init__(self, object_list, paginator, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f'<KeysetPage of {len(self.object_list)} rows>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset ordered by ``(sort_field, pk)``.
+
+    The sort field is taken from the queryset's first ``order_by`` term
+    (``'-mass'`` → mass, descending); the primary key breaks ties so every
+    row has a unique position.
+    """
+
+    def __init__(self, queryset, per_page):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+
+        ordering = queryset.query.order_by
+        term = ordering[0] if ordering else 'pk'
+        self.descending = term.startswith('-')
+        self.sort_field = term.lstrip('-')
+        if self.sort_field == 'pk':
+            self.sort_field = queryset.model._meta.pk.name
+
+    @cached_property
+    def count(self):
+        """Approximate number of rows (see ``approximate_count``)."""
+        return approximate_count(self.queryset)
+
+    @property
+    def last_cursor(self):
+        """Cursor for the final page (read backwards from the end)."""
+        return self._encode(BACKWARD, None)
+
+    # ---- Cursors ----
+
+    def _encode(self, direction, row):
+        key = None if row is None else [
+            _encode_value(getattr(row, self.sort_field)), str(row.pk),
+        ]
+        payload = json.dumps([direction, key], separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+    def _decode(self, cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            direction, key = json.loads(base64.urlsafe_b64decode(padded))
+            if direction not in (FORWARD, BACKWARD):
+                raise ValueError(direction)
+            if key is None:
+                return direction, None
+            opts = self.queryset.model._meta
+            value = self._sort_output_field().to_python(key[0])
+            pk = opts.pk.to_python(key[1])
+            return direction, (value, pk)
+        except Exception:
+            raise Http404("Invalid cursor")
+
+    def _sort_output_field(self):
+        """Model field or annotation (e.g. ``search_rank``) the pages are keyed on."""
+        annotation = self.queryset.query.annotations.get(self.sort_field)
+        if annotation is not None:
+            return annotation.output_field
+        return self.queryset.model._meta.get_field(self.sort_field)
+
+    # ---- Pages ----
+
+    def _ordered(self, backwards):
+        descending = self.descending != backwards
+        sign = '-' if descending else ''
+        return self.queryset.order_by(f'{sign}{self.sort_field}', f'{sign}pk'), descending
+
+    def _fetch(self, key, backwards):
+        queryset, descending = self._ordered(backwards)
+        if key is not None:
+            value, pk = key
+            op = 'lt' if descending else 'gt'
+            queryset = queryset.filter(
+                Q(**{f'{self.sort_field}__{op}': value})
+                | Q(**{self.sort_field: value, f'pk__{op}': pk})
+            )
+        rows = list(queryset[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if backwards:
+            rows.reverse()
+        return rows, has_more
+
+    def _page(self, rows, has_next, has_previous):
+        return KeysetPage(
+            rows,
+            self,
+            next_cursor=self._encode(FORWARD, rows[-1]) if has_next and rows else None,
+            previous_cursor=self._encode(BACKWARD, rows[0]) if has_previous and rows else None,
+        )
+
+    def page(self, cursor=None):
+        """Return the page after/before ``cursor``, or the first page."""
+        if not cursor:
+            rows, has_next = self._fetch(None, backwards=False)
+            return self._page(rows, has_next, has_previous=False)
+
+        direction, key = self._decode(cursor)
+        if direction == BACKWARD:
+            rows, has_previous = self._fetch(key, backwards=True)
+            return self._page(rows, has_next=key is not None, has_previous=has_previous)
+        rows, has_next = self._fetch(key, backwards=False)
+        return self._page(rows, has_next, has_previous=True)
+
+    def page_number(self, number):
+        """Legacy ``?page=N`` access via OFFSET; links from it use cursors."""
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise Http404("Invalid page")
+        if number < 1:
+            raise Http404("Invalid page")
+        queryset, _ = self._ordered(backwards=False)
+        offset = (number - 1) * self.per_page
+        rows = list(queryset[offset:offset + self.per_page + 1])
+        has_next = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if not rows and number > 1:
+            raise Http404("Invalid page")
+        return self._page(rows, has_next, has_previous=number > 1)
+
+
+class KeysetPaginationMixin:
+    """
+    ``ListView`` mixin swapping the OFFSET paginator for ``KeysetPaginator``.
+
+    Query Parameters:
+    - cursor: Opaque cursor from a previous page's links
+    - page: Legacy page number (still honoured)
+
+    Context adds ``query_string`` (the request's GET parameters without
+    cursor/page) for building pagination links.
+    """
+    cursor_param = 'cursor'
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(queryset, page_size)
+        cursor = self.request.GET.get(self.cursor_param)
+        page_number = self.request.GET.get(self.page_kwarg)
+        if cursor or not page_number:
+            page = paginator.page(cursor)
+        else:
+            page = paginator.page_number(page_number)
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        query_params = self.request.GET.copy()
+        for param in (self.cursor_param, self.page_kwarg):
+            query_params.pop(param, None)
+        context['query_string'] = query_params.urlencode()
+        return context
@@ -0,0 +1,184 @@
+"""
+Per-request profiling exposed as ``Server-Timing`` headers.
+
+``ProfilingMiddleware`` (first in ``MIDDLEWARE``) records, for every request:
+
+- ``total``: wall time from the middleware until the response is rendered
+- ``db``: SQL query count and time, via ``connection.execute_wrapper`` (works
+  with ``DEBUG = False``)
+- ``cache``: L1/L2 hits and misses, reported by ``TieredCache``
+- ``tpl``: template rendering of ``TemplateResponse`` views
+- any named section timed with ``timer()``, e.g. ``chain`` for the block
+  resource chain
+
+and adds them as a ``Server-Timing`` header, which browser devtools show in
+the network timing tab and nginx can log (``$upstream_http_server_timing``).
+Optionally a sample of requests, and every request slower than a threshold,
+is also logged as one JSON line on the ``se2CalcProject.profiling`` logger.
+
+Settings (environment variables of the same name):
+
+- ``SERVER_TIMING``: add the header (default false: it exposes query counts
+  and timings to every client, so enable it for benchmarking or debugging)
+- ``PROFILING_LOG_SAMPLE_RATE``: fraction of requests to log, 0..1 (default 0)
+- ``PROFILING_LOG_SLOW_MS``: always log requests slower than this (0 = off)
+
+Streaming responses are timed until their headers are ready, not until the
+last byte is sent.
+"""
+import contextvars
+import json
+import logging
+import random
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_current = contextvars.ContextVar('request_profile', default=None)
+
+CACHE_FIELDS = ('l1_hits', 'l2_hits', 'misses')
+
+
+class RequestProfile:
+    """Counters and section timings for one request."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.total_ms = None
+        self.queries = 0
+        self.sql_ms = 0.0
+        self.cache = dict.fromkeys(CACHE_FIELDS, 0)
+        self.sections = defaultdict(float)
+
+    def add_section(self, name, milliseconds):
+        self.sections[name] += milliseconds
+
+    def record_query(self, execute, sql, params, many, context):
+        """``execute_wrapper`` hook: time every query on every connection."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.sql_ms += (time.perf_counter() - start) * 1000
+
+    def finish(self):
+        self.total_ms = (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self):
+        """Render the ``Server-Timing`` header value."""
+        cache = self.cache
+        metrics = [
+            f'total;dur={self.total_ms:.1f}',
+            f'db;dur={self.sql_ms:.1f};desc="{self.queries} queries"',
+            # No commas inside desc: many parsers split the header on them
+            f'cache;desc="{cache["l1_hits"]} L1 hits / {cache["l2_hits"]} L2 hits / '
+            f'{cache["misses"]} misses"',
+        ]
+        metrics.extend(f'{name};dur={ms:.1f}' for name, ms in self.sections.items())
+        return ', '.join(metrics)
+
+    def as_dict(self):
+        return {
+            'total_ms': round(self.total_ms, 2),
+            'queries': self.queries,
+            'sql_ms': round(self.sql_ms, 2),
+            'cache': dict(self.cache),
+            **{f'{name}_ms': round(ms, 2) for name, ms in self.sections.items()},
+        }
+
+
+def current_profile():
+    """Return the active request's profile, or None outside a profiled request."""
+    return _current.get()
+
+
+def record_cache(field, amount=1):
+    """Count a cache hit/miss (one of ``CACHE_FIELDS``) against the active request."""
+    profile = _current.get()
+    if profile is not None and field in profile.cache:
+        profile.cache[field] += amount
+
+
+@contextmanager
+def timer(name):
+    """
+    Time a block as the ``name`` Server-Timing metric.
+
+    No-op outside a profiled request. Nested or repeated sections with the
+    same name are summed.
+    """
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_section(name, (time.perf_counter() - start) * 1000)
+
+
+class ProfilingMiddleware:
+    """
+    Profile each request and report it in ``Server-Timing`` and the sampled log.
+
+    Put it first in ``MIDDLEWARE`` so the other middleware is included in
+    ``total`` and template rendering starts right after its
+    ``process_template_response``.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.header = getattr(settings, 'SERVER_TIMING', False)
+        self.sample_rate = getattr(settings, 'PROFILING_LOG_SAMPLE_RATE', 0)
+        self.slow_ms = getattr(settings, 'PROFILING_LOG_SLOW_MS', 0)
+        if not (self.header or self.sample_rate or self.slow_ms):
+            raise MiddlewareNotUsed
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        token = _current.set(profile)
+        try:
+            with ExitStack() as stack:
+                # Wrapping does not open a connection; it only hooks the
+                # next queries on each alias.
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(profile.record_query))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        profile.finish()
+        if self.header:
+            response['Server-Timing'] = profile.server_timing()
+        if self._should_log(profile):
+            logger.info(json.dumps({
+                'method': request.method,
+                'path': request.path,
+                'status': response.status_code,
+                **profile.as_dict(),
+            }))
+        return response
+
+    def process_template_response(self, request, response):
+        profile = _current.get()
+        if profile is not None:
+            started = time.perf_counter()
+
+            def rendered(response):
+                profile.add_section('tpl', (time.perf_counter() - started) * 1000)
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    def _should_log(self, profile):
+        if self.slow_ms and profile.total_ms >= self.slow_ms:
+            return True
+        return bool(self.sample_rate) and random.random() < self.sample_rate
@@ -15,6 +15,8 @@ from dotenv import load_dotenv
 from pathlib import Path
 from django.core.management.utils import get_random_secret_key
 
+from se2CalcProject.database import pool_settings
+
 load_dotenv()
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -45,6 +47,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so its timings cover the rest of the stack (se2CalcProject.profiling)
+    'se2CalcProject.profiling.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -52,6 +56,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'blocks.middleware.CatalogIdentityMapMiddleware',
 ]
 
 ROOT_URLCONF = 'se2CalcProject.urls'
@@ -75,6 +80,8 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'se2CalcProject.wsgi.application'
 
+DB_POOL_MODE = os.getenv('DB_POOL_MODE', 'persistent').lower()
+
 if os.getenv('DB_NAME'):
     DATABASES = {
         'default': {
@@ -86,6 +93,18 @@ if os.getenv('DB_NAME'):
             'PORT': os.getenv('DB_PORT', '5432'),
         }
     }
+    # Connection reuse (se2CalcProject.database): none, persistent or pool.
+    # 'pool' needs psycopg 3 with psycopg_pool.
+    DATABASES['default'].update(pool_settings(
+        DB_POOL_MODE,
+        conn_max_age=int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        min_size=int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+        max_size=int(os.getenv('DB_POOL_MAX_SIZE', '4')),
+        timeout=float(os.getenv('DB_POOL_TIMEOUT', '10')),
+        max_idle=float(os.getenv('DB_POOL_MAX_IDLE', '300')),
+    ))
+    # Full-text/trigram lookups used by blocks.search
+    INSTALLED_APPS.append('django.contrib.postgres')
 else:
     DATABASES = {
         'default': {
@@ -94,6 +113,76 @@ else:
         }
     }
 
+# Caching: per-process L1 (se2CalcProject.cache.TieredCache) in front of a
+# shared L2 so gunicorn workers reuse each other's resource chains.
+# CACHE_BACKEND selects the L2: locmem (default, single process), file or redis.
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'locmem').lower()
+CACHE_L2_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+}
+if CACHE_BACKEND not in CACHE_L2_BACKENDS:
+    raise ValueError(f"CACHE_BACKEND must be one of {', '.join(CACHE_L2_BACKENDS)}, got '{CACHE_BACKEND}'")
+CACHE_LOCATION = os.getenv('CACHE_LOCATION') or {
+    'locmem': 'se2calc-shared',
+    'file': str(BASE_DIR / '.cache'),
+    'redis': 'redis://localhost:6379/1',
+}[CACHE_BACKEND]
+
+CACHES = {
+    'default': {
+        'BACKEND': 'se2CalcProject.cache.TieredCache',
+        'OPTIONS': {
+            'L2_ALIAS': 'shared',
+            'L1_MAX_ENTRIES': int(os.getenv('CACHE_L1_MAX_ENTRIES', '1024')),
+            'L1_TIMEOUT': float(os.getenv('CACHE_L1_TIMEOUT', '5')),
+            # Must be seen by every worker immediately
+            'L1_BYPASS_PREFIXES': ['catalog_version'],
+        },
+    },
+    'shared': {
+        'BACKEND': CACHE_L2_BACKENDS[CACHE_BACKEND],
+        'LOCATION': CACHE_LOCATION,
+        'KEY_PREFIX': os.getenv('CACHE_KEY_PREFIX', 'se2calc'),
+    },
+}
+if CACHE_BACKEND != 'redis':
+    CACHES['shared']['OPTIONS'] = {'MAX_ENTRIES': int(os.getenv('CACHE_MAX_ENTRIES', '10000'))}
+
+# Seconds a process trusts its cached catalog version (blocks.catalog_version).
+# A locmem L2 lives in one process, so other gunicorn workers only see a write
+# once their copy expires; shared backends are updated by the writer itself.
+CATALOG_VERSION_TIMEOUT = (
+    float(os.getenv('CATALOG_VERSION_TIMEOUT', '5')) if CACHE_BACKEND == 'locmem' else None
+)
+
+# Full-page cache for anonymous GETs of the catalog list/detail pages
+# (se2CalcProject.page_cache); keyed on the catalog version. 0 disables it.
+PAGE_CACHE_TIMEOUT = int(os.getenv('PAGE_CACHE_TIMEOUT', '600'))
+
+# Request profiling (se2CalcProject.profiling): optional Server-Timing header
+# (off by default, every client can read it), plus one JSON log line for a
+# sample of requests and for slow ones.
+SERVER_TIMING = os.getenv('SERVER_TIMING', 'false').lower() == 'true'
+PROFILING_LOG_SAMPLE_RATE = float(os.getenv('PROFILING_LOG_SAMPLE_RATE', '0'))
+PROFILING_LOG_SLOW_MS = float(os.getenv('PROFILING_LOG_SLOW_MS', '0'))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'se2CalcProject.profiling': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
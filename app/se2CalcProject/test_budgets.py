@@ -0,0 +1,51 @@
+"""
+Query-count and latency budgets for every catalog page and admin screen.
+
+Budgets are checked while the catalog grows (see ``se2CalcProject.budgets``);
+the terminal summary prints the measured table. Query counts are for a warm
+request from a logged-in client (admin pages) or an anonymous one.
+"""
+import pytest
+
+from se2CalcProject.budgets import Budget
+
+BUDGETS = [
+    # Ores
+    Budget('ore list', '/ores/', 1),
+    Budget('ore list search', '/ores/?search=budget', 2),
+    Budget('ore detail', '/ores/{ore}/', 3),
+    Budget('ore create', '/ores/create/', 0),
+    Budget('ore update', '/ores/{ore}/update/', 1),
+    Budget('ore delete', '/ores/{ore}/delete/', 1),
+    Budget('ore used by', '/ores/{ore}/used-by/', 3),
+    # Components
+    Budget('component list', '/components/', 1),
+    Budget('component list search', '/components/?q=budget', 2),
+    Budget('component detail', '/components/{component}/', 3),
+    Budget('component create', '/components/create/', 0),
+    Budget('component update', '/components/{component}/update/', 1),
+    Budget('component delete', '/components/{component}/delete/', 2),
+    Budget('component used by', '/components/{component}/used-by/', 2),
+    # Blocks
+    Budget('block list', '/blocks/', 1),
+    Budget('block list search', '/blocks/?q=budget', 2),
+    Budget('block detail', '/blocks/{block}/', 1),
+    Budget('block create', '/blocks/create/', 0),
+    Budget('block update', '/blocks/{block}/update/', 1),
+    Budget('block delete', '/blocks/{block}/delete/', 1),
+    Budget('autocomplete', '/blocks/api/autocomplete/?kind=component&q=budget', 0),
+    # Admin
+    Budget('admin ore list', '/admin/ores/ore/', 5, admin=True),
+    Budget('admin ore change', '/admin/ores/ore/{ore}/change/', 3, admin=True),
+    Budget('admin component list', '/admin/components/component/', 6, admin=True),
+    Budget('admin component change', '/admin/components/component/{component}/change/', 4,
+           admin=True),
+    Budget('admin block list', '/admin/blocks/block/', 7, admin=True),
+    Budget('admin block change', '/admin/blocks/block/{block}/change/', 4, admin=True),
+    Budget('admin build order list', '/admin/blocks/buildorder/', 5, admin=True),
+]
+
+
+@pytest.mark.parametrize('budget', BUDGETS, ids=[budget.name for budget in BUDGETS])
+def test_page_within_budget(check_budget, budget):
+    check_budget(budget)
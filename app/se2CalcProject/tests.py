@@ -0,0 +1,557 @@
+"""
+Tests for the project-level two-tier cache backend, cache stats endpoint,
+keyset pagination, the view benchmark runner, request profiling, the
+production server configuration and database connection reuse.
+"""
+import importlib
+import io
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.backends.cache import SessionStore
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.http import QueryDict
+from django.template import engines
+from django.template.response import TemplateResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from blocks.models import Block
+from blocks.recipe_graph import load_recipe_graph
+from ores.models import Ore
+from se2CalcProject import gunicorn_conf
+from se2CalcProject.benchmark import ROUTES, BenchmarkRunner, percentile, to_markdown
+from se2CalcProject.cache import TieredCache, key_prefix
+from se2CalcProject.database import pool_settings
+from se2CalcProject.page_cache import cache_anonymous_page, normalized_query_string
+from se2CalcProject.pagination import KeysetPaginator, approximate_count
+from se2CalcProject.profiling import current_profile, timer
+from se2CalcProject.warmup import warm_up
+
+
+def make_cache(**options):
+    options.setdefault('L2_ALIAS', 'shared')
+    return TieredCache(None, {'OPTIONS': options})
+
+
+class KeyPrefixTest(SimpleTestCase):
+
+    def test_strips_uuid_suffix(self):
+        self.assertEqual(
+            key_prefix('resource_chain_0f8fad5b-d9cb-469f-a165-70867728950e'),
+            'resource_chain',
+        )
+
+    def test_strips_numeric_suffix(self):
+        self.assertEqual(key_prefix('page:3'), 'page')
+
+    def test_plain_key_is_its_own_prefix(self):
+        self.assertEqual(key_prefix('catalog_version'), 'catalog_version')
+
+
+class TieredCacheTest(SimpleTestCase):
+
+    def setUp(self):
+        caches['shared'].clear()
+        self.cache = make_cache(L1_MAX_ENTRIES=2, L1_TIMEOUT=5,
+                                L1_BYPASS_PREFIXES=['catalog_version'])
+
+    def test_l1_then_l2_then_miss(self):
+        self.cache.set('chain_1', {'ores': 1})
+        self.assertEqual(self.cache.get('chain_1'), {'ores': 1})
+
+        self.cache.clear_l1()
+        self.assertEqual(self.cache.get('chain_1'), {'ores': 1})
+        self.assertIsNone(self.cache.get('chain_2'))
+
+        stats = self.cache.stats()['chain']
+        self.assertEqual((stats['l1_hits'], stats['l2_hits'], stats['misses']), (1, 1, 1))
+        self.assertEqual(stats['hit_rate'], round(2 / 3, 4))
+
+    def test_writes_are_visible_to_other_processes_through_l2(self):
+        other_worker = make_cache()
+        self.cache.set('chain_1', 'shared value')
+        self.assertEqual(other_worker.get('chain_1'), 'shared value')
+        self.assertEqual(other_worker.stats()['chain']['l2_hits'], 1)
+
+    def test_lru_eviction_is_counted(self):
+        self.cache.set('chain_1', 1)
+        self.cache.set('chain_2', 2)
+        self.cache.get('chain_1')  # chain_2 is now least recently used
+        self.cache.set('chain_3', 3)
+
+        self.assertEqual(self.cache.stats()['chain']['evictions'], 1)
+        self.assertEqual(self.cache.stats()['_l1']['entries'], 2)
+        self.assertEqual(self.cache.get('chain_2'), 2)
+        self.assertEqual(self.cache.stats()['chain']['l2_hits'], 1)
+
+    def test_l1_entries_expire(self):
+        with mock.patch('se2CalcProject.cache.time.monotonic', return_value=100.0):
+            self.cache.set('chain_1', 1)
+        with mock.patch('se2CalcProject.cache.time.monotonic', return_value=106.0):
+            self.assertEqual(self.cache.get('chain_1'), 1)
+
+        stats = self.cache.stats()['chain']
+        self.assertEqual((stats['expirations'], stats['l2_hits']), (1, 1))
+
+    def test_bypass_prefix_always_reads_l2(self):
+        other_worker = make_cache(L1_BYPASS_PREFIXES=['catalog_version'])
+        self.cache.set('catalog_version', 1)
+        other_worker.get('catalog_version')
+        self.cache.incr('catalog_version')
+
+        self.assertEqual(other_worker.get('catalog_version'), 2)
+        self.assertEqual(self.cache.stats()['_l1']['entries'], 0)
+
+    def test_delete_drops_both_tiers(self):
+        other_worker = make_cache()
+        self.cache.set('chain_1', 1)
+        other_worker.delete('chain_1')
+        self.cache.clear_l1()
+        self.assertIsNone(self.cache.get('chain_1'))
+
+    def test_cached_values_cannot_be_mutated_by_callers(self):
+        self.cache.set('chain_1', {'ores': [1]})
+        self.cache.get('chain_1')['ores'].append(2)
+        self.assertEqual(self.cache.get('chain_1'), {'ores': [1]})
+
+    def test_get_many_combines_tiers(self):
+        self.cache.set_many({'chain_1': 1, 'chain_2': 2})
+        self.cache.clear_l1()
+        self.cache.get('chain_1')
+
+        self.assertEqual(self.cache.get_many(['chain_1', 'chain_2', 'chain_3']),
+                         {'chain_1': 1, 'chain_2': 2})
+        stats = self.cache.stats()['chain']
+        self.assertEqual((stats['l1_hits'], stats['l2_hits'], stats['misses']), (1, 2, 1))
+
+    def test_versions_are_separate_l1_entries(self):
+        self.cache.set('chain_1', 'v1', version=1)
+        self.cache.set('chain_1', 'v2', version=2)
+        self.assertEqual(self.cache.get('chain_1', version=1), 'v1')
+        self.assertEqual(self.cache.get('chain_1', version=2), 'v2')
+        self.assertIsNone(self.cache.get('chain_1', version=3))
+
+        self.cache.delete('chain_1', version=2)
+        self.assertEqual(self.cache.get('chain_1', version=1), 'v1')
+        self.assertIsNone(self.cache.get('chain_1', version=2))
+
+    def test_l1_can_be_disabled(self):
+        cache = make_cache(L1_MAX_ENTRIES=0)
+        cache.set('chain_1', 1)
+        self.assertEqual(cache.get('chain_1'), 1)
+        self.assertEqual(cache.stats()['chain']['l2_hits'], 1)
+
+
+class CacheStatsViewTest(TestCase):
+
+    def test_requires_staff(self):
+        response = self.client.get(reverse('cache_stats'))
+        self.assertEqual(response.status_code, 302)
+
+    def test_reports_default_cache_stats(self):
+        staff = get_user_model().objects.create_user('staff', password='pw', is_staff=True)
+        self.client.force_login(staff)
+        response = self.client.get(reverse('cache_stats'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['backend'], 'TieredCache')
+        self.assertIn('_l1', response.json()['stats'])
+
+
+class DatabasePoolTest(TestCase):
+
+    def test_pool_settings_per_mode(self):
+        self.assertEqual(pool_settings('none')['CONN_MAX_AGE'], 0)
+
+        persistent = pool_settings('persistent', conn_max_age=30)
+        self.assertEqual((persistent['CONN_MAX_AGE'], persistent['CONN_HEALTH_CHECKS']), (30, True))
+
+        pooled = pool_settings('pool', min_size=1, max_size=8, timeout=2)
+        self.assertEqual(pooled['CONN_MAX_AGE'], 0)
+        self.assertEqual(pooled['OPTIONS']['pool'],
+                         {'min_size': 1, 'max_size': 8, 'timeout': 2, 'max_idle': 300.0})
+
+    def test_rejects_bad_configuration(self):
+        with self.assertRaises(ValueError):
+            pool_settings('pgbouncer')
+        with self.assertRaises(ValueError):
+            pool_settings('pool', min_size=5, max_size=2)
+
+    def test_stats_endpoint_requires_staff(self):
+        self.assertEqual(self.client.get(reverse('db_stats')).status_code, 302)
+
+        staff = get_user_model().objects.create_user('staff', password='pw', is_staff=True)
+        self.client.force_login(staff)
+        stats = self.client.get(reverse('db_stats')).json()
+        self.assertEqual((stats['vendor'], stats['mode']), ('sqlite', 'none'))
+        self.assertTrue(stats['connected'])
+
+
+class KeysetPaginationTest(TestCase):
+    """Cursor pagination over (sort field, pk), using ores with tied masses."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.ores = [
+            Ore.objects.create(name=f'Keyset Ore {i:02d}', mass=float(i % 3))
+            for i in range(12)
+        ]
+
+    def walk(self, queryset, per_page=5):
+        paginator = KeysetPaginator(queryset, per_page)
+        page = paginator.page()
+        pages = [page]
+        while page.has_next():
+            page = paginator.page(page.next_cursor)
+            pages.append(page)
+        return paginator, pages
+
+    def test_forward_walk_matches_offset_order(self):
+        queryset = Ore.objects.order_by('-mass')
+        _, pages = self.walk(queryset)
+
+        walked = [ore.pk for page in pages for ore in page]
+        expected = list(queryset.order_by('-mass', '-pk').values_list('pk', flat=True))
+        self.assertEqual(walked, expected)
+        self.assertEqual([len(page) for page in pages], [5, 5, 2])
+        self.assertFalse(pages[0].has_previous())
+        self.assertTrue(pages[-1].has_previous())
+
+    def test_previous_cursor_returns_preceding_page(self):
+        paginator, pages = self.walk(Ore.objects.order_by('mass'))
+        previous = paginator.page(pages[2].previous_cursor)
+        self.assertEqual(list(previous), list(pages[1]))
+        self.assertTrue(previous.has_next())
+
+    def test_last_cursor_returns_final_rows(self):
+        paginator, pages = self.walk(Ore.objects.order_by('name'))
+        last = paginator.page(paginator.last_cursor)
+        self.assertEqual(list(last), list(Ore.objects.order_by('name'))[-5:])
+        self.assertFalse(last.has_next())
+
+    def test_datetime_sort_field_round_trips(self):
+        _, pages = self.walk(Ore.objects.order_by('created_at'))
+        self.assertEqual(sum(len(page) for page in pages), 12)
+
+    def test_legacy_page_number(self):
+        paginator = KeysetPaginator(Ore.objects.order_by('name'), 5)
+        page = paginator.page_number(3)
+        self.assertEqual([ore.name for ore in page], ['Keyset Ore 10', 'Keyset Ore 11'])
+        self.assertTrue(page.has_previous())
+        self.assertFalse(page.has_next())
+
+    def test_empty_queryset_counts_zero(self):
+        self.assertEqual(approximate_count(Ore.objects.none()), 0)
+
+    def test_invalid_cursor_is_404(self):
+        response = self.client.get(reverse('ores:ore_list'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_list_views_follow_cursor_links_without_counting(self):
+        Ore.objects.bulk_create(
+            Ore(name=f'Extra Ore {i:02d}', mass=float(i)) for i in range(20)
+        )
+        response = self.client.get(reverse('ores:ore_list'), {'sort_by': 'mass'})
+        next_cursor = response.context['page_obj'].next_cursor
+        self.assertIn('sort_by=mass', response.context['query_string'])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse('ores:ore_list'), {'sort_by': 'mass', 'cursor': next_cursor}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context['page_obj'].has_previous())
+        # The approximate total was cached by the first page
+        self.assertFalse(any('COUNT(' in query['sql'] for query in queries.captured_queries))
+
+        for name in ('components:component_list', 'blocks:block_list'):
+            with self.subTest(view=name):
+                self.assertEqual(self.client.get(reverse(name)).status_code, 200)
+
+
+class BenchmarkRunnerTest(TestCase):
+    """Benchmarks over a tiny generated catalog (numbers are meaningless, shape is not)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command('generate_catalog', '--ores', '4', '--components', '8', '--blocks', '12',
+                     stdout=io.StringIO())
+
+    def test_percentile_interpolates(self):
+        values = [float(v) for v in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 50.5)
+        self.assertAlmostEqual(percentile(values, 99), 99.01)
+        self.assertEqual(percentile([7.0], 95), 7.0)
+
+    def test_every_route_is_measured(self):
+        report = BenchmarkRunner(iterations=3, warmup=1).run()
+        self.assertEqual([row['route'] for row in report['results']],
+                         [route.name for route in ROUTES])
+        for row in report['results']:
+            with self.subTest(route=row['route']):
+                self.assertEqual(row['statuses'], {'200': 3})
+                self.assertLessEqual(row['p50_ms'], row['p95_ms'])
+                self.assertLessEqual(row['p95_ms'], row['p99_ms'])
+                self.assertIsNotNone(row['queries_max'])
+                self.assertGreater(row['mean_bytes'], 0)
+        self.assertEqual(report['meta']['catalog']['blocks'], 12)
+
+    def test_markdown_compares_with_baseline(self):
+        routes = [route for route in ROUTES if route.name == 'block detail']
+        report = BenchmarkRunner(iterations=2, warmup=0, routes=routes).run()
+        baseline = json.loads(json.dumps(report))
+        baseline['results'][0]['p95_ms'] = report['results'][0]['p95_ms'] / 2
+        markdown = to_markdown(report, baseline)
+        self.assertIn('| block detail |', markdown)
+        self.assertIn('+100%', markdown)
+
+    def test_command_writes_reports(self):
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, 'bench.json')
+            markdown_path = os.path.join(directory, 'bench.md')
+            call_command('benchmark_views', '--iterations', '2', '--warmup', '0',
+                         '--route', 'ore list', '--json', json_path,
+                         '--markdown', markdown_path, stdout=io.StringIO())
+            with open(json_path) as f:
+                routes = [row['route'] for row in json.load(f)['results']]
+            self.assertEqual(routes, ['ore list', 'ore list search'])
+            with open(markdown_path) as f:
+                self.assertIn('p99 ms', f.read())
+
+
+def parse_server_timing(header):
+    """{metric: {'dur': float, 'desc': str}} from a Server-Timing header."""
+    metrics = {}
+    for entry in header.split(', '):
+        name, *params = entry.split(';')
+        values = dict(param.split('=', 1) for param in params)
+        metrics[name] = {
+            'dur': float(values['dur']) if 'dur' in values else None,
+            'desc': values.get('desc', '').strip('"'),
+        }
+    return metrics
+
+
+@override_settings(SERVER_TIMING=True)
+class ProfilingMiddlewareTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command('generate_catalog', '--ores', '3', '--components', '4', '--blocks', '2',
+                     stdout=io.StringIO())
+        cls.block = Block.objects.order_by('pk').first()
+
+    def test_block_detail_reports_every_metric(self):
+        url = reverse('blocks:block_detail', args=[self.block.pk])
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        metrics = parse_server_timing(response['Server-Timing'])
+
+        self.assertEqual(set(metrics), {'total', 'db', 'cache', 'tpl', 'chain'})
+        self.assertEqual(metrics['db']['desc'], f'{len(queries.captured_queries)} queries')
+        self.assertIn('misses', metrics['cache']['desc'])
+        self.assertGreater(metrics['total']['dur'], 0)
+        self.assertLessEqual(metrics['tpl']['dur'], metrics['total']['dur'])
+
+        # Second view: the resource chain now comes from the cache
+        metrics = parse_server_timing(self.client.get(url)['Server-Timing'])
+        self.assertFalse(metrics['cache']['desc'].startswith('0 L1 hits / 0 L2 hits'))
+
+    def test_json_responses_have_no_template_metric(self):
+        response = self.client.get(reverse('blocks:catalog_autocomplete'), {'kind': 'ore', 'q': 'syn'})
+        self.assertNotIn('tpl', parse_server_timing(response['Server-Timing']))
+
+    @override_settings(SERVER_TIMING=False, PROFILING_LOG_SAMPLE_RATE=1)
+    def test_sampled_requests_are_logged_as_json(self):
+        with self.assertLogs('se2CalcProject.profiling', 'INFO') as logs:
+            response = self.client.get(reverse('ores:ore_list'))
+        self.assertNotIn('Server-Timing', response)
+        line = json.loads(logs.records[0].getMessage())
+        self.assertEqual((line['path'], line['status']), ('/ores/', 200))
+        self.assertIn('tpl_ms', line)
+        self.assertGreater(line['queries'], 0)
+
+    @override_settings(PROFILING_LOG_SLOW_MS=0.001)
+    def test_slow_requests_are_always_logged(self):
+        with self.assertLogs('se2CalcProject.profiling', 'INFO'):
+            self.client.get(reverse('ores:ore_list'))
+
+    @override_settings(SERVER_TIMING=False, PROFILING_LOG_SAMPLE_RATE=0, PROFILING_LOG_SLOW_MS=0)
+    def test_disabled_middleware_is_skipped(self):
+        response = self.client.get(reverse('ores:ore_list'))
+        self.assertNotIn('Server-Timing', response)
+
+    def test_header_is_opt_in(self):
+        with self.settings():
+            del settings.SERVER_TIMING
+            response = self.client.get(reverse('ores:ore_list'))
+        self.assertNotIn('Server-Timing', response)
+
+    def test_timer_outside_a_request_is_a_no_op(self):
+        with timer('chain'):
+            pass
+        self.assertIsNone(current_profile())
+
+
+class ProductionServerTest(TestCase):
+
+    def test_warm_up_compiles_the_catalog(self):
+        Ore.objects.create(name='Warm Ore', mass=1.0)
+        timings = warm_up()
+        self.assertEqual(set(timings), {'db', 'cache', 'catalog', 'templates'})
+        with CaptureQueriesContext(connection) as queries:
+            graph = load_recipe_graph()
+        self.assertEqual(len(queries.captured_queries), 0)
+        self.assertEqual(graph.name_index('ore').search('warm')[0]['name'], 'Warm Ore')
+
+    def test_workers_follow_cpu_count_unless_set(self):
+        self.addCleanup(importlib.reload, gunicorn_conf)
+        with mock.patch.dict(os.environ, {'WEB_CONCURRENCY': '', 'GUNICORN_THREADS': '1'}), \
+                mock.patch.object(os, 'sched_getaffinity', return_value={0, 1, 2}, create=True):
+            conf = importlib.reload(gunicorn_conf)
+        self.assertEqual((conf.workers, conf.worker_class), (7, 'sync'))
+
+        with mock.patch.dict(os.environ, {'WEB_CONCURRENCY': '3', 'GUNICORN_THREADS': '4'}):
+            conf = importlib.reload(gunicorn_conf)
+        self.assertEqual((conf.workers, conf.threads, conf.worker_class), (3, 4, 'gthread'))
+        self.assertTrue(conf.preload_app)
+
+    def test_forwarded_headers_are_only_trusted_locally(self):
+        self.addCleanup(importlib.reload, gunicorn_conf)
+        with mock.patch.dict(os.environ):
+            os.environ.pop('FORWARDED_ALLOW_IPS', None)
+            conf = importlib.reload(gunicorn_conf)
+        self.assertEqual(conf.forwarded_allow_ips, '127.0.0.1,::1')
+
+
+class PageCacheTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.ore = Ore.objects.create(name='Cached Ore', mass=1.0)
+
+    def get(self, url, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        return response, len(queries.captured_queries)
+
+    def test_hit_skips_the_view(self):
+        url = reverse('ores:ore_detail', args=[self.ore.pk])
+        first, _ = self.get(url)
+        second, queries = self.get(url)
+
+        self.assertEqual((first['X-Page-Cache'], second['X-Page-Cache']), ('miss', 'hit'))
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['Content-Type'], first['Content-Type'])
+        # Only the catalog version, read from the cache
+        self.assertEqual(queries, 0)
+
+    def test_catalog_write_retires_cached_pages(self):
+        url = reverse('ores:ore_list')
+        self.get(url)
+        Ore.objects.create(name='Fresh Ore', mass=2.0)
+        response, _ = self.get(url)
+        self.assertEqual(response['X-Page-Cache'], 'miss')
+        self.assertContains(response, 'Fresh Ore')
+
+    def test_key_uses_the_normalized_query_string(self):
+        url = reverse('ores:ore_list')
+        self.get(url, search='cached', sort_by='name', utm_source='feed')
+        self.assertEqual(self.get(url, search='cached', sort_by='name')[0]['X-Page-Cache'], 'miss')
+        self.assertEqual(self.get(url, sort_by='name', search='cached')[0]['X-Page-Cache'], 'hit')
+        self.assertEqual(self.get(url, search='other')[0]['X-Page-Cache'], 'miss')
+
+        query = QueryDict('sort=name&q=x&page=&q=y&fbclid=1')
+        self.assertEqual(normalized_query_string(query), ('q=x&q=y&sort=name', True))
+
+    def test_logged_in_users_and_pending_messages_bypass(self):
+        url = reverse('ores:ore_detail', args=[self.ore.pk])
+        self.get(url)
+
+        staff = get_user_model().objects.create_user('staff', password='pw', is_staff=True)
+        self.client.force_login(staff)
+        self.assertNotIn('X-Page-Cache', self.get(url)[0])
+        self.client.logout()
+
+        # Creating an ore queues a success message for its detail page
+        response = self.client.post(reverse('ores:ore_create'),
+                                    {'name': 'Flash Ore', 'description': '', 'mass': '1.5'})
+        detail = response['Location']
+        response, _ = self.get(detail)
+        self.assertNotIn('X-Page-Cache', response)
+        self.assertContains(response, 'created successfully')
+        # Message shown once: the next view is cached without it
+        self.assertEqual(self.get(detail)[0]['X-Page-Cache'], 'miss')
+        response, _ = self.get(detail)
+        self.assertEqual(response['X-Page-Cache'], 'hit')
+        self.assertNotContains(response, 'created successfully')
+
+    def test_pages_with_visitor_cookies_are_not_stored(self):
+        def page(request, source):
+            return TemplateResponse(request, engines['django'].from_string(source))
+
+        def edits_session(request):
+            request.session['seen'] = True
+            return page(request, 'hello')
+
+        views = {
+            'plain': lambda request: page(request, 'hello'),
+            'csrf': lambda request: page(request, '<form>{% csrf_token %}</form>'),
+            'session': edits_session,
+        }
+        results = {}
+        for name, view in views.items():
+            wrapped = cache_anonymous_page(view)
+            for _ in range(2):
+                request = RequestFactory().get(f'/{name}/')
+                request.user, request.session = AnonymousUser(), SessionStore()
+                response = wrapped(request)
+                if hasattr(response, 'render'):
+                    response.render()
+            results[name] = response['X-Page-Cache']
+        self.assertEqual(results, {'plain': 'hit', 'csrf': 'miss', 'session': 'miss'})
+
+    @override_settings(PAGE_CACHE_TIMEOUT=0)
+    def test_disabled(self):
+        url = reverse('ores:ore_list')
+        self.get(url)
+        self.assertNotIn('X-Page-Cache', self.get(url)[0])
+
+
+class ConditionalResponseTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.ore = Ore.objects.create(name='Polled Ore', mass=1.0)
+
+    def test_json_endpoints_revalidate(self):
+        url = reverse('ores:ore_used_by', args=[self.ore.pk])
+        etag = self.client.get(url)['ETag']
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(queries.captured_queries), 0)
+
+        url = reverse('blocks:catalog_autocomplete')
+        etag = self.client.get(url, {'kind': 'ore', 'q': 'pol'})['ETag']
+        response = self.client.get(url, {'kind': 'ore', 'q': 'pol'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_pending_messages_get_no_validators(self):
+        response = self.client.post(reverse('ores:ore_create'),
+                                    {'name': 'Flash Ore', 'description': '', 'mass': '1.5'})
+        response = self.client.get(response['Location'], HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('ETag', response)
+        self.assertContains(response, 'created successfully')
+
+    def test_list_pages_are_not_conditional(self):
+        self.assertNotIn('ETag', self.client.get(reverse('ores:ore_list')))
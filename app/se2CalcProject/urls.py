@@ -1,17 +1,37 @@
 from django.contrib import admin
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.cache import caches
 from django.http import JsonResponse
 from django.urls import path, include
 from django.views.generic import TemplateView
 
+from se2CalcProject.database import pool_stats
+
 
 def health_check(_request):
     """Lightweight health endpoint used by Docker/Nginx checks."""
     return JsonResponse({"status": "ok"})
 
+
+@staff_member_required
+def cache_stats(_request):
+    """Per-prefix hit/miss/eviction counters of this worker's cache."""
+    cache = caches['default']
+    stats = cache.stats() if hasattr(cache, 'stats') else {}
+    return JsonResponse({"backend": type(cache).__name__, "stats": stats})
+
+
+@staff_member_required
+def db_stats(_request):
+    """Connection reuse mode and pool saturation of this worker."""
+    return JsonResponse(pool_stats())
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', TemplateView.as_view(template_name='home.html'), name='home'),
     path('health/', health_check, name='health'),
+    path('health/cache/', cache_stats, name='cache_stats'),
+    path('health/db/', db_stats, name='db_stats'),
     path('ores/', include('ores.urls', namespace='ores')),
     path('components/', include('components.urls', namespace='components')),
     path('blocks/', include('blocks.urls', namespace='blocks')),  # ENH-0000007
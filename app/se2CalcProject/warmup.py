@@ -0,0 +1,67 @@
+"""
+Worker warm-up: pay the first-request costs before serving traffic.
+
+A fresh process opens its database connection, reads the catalog version
+from the shared cache, compiles the recipe graph and its typeahead indexes,
+and compiles templates on its first requests. ``warm_up()`` does all of that
+up front; the gunicorn config (``se2CalcProject.gunicorn_conf``) calls it in
+the master before forking, so workers inherit the compiled catalog, and again
+in each worker before it accepts connections.
+"""
+import logging
+import time
+
+from django.db import connections
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+
+logger = logging.getLogger(__name__)
+
+# Pages whose templates (and everything they extend/include) are compiled
+TEMPLATES = (
+    'home.html',
+    'ores/ore_list.html',
+    'ores/ore_detail.html',
+    'components/component_list.html',
+    'components/component_detail.html',
+    'blocks/block_list.html',
+    'blocks/block_detail.html',
+)
+
+
+def warm_up():
+    """
+    Open the DB connection and fill the process-local caches.
+
+    Returns:
+        dict: milliseconds spent per step ('db', 'cache', 'catalog', 'templates')
+    """
+    from blocks.autocomplete import KINDS
+    from blocks.catalog_version import get_catalog_version
+    from blocks.recipe_graph import load_recipe_graph
+
+    timings = {}
+
+    def step(name, func):
+        start = time.perf_counter()
+        func()
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    def catalog():
+        graph = load_recipe_graph()
+        for kind in KINDS:
+            graph.name_index(kind)
+
+    def templates():
+        # With DEBUG off the cached loader keeps these compiled
+        for name in TEMPLATES:
+            try:
+                get_template(name)
+            except TemplateDoesNotExist:
+                logger.warning(f"Warm-up: template {name} not found")
+
+    step('db', connections['default'].ensure_connection)
+    step('cache', get_catalog_version)
+    step('catalog', catalog)
+    step('templates', templates)
+    return timings
@@ -7,8 +7,12 @@
  * 
  * Pattern adapted from material-selector.js (ENH-0000006)
  * 
- * @version 1.0
- * @date 2026-01-25
+ * Components are picked through a typeahead backed by
+ * /blocks/api/autocomplete/; only the already-selected components are
+ * rendered into the page (#selected-components-data).
+ * 
+ * @version 1.1
+ * @date 2026-10-16
  */
 
 (function() {
@@ -16,6 +20,8 @@
     
     let componentRowCount = 0;
     const componentsData = {}; // Stores {component_id: quantity}
+    const componentNames = {}; // Stores {component_id: name} for known components
+    const SUGGESTION_DELAY_MS = 150;
     
     /**
      * Initialize the component selector on page load
@@ -23,10 +29,16 @@
     function initComponentSelector() {
         console.log('Initializing block component selector...');
         
+        // Names of the components already on the block
+        const selected = document.getElementById('selected-components-data');
+        if (selected) {
+            Object.assign(componentNames, JSON.parse(selected.textContent));
+        }
+        
         // Set up add component button
         const addButton = document.getElementById('add-component-btn');
         if (addButton) {
-            addButton.addEventListener('click', addComponentRow);
+            addButton.addEventListener('click', () => addComponentRow());
         }
         
         // Pre-populate existing components (for update forms)
@@ -71,16 +83,21 @@
         const row = document.createElement('div');
         row.className = 'row mb-3 component-row';
         row.id = rowId;
+        if (componentId) {
+            row.dataset.componentId = componentId;
+        }
         row.innerHTML = `
             <div class="col-md-6">
                 <label for="component-select-${componentRowCount}" class="form-label">Component</label>
-                <select class="form-select component-select" 
-                        id="component-select-${componentRowCount}" 
-                        data-row-id="${rowId}" 
-                        required>
-                    <option value="">Select a component...</option>
-                    ${generateComponentOptions(componentId)}
-                </select>
+                <input type="search" 
+                       class="form-control component-select" 
+                       id="component-select-${componentRowCount}" 
+                       data-row-id="${rowId}" 
+                       list="component-options-${componentRowCount}" 
+                       placeholder="Start typing a component name..." 
+                       autocomplete="off" 
+                       required>
+                <datalist id="component-options-${componentRowCount}"></datalist>
             </div>
             <div class="col-md-4">
                 <label for="quantity-${componentRowCount}" class="form-label">Quantity</label>
@@ -109,7 +126,17 @@
         const quantityInput = row.querySelector('.quantity-input');
         const removeBtn = row.querySelector('.remove-component-btn');
         
-        select.addEventListener('change', updateComponentsData);
+        if (componentId) {
+            select.value = componentNames[componentId] || componentId;
+        }
+        
+        let suggestionTimer = null;
+        select.addEventListener('input', () => {
+            resolveComponent(row, select);
+            clearTimeout(suggestionTimer);
+            suggestionTimer = setTimeout(() => fetchSuggestions(select), SUGGESTION_DELAY_MS);
+        });
+        select.addEventListener('change', () => resolveComponent(row, select));
         quantityInput.addEventListener('input', updateComponentsData);
         removeBtn.addEventListener('click', () => removeComponentRow(rowId));
         
@@ -120,26 +147,51 @@
     }
     
     /**
-     * Generate component option elements
+     * Fetch typeahead suggestions for a component input
      * 
-     * @param {string} selectedId - Component UUID to pre-select (optional)
-     * @returns {string} HTML options string
+     * @param {HTMLInputElement} input - Component name input
      */
-    function generateComponentOptions(selectedId = null) {
-        const select = document.querySelector('#component-template-data');
-        if (!select) {
-            console.error('Component template data not found');
-            return '';
+    function fetchSuggestions(input) {
+        const container = document.getElementById('components-container');
+        const url = container && container.dataset.autocompleteUrl;
+        const query = input.value.trim();
+        if (!url || !query) {
+            return;
         }
         
-        const options = Array.from(select.querySelectorAll('option'))
-            .filter(opt => opt.value !== '')
-            .map(opt => {
-                const selected = opt.value === selectedId ? 'selected' : '';
-                return `<option value="${opt.value}" ${selected}>${opt.text}</option>`;
-            });
-        
-        return options.join('');
+        const params = new URLSearchParams({kind: 'component', q: query});
+        fetch(`${url}?${params}`)
+            .then(response => response.json())
+            .then(data => {
+                const datalist = document.getElementById(input.getAttribute('list'));
+                datalist.innerHTML = '';
+                data.results.forEach(result => {
+                    componentNames[result.id] = result.name;
+                    const option = document.createElement('option');
+                    option.value = result.name;
+                    datalist.appendChild(option);
+                });
+                resolveComponent(input.closest('.component-row'), input);
+            })
+            .catch(error => console.error('Error fetching component suggestions:', error));
+    }
+    
+    /**
+     * Map the typed name back to a component UUID
+     * 
+     * @param {HTMLElement} row - Component row
+     * @param {HTMLInputElement} input - Component name input
+     */
+    function resolveComponent(row, input) {
+        const name = input.value.trim().toLowerCase();
+        const match = Object.entries(componentNames)
+            .find(([, componentName]) => componentName.toLowerCase() === name);
+        if (match) {
+            row.dataset.componentId = match[0];
+        } else {
+            delete row.dataset.componentId;
+        }
+        updateComponentsData();
     }
     
     /**
@@ -150,9 +202,8 @@
     function removeComponentRow(rowId) {
         const row = document.getElementById(rowId);
         if (row) {
-            const select = row.querySelector('.component-select');
-            if (select && select.value) {
-                delete componentsData[select.value];
+            if (row.dataset.componentId) {
+                delete componentsData[row.dataset.componentId];
             }
             
             row.remove();
@@ -173,11 +224,10 @@
         let isValid = true;
         
         rows.forEach(row => {
-            const select = row.querySelector('.component-select');
             const quantityInput = row.querySelector('.quantity-input');
             
-            if (select && quantityInput) {
-                const componentId = select.value;
+            if (quantityInput) {
+                const componentId = row.dataset.componentId;
                 const quantity = parseInt(quantityInput.value, 10);
                 
                 if (componentId && quantity > 0) {
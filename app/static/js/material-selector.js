@@ -4,14 +4,20 @@
  * Provides dynamic UI for selecting materials (ores) and quantities.
  * Converts form data to JSON format for Django JSONField storage.
  * 
+ * Ores are picked through a typeahead backed by /blocks/api/autocomplete/;
+ * the page only carries the names of the ores already selected.
+ * 
  * ENH-0000006: Components Views & Templates
  */
 
+const ORE_SUGGESTION_DELAY_MS = 150;
+
 class MaterialSelector {
-    constructor(containerId, ores, existingMaterials = {}) {
+    constructor(containerId, ores, existingMaterials = {}, autocompleteUrl = null) {
         this.container = document.getElementById(containerId);
-        this.ores = ores; // Array of {id: uuid, name: string}
+        this.ores = {...ores}; // {uuid: name} for selected and suggested ores
         this.existingMaterials = existingMaterials;
+        this.autocompleteUrl = autocompleteUrl;
         this.rowCount = 0;
         
         if (!this.container) {
@@ -82,16 +88,19 @@ class MaterialSelector {
         
         const row = document.createElement('tr');
         row.id = rowId;
+        if (oreId) {
+            row.dataset.oreId = oreId;
+        }
         row.innerHTML = `
             <td>
-                <select class="form-select material-ore-select" data-row-id="${rowId}" required>
-                    <option value="">-- Select Ore --</option>
-                    ${this.ores.map(ore => 
-                        `<option value="${ore.id}" ${ore.id === oreId ? 'selected' : ''}>
-                            ${ore.name}
-                        </option>`
-                    ).join('')}
-                </select>
+                <input type="search" 
+                       class="form-control material-ore-select" 
+                       data-row-id="${rowId}" 
+                       list="${rowId}-options" 
+                       placeholder="Start typing an ore name..." 
+                       autocomplete="off" 
+                       required>
+                <datalist id="${rowId}-options"></datalist>
             </td>
             <td>
                 <input type="number" 
@@ -114,6 +123,10 @@ class MaterialSelector {
         
         tbody.appendChild(row);
         
+        if (oreId) {
+            row.querySelector('.material-ore-select').value = this.ores[oreId] || oreId;
+        }
+        
         // Add validation listeners
         this.attachValidation(rowId);
     }
@@ -140,12 +153,54 @@ class MaterialSelector {
         const select = row.querySelector('.material-ore-select');
         const input = row.querySelector('.material-quantity-input');
         
-        // Validate on change
-        select.addEventListener('change', () => this.validateForm());
+        // Suggest ores while typing; validate once the name resolves
+        let suggestionTimer = null;
+        select.addEventListener('input', () => {
+            this.resolveOre(row, select);
+            clearTimeout(suggestionTimer);
+            suggestionTimer = setTimeout(
+                () => this.fetchSuggestions(row, select), ORE_SUGGESTION_DELAY_MS
+            );
+        });
+        select.addEventListener('change', () => this.resolveOre(row, select));
         input.addEventListener('input', () => this.validateForm());
         input.addEventListener('blur', () => this.validateQuantity(input));
     }
     
+    fetchSuggestions(row, input) {
+        const query = input.value.trim();
+        if (!this.autocompleteUrl || !query) return;
+        
+        const params = new URLSearchParams({kind: 'ore', q: query});
+        fetch(`${this.autocompleteUrl}?${params}`)
+            .then(response => response.json())
+            .then(data => {
+                const datalist = document.getElementById(input.getAttribute('list'));
+                datalist.innerHTML = '';
+                data.results.forEach(result => {
+                    this.ores[result.id] = result.name;
+                    const option = document.createElement('option');
+                    option.value = result.name;
+                    datalist.appendChild(option);
+                });
+                this.resolveOre(row, input);
+            })
+            .catch(error => console.error('Error fetching ore suggestions:', error));
+    }
+    
+    resolveOre(row, input) {
+        // Map the typed name back to an ore UUID
+        const name = input.value.trim().toLowerCase();
+        const match = Object.entries(this.ores)
+            .find(([, oreName]) => oreName.toLowerCase() === name);
+        if (match) {
+            row.dataset.oreId = match[0];
+        } else {
+            delete row.dataset.oreId;
+        }
+        this.validateForm();
+    }
+    
     validateQuantity(input) {
         const value = parseFloat(input.value);
         
@@ -170,18 +225,19 @@ class MaterialSelector {
             const input = row.querySelector('.material-quantity-input');
             
             // Check if ore is selected
-            if (!select.value) {
+            const oreId = row.dataset.oreId;
+            if (!oreId) {
                 select.classList.add('is-invalid');
                 isValid = false;
             } else {
                 select.classList.remove('is-invalid');
                 
                 // Check for duplicate ores
-                if (seenOres.has(select.value)) {
+                if (seenOres.has(oreId)) {
                     select.classList.add('is-invalid');
                     isValid = false;
                 } else {
-                    seenOres.add(select.value);
+                    seenOres.add(oreId);
                 }
             }
             
@@ -211,11 +267,10 @@ class MaterialSelector {
         const materials = {};
         
         rows.forEach(row => {
-            const select = row.querySelector('.material-ore-select');
             const input = row.querySelector('.material-quantity-input');
+            const oreId = row.dataset.oreId;
             
-            if (select.value && input.value) {
-                const oreId = select.value;
+            if (oreId && input.value) {
                 const quantity = parseFloat(input.value);
                 
                 if (!isNaN(quantity) && quantity > 0) {
@@ -0,0 +1,28 @@
+#!/bin/sh
+# Container entry point for SE2 Calculator
+#
+# SERVER_MODE selects how Django is served:
+#   development (default) - manage.py runserver with auto-reload
+#   production            - gunicorn, preloaded and warmed up
+#                           (see app/se2CalcProject/gunicorn_conf.py)
+set -e
+
+# The Django project (manage.py) lives in app/
+cd /app/app
+
+python manage.py migrate --noinput
+
+case "${SERVER_MODE:-development}" in
+    production)
+        python manage.py collectstatic --noinput
+        # exec: gunicorn becomes PID 1 and receives HUP/TERM from Docker
+        exec gunicorn -c python:se2CalcProject.gunicorn_conf se2CalcProject.wsgi:application
+        ;;
+    development)
+        exec python manage.py runserver 0.0.0.0:8000
+        ;;
+    *)
+        echo "Unknown SERVER_MODE '${SERVER_MODE}' (expected development or production)" >&2
+        exit 1
+        ;;
+esac
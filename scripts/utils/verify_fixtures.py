@@ -12,9 +12,22 @@ Usage:
     uv run python scripts/verify_fixtures.py
 """
 import json
+import os
 import re
+import sys
 from pathlib import Path
 
+import django
+
+# Reuse the app's reference validators (no database access needed: they are
+# given the fixture ID sets directly).
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'app'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'se2CalcProject.settings')
+django.setup()
+
+from blocks.validators import validate_components_many  # noqa: E402
+from components.validators import validate_materials_many  # noqa: E402
+
 # UUIDv7 regex pattern
 UUID_PATTERN = re.compile(
     r'^[0-9a-f]{8}-[0-9a-f]{4}-7[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
@@ -93,12 +106,12 @@ def verify_fixtures():
     
     # Verify component material references
     invalid_material_refs = []
-    for comp in components:
-        comp_name = comp['fields']['name']
-        materials = comp['fields'].get('materials', {})
-        for ore_id in materials.keys():
-            if ore_id not in ore_uuids:
-                invalid_material_refs.append(f"{comp_name} → {ore_id}")
+    material_results = validate_materials_many(
+        (comp['fields'].get('materials', {}) for comp in components),
+        known_ids=ore_uuids,
+    )
+    for comp, (is_valid, comp_errors) in zip(components, material_results):
+        invalid_material_refs.extend(f"{comp['fields']['name']}: {e}" for e in comp_errors)
     
     if invalid_material_refs:
         errors.append(f"❌ Invalid ore references in components: {', '.join(invalid_material_refs[:3])}")
@@ -107,19 +120,12 @@ def verify_fixtures():
     
     # Verify block component references
     invalid_component_refs = []
-    for block in blocks:
-        block_name = block['fields']['name']
-        components_list = block['fields'].get('components', [])
-        for comp_ref in components_list:
-            comp_id = comp_ref.get('component_id')
-            if comp_id not in component_uuids:
-                invalid_component_refs.append(f"{block_name} → {comp_id}")
-            
-            # Verify required fields
-            if 'component_name' not in comp_ref:
-                invalid_component_refs.append(f"{block_name}: missing component_name")
-            if 'quantity' not in comp_ref:
-                invalid_component_refs.append(f"{block_name}: missing quantity")
+    component_results = validate_components_many(
+        (block['fields'].get('components', {}) for block in blocks),
+        known_ids=component_uuids,
+    )
+    for block, (is_valid, block_errors) in zip(blocks, component_results):
+        invalid_component_refs.extend(f"{block['fields']['name']}: {e}" for e in block_errors)
     
     if invalid_component_refs:
         errors.append(f"❌ Invalid component references in blocks: {', '.join(invalid_component_refs[:3])}")
@@ -144,8 +150,8 @@ def verify_fixtures():
     for block in blocks:
         if placeholder_pattern.search(block['pk']):
             placeholders_found.append(f"block: {block['fields']['name']}")
-        for comp_ref in block['fields'].get('components', []):
-            if placeholder_pattern.search(comp_ref.get('component_id', '')):
+        for comp_id in block['fields'].get('components', {}).keys():
+            if placeholder_pattern.search(comp_id):
                 placeholders_found.append(f"block component: {block['fields']['name']}")
     
     if placeholders_found:
@@ -167,6 +173,5 @@ def verify_fixtures():
         return True
 
 if __name__ == '__main__':
-    import sys
     success = verify_fixtures()
     sys.exit(0 if success else 1)
@@ -5,6 +5,9 @@ Performance test script for Blocks views.
 Tests the number of database queries executed by different views
 to identify N+1 query problems and optimization opportunities.
 
+Enforced per-page budgets for every view (including admin) live in
+``app/se2CalcProject/test_budgets.py``; this script only prints counts.
+
 Usage:
     uv run python scripts/tests/performance/test_blocks_queries.py
 """
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+"""
+Benchmark: batch block → ore expansion.
+
+Compares three ways of totalling a station-sized build order:
+
+1. The original per-row ORM walk from ``BlockDetailView._calculate_resource_chain``
+   (one ``Component.objects.get`` per component, one ``Ore.objects.get`` per material)
+2. Summing ``RecipeGraph.expand`` dicts line by line
+3. The sparse bill-of-materials matrix product (``blocks.calculators``)
+
+Usage (from app/):
+    uv run pytest ../tests/performance/test_bom_benchmark.py -s
+"""
+import os
+import random
+import sys
+import time
+import django
+import pytest
+
+# Setup Django environment
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../app')))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'se2CalcProject.settings')
+django.setup()
+
+from blocks.calculators import calculate_required_components, calculate_required_ores
+from blocks.catalog_version import bump_catalog_version
+from blocks.models import Block
+from blocks.recipe_graph import get_recipe_graph
+from components.models import Component
+from ores.models import Ore
+
+ORE_COUNT = 20
+COMPONENT_COUNT = 200
+BLOCK_COUNT = 500
+ORDER_LINES = 5000
+ORM_SAMPLE_LINES = 100
+
+
+@pytest.fixture
+def catalog(db):
+    """Bulk-create a synthetic catalog (bypasses per-row save validation)."""
+    rng = random.Random(42)
+    ores = Ore.objects.bulk_create(
+        Ore(name=f"Bench Ore {i}", mass=rng.uniform(0.5, 3.0)) for i in range(ORE_COUNT)
+    )
+    components = Component.objects.bulk_create(
+        Component(
+            name=f"Bench Component {i}",
+            mass=rng.uniform(1, 50),
+            crafting_time=rng.uniform(0.5, 10),
+            fabricator_type=rng.choice(["Assembler", "Refinery", "Survival Kit"]),
+            materials={str(ore.ore_id): rng.randint(1, 30) for ore in rng.sample(ores, 3)},
+        )
+        for i in range(COMPONENT_COUNT)
+    )
+    blocks = Block.objects.bulk_create(
+        Block(
+            name=f"Bench Block {i}",
+            mass=rng.uniform(10, 5000),
+            health=100.0,
+            pcu=1,
+            snap_size=0.5,
+            components={str(c.component_id): rng.randint(1, 40) for c in rng.sample(components, 12)},
+        )
+        for i in range(BLOCK_COUNT)
+    )
+    bump_catalog_version()
+    order = [
+        {"block_id": str(rng.choice(blocks).block_id), "quantity": rng.randint(1, 20)}
+        for _ in range(ORDER_LINES)
+    ]
+    return {"blocks": {str(b.block_id): b for b in blocks}, "order": order}
+
+
+def orm_walk(block_components, quantity, ore_totals):
+    """Per-row ORM walk, as BlockDetailView did before the recipe graph."""
+    for comp_id, comp_qty in block_components.items():
+        component = Component.objects.get(component_id=comp_id)
+        for ore_id, ore_qty in component.materials.items():
+            ore = Ore.objects.get(ore_id=ore_id)
+            key = str(ore.ore_id)
+            ore_totals[key] = ore_totals.get(key, 0) + ore_qty * comp_qty * quantity
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+@pytest.mark.django_db
+def test_bom_benchmark(catalog):
+    """Compare per-line expansion strategies for a 5,000-line build order."""
+    blocks = catalog["blocks"]
+    order = catalog["order"]
+
+    def run_orm(lines):
+        totals = {}
+        for line in lines:
+            orm_walk(blocks[line["block_id"]].components, line["quantity"], totals)
+        return totals
+
+    def run_graph(lines):
+        graph = get_recipe_graph()
+        totals = {}
+        for line in lines:
+            chain = graph.expand_block(line["block_id"])
+            for ore_id, ore in chain["ores"].items():
+                totals[ore_id] = totals.get(ore_id, 0) + ore["quantity"] * line["quantity"]
+        return totals
+
+    def run_bom(lines):
+        return calculate_required_ores(calculate_required_components(lines))
+
+    # Warm the graph and matrices so timings measure expansion, not compilation
+    run_bom(order[:1])
+
+    orm_totals, orm_time = timed(run_orm, order[:ORM_SAMPLE_LINES])
+    graph_totals, graph_time = timed(run_graph, order)
+    bom_totals, bom_time = timed(run_bom, order)
+
+    # All strategies must agree
+    bom_sample = run_bom(order[:ORM_SAMPLE_LINES])
+    for ore_id, quantity in orm_totals.items():
+        assert bom_sample[ore_id] == pytest.approx(quantity)
+    for ore_id, quantity in graph_totals.items():
+        assert bom_totals[ore_id] == pytest.approx(quantity)
+
+    orm_projected = orm_time / ORM_SAMPLE_LINES * ORDER_LINES
+    print(f"\n{ORDER_LINES} lines, {BLOCK_COUNT} blocks, {COMPONENT_COUNT} components, {ORE_COUNT} ores")
+    print(f"  ORM walk (projected): {orm_projected * 1000:10.1f} ms")
+    print(f"  Graph expand loop:    {graph_time * 1000:10.1f} ms")
+    print(f"  BOM matrix product:   {bom_time * 1000:10.1f} ms")
+
+    assert bom_time < graph_time